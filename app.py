@@ -1,39 +1,163 @@
 # Initialize error logging before any other imports
-from utils.error_logger import init_error_logger, capture_exception, capture_message, set_tag, set_context
+from utils.error_logger import init_error_logger, capture_exception, capture_message, set_tag, set_context, error_logger
 
 # Initialize error logging for the main application
 init_error_logger("ai-test-case-generator-main")
 
-from flask import Flask, request, jsonify, send_file, render_template, after_this_request
+from flask import Flask, Response, request, jsonify, send_file, send_from_directory, render_template, g, stream_with_context
 from flask_cors import CORS
-from jira.jira_client import fetch_issue
+from flask_compress import Compress
+from jira.jira_client import fetch_issue, JiraClient
 from azure_integration.azure_client import AzureClient
 from ai.generator import generate_test_case
 from ai.image_generator import generate_test_case_from_image
-from utils.file_handler import save_test_script, save_excel_report, extract_test_type_sections, parse_traditional_format
-from utils.mongo_handler import MongoHandler
+from utils.file_handler import save_test_script, save_excel_report, extract_test_type_sections, parse_traditional_format, create_excel_report
+from utils.email_notifier import send_password_reset_email
+from utils.mongo_handler import MongoHandler, EventQueueFull
+from utils.json_provider import OrjsonProvider, dumps_bytes
+from utils.ttl_cache import TTLCache
+from config import settings
+from openai import OpenAI
+from pymongo import UpdateOne
 import os
-import json
+import orjson
 from datetime import datetime, timedelta
 import math
 import re
+import hashlib
+import secrets
+import shutil
+import tempfile
+import threading
+import time
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import jwt
 from urllib.parse import urlparse
-from threading import Lock
-from functools import wraps
+from functools import wraps, lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
+# Compress JSON/HTML responses (including the streamed admin export); small
+# payloads are left alone since compressing them costs more than it saves
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html', 'text/css', 'application/javascript']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
+
 # JWT configuration
 app.config['JWT_SECRET_KEY'] = os.environ.get('JWT_SECRET_KEY', 'your-secret-key-change-in-production')
 app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(days=30)
 
+# /static files are not content-hashed, so cache them for a bounded time and
+# let ETag/Last-Modified revalidation (304s) cover the rest
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = int(os.environ.get('STATIC_MAX_AGE', 3600))
+# Behind nginx/apache, let the front-end server send file bodies itself
+app.use_x_sendfile = os.environ.get('USE_X_SENDFILE') == '1'
+
 # Add this logging configuration
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Headers that stop browsers and proxies from caching dynamic responses
+NO_CACHE_HEADERS = {
+    "Cache-Control": "no-cache, no-store, must-revalidate, max-age=0",
+    "Pragma": "no-cache",
+    "Expires": "0"
+}
+
+def no_cache(response):
+    """Apply NO_CACHE_HEADERS to a response and return it"""
+    response.headers.update(NO_CACHE_HEADERS)
+    return response
+
+def json_response(payload, status=200):
+    """JSON response encoded straight through orjson, without jsonify's key sorting (for large lists)"""
+    return app.response_class(dumps_bytes(payload), status=status, mimetype='application/json')
+
+def prebuilt_response(payload, status):
+    """Encode a constant payload once; each call wraps the cached bytes in a fresh Response.
+
+    A fresh Response per request is still needed: CORS and the after_request hook set per-request headers.
+    """
+    body = dumps_bytes(payload)
+    return lambda: app.response_class(body, status=status, mimetype='application/json')
+
+# Constant fast-fail responses
+TOKEN_REQUIRED_RESPONSE = prebuilt_response({'success': False, 'message': 'Authorization token required'}, 401)
+INVALID_TOKEN_RESPONSE = prebuilt_response({'success': False, 'message': 'Invalid or expired token'}, 401)
+FORBIDDEN_RESPONSE = prebuilt_response({'success': False, 'message': 'Forbidden'}, 403)
+NO_DATA_RESPONSE = prebuilt_response({'success': False, 'message': 'No data provided'}, 400)
+
+@lru_cache(maxsize=1)
+def get_mongo_handler():
+    """Shared MongoHandler so requests reuse one MongoClient connection pool"""
+    return MongoHandler()
+
+# Worker pool for overlapping independent upstream (Jira/Azure) HTTP calls
+upstream_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='upstream')
+
+# Successful token verifications, reused for up to 30 seconds (never past the token's exp).
+# The short TTL bounds how long a deactivated user or changed role keeps its cached result.
+jwt_verification_cache = TTLCache(maxsize=10000, ttl=30)
+
+def verify_jwt_token_cached(token):
+    """verify_jwt_token with successful results memoized per token"""
+    # Keyed by digest so raw bearer tokens are not kept in memory as dict keys
+    cache_key = hashlib.sha256(token.encode('utf-8')).digest()
+    verification = jwt_verification_cache.get(cache_key)
+    if verification is not None:
+        return verification
+    verification = get_mongo_handler().verify_jwt_token(token)
+    if verification and verification.get('success'):
+        # The signature was just verified, so reading exp without verifying again is safe
+        exp = jwt.decode(token, options={"verify_signature": False}).get('exp')
+        ttl = exp - time.time() if exp else None
+        jwt_verification_cache.set(cache_key, verification, ttl=ttl)
+    return verification
+
+def get_request_user():
+    """Verify the request's Bearer token once and cache the user on flask.g (None if unauthenticated)"""
+    if 'current_user' not in g:
+        current_user = None
+        auth_header = request.headers.get('Authorization', '')
+        if auth_header[:7] == 'Bearer ':
+            try:
+                verification = verify_jwt_token_cached(auth_header[7:])
+                if verification and verification.get('success'):
+                    current_user = verification['user']
+            except Exception as e:
+                logger.warning("Failed to verify auth token: %s", e)
+        g.current_user = current_user
+    return g.current_user
+
+def require_auth(admin=False):
+    """Reject the request unless it carries a valid token (and an admin role when admin=True)"""
+    def decorator(fn):
+        # Bound once per route so each call reads closure cells instead of globals
+        current_user_of = get_request_user
+        token_required, invalid_token, forbidden = TOKEN_REQUIRED_RESPONSE, INVALID_TOKEN_RESPONSE, FORBIDDEN_RESPONSE
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            current_user = current_user_of()
+            if not current_user:
+                if request.headers.get('Authorization', '')[:7] != 'Bearer ':
+                    return token_required()
+                return invalid_token()
+            if admin and current_user.get('role') != 'admin':
+                return forbidden()
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
 @app.route('/')
 def index():
     # Add cache-busting timestamp
@@ -83,7 +207,7 @@ def reset_password_confirm():
         return render_template('reset-password.html', error='Invalid or missing reset token')
     
     # Verify the token
-    mongo_handler = MongoHandler()
+    mongo_handler = get_mongo_handler()
     token_result = mongo_handler.verify_password_reset_token(token)
     
     if not token_result['success']:
@@ -122,7 +246,7 @@ def test_email():
             }), 500
             
     except Exception as e:
-        logger.error(f"Error testing email configuration: {str(e)}")
+        logger.error("Error testing email configuration: %s", e)
         return jsonify({
             'status': 'error',
             'message': f'Error testing email: {str(e)}',
@@ -163,7 +287,7 @@ def test_error_notification():
             }), 500
             
     except Exception as e:
-        logger.error(f"Error testing error notification: {str(e)}")
+        logger.error("Error testing error notification: %s", e)
         return jsonify({
             'status': 'error',
             'message': f'Error testing notification: {str(e)}',
@@ -174,19 +298,19 @@ def test_error_notification():
 def results():
     # Check for both key and token parameters
     short_key = request.args.get('key') or request.args.get('token')
-    logger.info(f"Received request with key/token: {short_key}")
+    logger.info("Received request with key/token: %s", short_key)
     
     if short_key:
-        mongo_handler = MongoHandler()
+        mongo_handler = get_mongo_handler()
         url_params = mongo_handler.get_url_data(short_key)
-        logger.info(f"Retrieved URL params from MongoDB: {url_params}")
+        logger.info("Retrieved URL params from MongoDB: %s", url_params)
         if url_params:
             # Get the full document to access status timestamps
             document = mongo_handler.collection.find_one({"_id": short_key})
             status_timestamps = document.get('status_timestamps', {}) if document else {}
             return render_template('results.html', url_params=url_params, status_timestamps=status_timestamps)
         else:
-            logger.warning(f"No data found for key/token: {short_key}")
+            logger.warning("No data found for key/token: %s", short_key)
             # Return error page instead of falling back to long URL
             return render_template('error.html', error_message="The requested test case data could not be found. The link may have expired or been invalid."), 404
     
@@ -194,50 +318,171 @@ def results():
     return render_template('error.html', error_message="Invalid URL. Please use a valid test case link."), 400
 
 
-# Add at the top of the file with other imports
-from threading import Lock
+class GenerationStatus:
+    """Progress of a generation run, polled through /api/generation-status.
 
-# Add after app initialization
-generation_status = {
-    'is_generating': False,
-    'completed_types': set(),
-    'total_types': set(),
-    'phase': '',
-    'current_test_type': '',
-    'log': [],
-    'progress_percentage': 0,
-    'lock': Lock()
-}
+    Every update is a single attribute store, set.add or list.append, each atomic
+    under the GIL, so neither writers nor the status poll take a lock. Transitions
+    that touch several fields store is_generating last, so a poller that sees the
+    run finished also sees its final_url_key.
+    """
+
+    def __init__(self):
+        self.start(())
+        self.is_generating = False
+
+    def start(self, total_types):
+        """Reset for a new run over total_types completion keys"""
+        self.completed_types = set()
+        self.total_types = set(total_types)
+        self.phase = 'starting'
+        self.current_test_type = ''
+        self.log = []
+        # Critical: clear any stale final_url_key from previous runs
+        self.final_url_key = ''
+        self.is_generating = True
+
+    def set_phase(self, phase, message):
+        self.phase = phase
+        self.log.append(message)
+
+    def finish(self, final_url_key=None, all_completed=False):
+        """Mark the run finished, optionally recording its result key and completing every type"""
+        if all_completed:
+            self.completed_types = set(self.total_types)
+        if final_url_key is not None:
+            self.final_url_key = final_url_key
+        self.is_generating = False
+
+    def fail(self, message):
+        self.set_phase('error', message)
+        self.is_generating = False
+
+# Each /api/generate call tracks its own run under a generation id, so concurrent
+# generations never share progress; polls without an id get the latest run
+generation_statuses = TTLCache(maxsize=1024, ttl=30 * 60)
+latest_generation_status = GenerationStatus()
+
+# LLM calls are I/O-bound, so per-(item, type) generations run side by side;
+# the pool size caps how many hit the OpenAI rate limit at once
+generation_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='generation')
+
+def run_generation_jobs(jobs, generation_status):
+    """Run {completion_key: callable} LLM calls concurrently and return {completion_key: (result, exception)}
+
+    Each completion_key is marked done in generation_status as soon as its call
+    returns content, so progress polling advances while the rest are in flight.
+    """
+    futures = {generation_executor.submit(job): key for key, job in jobs.items()}
+    outcomes = {}
+    for future in as_completed(futures):
+        key = futures[future]
+        try:
+            result = future.result()
+        except Exception as e:
+            outcomes[key] = (None, e)
+            continue
+        outcomes[key] = (result, None)
+        if result:
+            completed_types = generation_status.completed_types
+            completed_types.add(key)
+            logger.info("Progress update: %d/%d", len(completed_types), len(generation_status.total_types))
+    return outcomes
+
+# Identical generation inputs (same item text or image, same test type) reuse
+# the stored output for a day instead of calling the LLM again
+GENERATION_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+def cached_generation(cache_source, generate_fn):
+    """Return generate_fn()'s output, served from the MongoDB generation cache when cache_source was seen recently"""
+    cache_key = hashlib.sha256(cache_source.encode('utf-8')).hexdigest()
+    try:
+        mongo_handler = get_mongo_handler()
+    except Exception as e:
+        logger.warning("Generation cache unavailable: %s", e)
+        return generate_fn()
+    cached = mongo_handler.get_cached_generation(cache_key)
+    if cached:
+        logger.info("Generation cache hit for %s", cache_key)
+        return cached
+    result = generate_fn()
+    if result:
+        mongo_handler.set_cached_generation(cache_key, result, GENERATION_CACHE_TTL_SECONDS)
+    return result
+
+# Generated TXT/Excel files are written off the request thread so the writes
+# for different items (and the two formats of one item) overlap
+file_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='file-save')
+
+# Characters stripped from item IDs before they are used in generated file names
+UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w-]+')
+
+# Storage directories are resolved and created once at startup instead of per request
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+GENERATED_DIR = os.path.join(BASE_DIR, 'tests', 'generated')
+IMAGE_STORAGE_DIR = os.path.join(BASE_DIR, 'tests', 'images')
+UPLOADS_DIR = os.path.join(BASE_DIR, 'uploads')
+try:
+    for storage_dir in (GENERATED_DIR, IMAGE_STORAGE_DIR, UPLOADS_DIR):
+        os.makedirs(storage_dir, exist_ok=True)
+    generated_dir_status = "OK"
+except Exception as e:
+    generated_dir_status = f"Error: {str(e)}"
+
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+def upload_size(file_storage):
+    """Size in bytes of an uploaded file, measured by seeking rather than reading it into memory"""
+    stream = file_storage.stream
+    position = stream.tell()
+    size = stream.seek(0, os.SEEK_END)
+    stream.seek(position)
+    return size
+
+def save_upload(file_storage, path):
+    """Copy an uploaded file to path in fixed-size chunks and return the sha256 hex digest of its bytes"""
+    digest = hashlib.sha256()
+    stream = file_storage.stream
+    with open(path, 'wb') as out:
+        while True:
+            chunk = stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            out.write(chunk)
+    return digest.hexdigest()
 
 # Modify the generate endpoint
 @app.route('/api/generate', methods=['POST'])
 def generate():
+    global latest_generation_status
+    generation_id = secrets.token_hex(16)
+    generation_status = GenerationStatus()
     try:
         logger.info("=== GENERATE ENDPOINT CALLED ===")
-        # Handle different request content types properly
+        # Handle different request content types properly; the body is parsed once here
         data = None
-        if request.is_json:
-            try:
-                data = request.json
-                logger.info("Request processed as JSON")
-            except Exception as e:
-                logger.error(f"Failed to parse JSON request: {e}")
+        is_json = request.is_json
+        if is_json:
+            data = request.get_json(silent=True)
+            if data is None:
+                logger.error("Failed to parse JSON request")
                 return jsonify({'error': 'Invalid JSON request'}), 400
+            logger.info("Request processed as JSON")
         else:
             data = request.form
             logger.info("Request processed as FormData")
             
-        logger.info(f"Request data type: {type(data)}")
-        logger.info(f"Request data keys: {list(data.keys()) if data else 'None'}")
+        logger.info("Request data type: %s", type(data))
+        logger.info("Request data keys: %s", list(data.keys()) if data else 'None')
         if request.files:
-            logger.info(f"Request files: {list(request.files.keys())}")
+            logger.info("Request files: %s", list(request.files.keys()))
             for key, file in request.files.items():
-                logger.info(f"File {key}: {file.filename}, size: {len(file.read()) if hasattr(file, 'read') else 'unknown'}")
-                file.seek(0)  # Reset file pointer
+                logger.info("File %s: %s, size: %s", key, file.filename, upload_size(file))
         
         # Get test case types with proper fallback
         selected_types = []
-        if request.is_json:
+        if is_json:
             selected_types = data.get('testCaseTypes[]', data.get('testCaseTypes', []))
         else:
             # For FormData, handle both getlist and get methods
@@ -257,19 +502,8 @@ def generate():
         if not selected_types:
             return jsonify({'error': 'Please select at least one test case type'}), 400
 
-        # Check if user is authenticated
-        current_user = None
-        auth_header = request.headers.get('Authorization')
-        if auth_header and auth_header.startswith('Bearer '):
-            try:
-                token = auth_header.split(' ')[1]
-                mongo_handler = MongoHandler()
-                user_info = mongo_handler.verify_jwt_token(token)
-                if user_info and user_info.get('success'):
-                    current_user = user_info['user']
-            except Exception as e:
-                logger.warning(f"Failed to verify auth token: {str(e)}")
-                # Continue without authentication
+        # Check if user is authenticated (anonymous generation is allowed)
+        current_user = get_request_user()
 
         # Get source type and item IDs for tracking
         if not data:
@@ -283,7 +517,7 @@ def generate():
         generation_start_time = datetime.utcnow()
         mongo_handler = None
         try:
-            mongo_handler = MongoHandler()
+            mongo_handler = get_mongo_handler()
             event_data = {
                 "event_type": "generate_button_click",
                 "event_data": {
@@ -306,38 +540,32 @@ def generate():
                 event_data['user_role'] = current_user.get('role')
             mongo_handler.track_event(event_data)
         except Exception as e:
-            logger.error(f"Failed to track generate button click: {str(e)}")
+            logger.error("Failed to track generate button click: %s", e)
             # Continue with generation even if analytics fails
         
         # Update generation status
-        with generation_status['lock']:
-            generation_status['is_generating'] = True
-            generation_status['completed_types'] = set()
-            generation_status['phase'] = 'starting'
-            generation_status['current_test_type'] = ''
-            generation_status['log'] = []
-            generation_status['progress_percentage'] = 0
-            # Critical: clear any stale final_url_key from previous runs
-            generation_status['final_url_key'] = ''
-            # For multiple item IDs, track combinations of item_id and test_type
-            if source_type == 'image':
-                generation_status['total_types'] = set(f"image_{test_type}" for test_type in selected_types)
-            elif source_type == 'url':
-                # Track URL test types directly
-                generation_status['total_types'] = set(f"url_{test_type}" for test_type in selected_types)
-            else:
-                # For Jira/Azure, create combinations of item_id and test_type
-                item_ids = data.get('itemId', [])
-                if isinstance(item_ids, str):
-                    item_ids = [item_ids]
-                generation_status['total_types'] = set(f"{item_id}_{test_type}" for item_id in item_ids for test_type in selected_types)
+        # For multiple item IDs, track combinations of item_id and test_type
+        if source_type == 'image':
+            total_types = [f"image_{test_type}" for test_type in selected_types]
+        elif source_type == 'url':
+            # Track URL test types directly
+            total_types = [f"url_{test_type}" for test_type in selected_types]
+        else:
+            # For Jira/Azure, create combinations of item_id and test_type
+            item_ids = data.get('itemId', [])
+            if isinstance(item_ids, str):
+                item_ids = [item_ids]
+            total_types = [f"{item_id}_{test_type}" for item_id in item_ids for test_type in selected_types]
+        generation_status.start(total_types)
+        generation_statuses.set(generation_id, generation_status)
+        latest_generation_status = generation_status
 
         # # Log the request for debugging
         # logger.info(f"Generation request - Types: {selected_types}")
         
         if source_type == 'url':
             logger.info("=== URL SOURCE TYPE DETECTED ===")
-            logger.info(f"Received data: {data}")
+            logger.info("Received data: %s", data)
             print(f"[DEBUG] URL request received: {data}")  # Immediate console output
             
             # Initialize item_ids for URL source type (empty list since URLs don't have item IDs)
@@ -346,7 +574,7 @@ def generate():
             # Handle URL source type
             url_config = data.get('url_config', {})
             url = url_config.get('url', '').strip()
-            logger.info(f"URL from config: {url}")
+            logger.info("URL from config: %s", url)
             print(f"[DEBUG] URL extracted: {url}")  # Immediate console output
             
             if not url:
@@ -372,11 +600,11 @@ def generate():
                     if response.status_code < 200 or response.status_code >= 300:
                         print(f"[DEBUG] URL not accessible, status: {response.status_code}")  # Immediate console output
                         # Don't return error, just log it and continue
-                        logger.warning(f"URL returned status {response.status_code}, but continuing anyway")
+                        logger.warning("URL returned status %s, but continuing anyway", response.status_code)
                 except Exception as url_error:
                     print(f"[DEBUG] URL access error: {url_error}")  # Immediate console output
                     # Don't return error, just log it and continue
-                    logger.warning(f"Could not access URL: {url_error}, but continuing anyway")
+                    logger.warning("Could not access URL: %s, but continuing anyway", url_error)
                     
                 # Import generator lazily
                 print("[DEBUG] Importing URL generator...")  # Immediate console output
@@ -385,14 +613,14 @@ def generate():
                     logger.info("Successfully imported URL generator")
                     print("[DEBUG] URL generator imported successfully")  # Immediate console output
                 except Exception as import_error:
-                    logger.error(f"Error importing URL generator: {import_error}")
+                    logger.error("Error importing URL generator: %s", import_error)
                     print(f"[DEBUG] Import error: {import_error}")  # Immediate console output
                     return jsonify({'error': f'Error importing URL generator: {import_error}'}), 500
 
                 # Resolve selected test case types
                 test_case_types = selected_types if selected_types else ['dashboard_functional']
-                logger.info(f"Selected types from request: {selected_types}")
-                logger.info(f"Test case types to generate: {test_case_types}")
+                logger.info("Selected types from request: %s", selected_types)
+                logger.info("Test case types to generate: %s", test_case_types)
                 print(f"[DEBUG] Test case types: {test_case_types}")  # Immediate console output
 
                 # Generate a unique key for the results
@@ -412,9 +640,7 @@ def generate():
                         # Record generation start time for tracking
                         generation_start_time = datetime.utcnow()
                         
-                        with generation_status['lock']:
-                            generation_status['phase'] = 'fetching_content'
-                            generation_status['log'].append(f"Fetching content from {target_url}")
+                        generation_status.set_phase('fetching_content', f"Fetching content from {target_url}")
                         
                         # 1) Fetch website content directly
                         print("[DEBUG ASYNC] Importing URL generator...")  # Immediate console output
@@ -422,22 +648,17 @@ def generate():
                         print(f"[DEBUG ASYNC] Fetching content from: {target_url}")  # Immediate console output
                         
                         # 2) Generate test cases directly from URL content
-                        with generation_status['lock']:
-                            generation_status['phase'] = 'ai_generation'
-                            generation_status['log'].append(f"Generating test cases from URL content for types: {types}")
+                        generation_status.set_phase('ai_generation', f"Generating test cases from URL content for types: {types}")
                         
                         test_cases_local = generate_url_test_cases(target_url, types)
-                        logger.info(f"[URL ASYNC] Direct URL generation finished, has content: {bool(test_cases_local)}")
+                        logger.info("[URL ASYNC] Direct URL generation finished, has content: %s", bool(test_cases_local))
 
                         if not test_cases_local:
                             raise RuntimeError('Failed to generate test cases from URL content')
 
                         # 3) Save results
                         test_cases_filename_local = f"url_test_cases_{result_key}.txt"
-                        # Create uploads directory if it doesn't exist
-                        uploads_dir = os.path.join(os.path.dirname(__file__), 'uploads')
-                        os.makedirs(uploads_dir, exist_ok=True)
-                        test_cases_filepath_local = os.path.join(uploads_dir, test_cases_filename_local)
+                        test_cases_filepath_local = os.path.join(UPLOADS_DIR, test_cases_filename_local)
                         with open(test_cases_filepath_local, 'w', encoding='utf-8') as f:
                             f.write(f"URL: {target_url}\n")
                             f.write(f"Generated Test Cases (via direct URL content analysis):\n\n")
@@ -446,7 +667,7 @@ def generate():
                         # Generate Excel file like Jira/Azure
                         file_base_name = f"url_test_cases_{result_key}"
                         excel_file = save_excel_report(test_cases_local, file_base_name)
-                        logger.info(f"[URL ASYNC] Generated Excel file: {excel_file}")
+                        logger.info("[URL ASYNC] Generated Excel file: %s", excel_file)
 
                         # Create task record
                         task_local = {
@@ -459,27 +680,27 @@ def generate():
                             'created_at': datetime.now()
                         }
                         try:
-                            mongo_handler_local = MongoHandler()
+                            mongo_handler_local = get_mongo_handler()
                             # Parse the test cases into structured format like Jira/Azure
-                            logger.info(f"[URL ASYNC] About to parse test cases. Type: {type(test_cases_local)}, Length: {len(test_cases_local) if test_cases_local else 0}")
-                            logger.info(f"[URL ASYNC] First 500 chars of test cases: {test_cases_local[:500] if test_cases_local else 'None'}")
+                            logger.info("[URL ASYNC] About to parse test cases. Type: %s, Length: %s", type(test_cases_local), len(test_cases_local) if test_cases_local else 0)
+                            logger.info("[URL ASYNC] First 500 chars of test cases: %s", test_cases_local[:500] if test_cases_local else 'None')
                             
                             structured_test_data = parse_traditional_format(test_cases_local)
-                            logger.info(f"[URL ASYNC] Parsed test data. Type: {type(structured_test_data)}, Length: {len(structured_test_data) if structured_test_data else 0}")
+                            logger.info("[URL ASYNC] Parsed test data. Type: %s, Length: %s", type(structured_test_data), len(structured_test_data) if structured_test_data else 0)
                             
                             # Debug: Check if steps are being parsed
                             if structured_test_data:
                                 for i, test_case in enumerate(structured_test_data):
                                     steps = test_case.get('Steps', [])
-                                    logger.info(f"[URL ASYNC] Test case {i+1} '{test_case.get('Title', 'Unknown')}' has {len(steps)} steps")
+                                    logger.info("[URL ASYNC] Test case %s '%s' has %s steps", i+1, test_case.get('Title', 'Unknown'), len(steps))
                                     if steps:
-                                        logger.info(f"[URL ASYNC] First step: {steps[0]}")
+                                        logger.info("[URL ASYNC] First step: %s", steps[0])
                                     else:
-                                        logger.warning(f"[URL ASYNC] No steps found for test case {i+1}")
+                                        logger.warning("[URL ASYNC] No steps found for test case %s", i+1)
                             
                             # Ensure structured_test_data is a list, not a string
                             if isinstance(structured_test_data, str):
-                                logger.error(f"[URL ASYNC] parse_traditional_format returned a string instead of a list: {structured_test_data[:200]}")
+                                logger.error("[URL ASYNC] parse_traditional_format returned a string instead of a list: %s", structured_test_data[:200])
                                 # Create a fallback structure
                                 structured_test_data = [{
                                     'Section': 'General',
@@ -489,7 +710,7 @@ def generate():
                                     'Expected Result': 'Content should be accessible and functional'
                                 }]
                             elif not isinstance(structured_test_data, list):
-                                logger.error(f"[URL ASYNC] parse_traditional_format returned unexpected type: {type(structured_test_data)}")
+                                logger.error("[URL ASYNC] parse_traditional_format returned unexpected type: %s", type(structured_test_data))
                                 structured_test_data = []
                             
                             # Use save_test_case like Image source type to get proper URL key format
@@ -500,12 +721,12 @@ def generate():
                                 'test_case_types': types,
                                 'test_data': structured_test_data  # Use structured data for frontend display
                             }, result_key, 'url', user_id)
-                            logger.info(f"[URL ASYNC] Saved test case with URL key: {url_key_final}")
+                            logger.info("[URL ASYNC] Saved test case with URL key: %s", url_key_final)
                         except Exception as me:
-                            logger.error(f"[URL ASYNC] Failed to save test case: {me}")
-                            logger.error(f"[URL ASYNC] Exception type: {type(me)}")
+                            logger.error("[URL ASYNC] Failed to save test case: %s", me)
+                            logger.error("[URL ASYNC] Exception type: %s", type(me))
                             import traceback
-                            logger.error(f"[URL ASYNC] Full traceback: {traceback.format_exc()}")
+                            logger.error("[URL ASYNC] Full traceback: %s", traceback.format_exc())
                             # Set a fallback URL key for tracking
                             url_key_final = result_key
                         
@@ -539,50 +760,38 @@ def generate():
                             if user_id:
                                 event_data['user_id'] = user_id
                             mongo_handler_local.track_event(event_data)
-                            logger.info(f"[URL ASYNC] Tracked URL test case generation event")
+                            logger.info("[URL ASYNC] Tracked URL test case generation event")
                         except Exception as tracking_error:
-                            logger.error(f"[URL ASYNC] Failed to track URL test case generation: {tracking_error}")
+                            logger.error("[URL ASYNC] Failed to track URL test case generation: %s", tracking_error)
 
                         # Mark progress completed and store the final URL key
-                        with generation_status['lock']:
-                            generation_status['completed_types'] = set(generation_status['total_types'])
-                            generation_status['is_generating'] = False
-                            generation_status['progress_percentage'] = 100
-                            generation_status['phase'] = 'completed'
-                            generation_status['log'].append('Generation completed')
-                            generation_status['final_url_key'] = url_key_final  # Store the final URL key
-                            logger.info(f"[URL ASYNC] Set final_url_key in generation status: {url_key_final}")
+                        generation_status.set_phase('completed', 'Generation completed')
+                        generation_status.finish(url_key_final, all_completed=True)  # Store the final URL key
+                        logger.info("[URL ASYNC] Set final_url_key in generation status: %s", url_key_final)
                     except Exception as gen_err:
-                        logger.error(f"[URL ASYNC] Error: {gen_err}")
-                        with generation_status['lock']:
-                            generation_status['is_generating'] = False
-                            generation_status['phase'] = 'error'
-                            generation_status['log'].append(f"Error: {gen_err}")
+                        logger.error("[URL ASYNC] Error: %s", gen_err)
+                        generation_status.fail(f"Error: {gen_err}")
 
                 # Log in status for visibility
-                with generation_status['lock']:
-                    generation_status['phase'] = 'queued'
-                    generation_status['log'].append(f"Queued URL generation for {url} with types: {test_case_types}")
+                generation_status.set_phase('queued', f"Queued URL generation for {url} with types: {test_case_types}")
 
                 threading.Thread(target=_run_url_generation_async, args=(url, test_case_types, url_key, current_user.get('id') if current_user else None), daemon=True).start()
 
                 # Immediately return so frontend can start polling progress
-                return jsonify({'url_key': url_key})
+                return jsonify({'url_key': url_key, 'generation_id': generation_id})
                 
             except requests.RequestException as e:
-                with generation_status['lock']:
-                    generation_status['is_generating'] = False
+                generation_status.finish()
                 return jsonify({'error': f'Failed to access URL: {str(e)}'}), 400
             except Exception as e:
-                logger.error(f"Error processing URL content: {str(e)}")
-                with generation_status['lock']:
-                    generation_status['is_generating'] = False
+                logger.error("Error processing URL content: %s", e)
+                generation_status.finish()
                 return jsonify({'error': f'Error processing URL content: {str(e)}'}), 500
 
         elif source_type == 'image':
             logger.info("=== IMAGE SOURCE TYPE DETECTED ===")
-            logger.info(f"Request files: {list(request.files.keys())}")
-            logger.info(f"Request form data: {list(request.form.keys())}")
+            logger.info("Request files: %s", list(request.files.keys()))
+            logger.info("Request form data: %s", list(request.form.keys()))
             
             # Initialize item_ids for image source type (empty list since images don't have item IDs)
             item_ids = []
@@ -593,29 +802,22 @@ def generate():
                 return jsonify({'error': 'No image file uploaded'}), 400
                 
             image_file = request.files['imageFile']
-            logger.info(f"Image file received: {image_file.filename}, size: {len(image_file.read()) if hasattr(image_file, 'read') else 'unknown'}")
-            # Reset file pointer after reading
-            image_file.seek(0)
+            logger.info("Image file received: %s, size: %s", image_file.filename, upload_size(image_file))
             
             if image_file.filename == '':
                 logger.error("Empty filename received")
                 return jsonify({'error': 'No selected file'}), 400
                 
             # Create unique identifier for the image
-            import uuid
-            unique_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}"
-            
-            # Save the uploaded image in a permanent storage
-            image_storage = os.path.join(os.path.dirname(__file__), 'tests', 'images')
-            os.makedirs(image_storage, exist_ok=True)
+            unique_id = f"{int(time.time())}_{secrets.token_hex(4)}"
             
             # Get file extension
             file_ext = os.path.splitext(image_file.filename)[1]
             stored_filename = f"image_{unique_id}{file_ext}"
-            image_path = os.path.join(image_storage, stored_filename)
+            image_path = os.path.join(IMAGE_STORAGE_DIR, stored_filename)
             
-            # Save the image
-            image_file.save(image_path)
+            # Stream the image to disk, hashing it on the way for the generation cache
+            image_digest = save_upload(image_file, image_path)
             
             try:
                 # Import the image generator
@@ -624,47 +826,35 @@ def generate():
                 # The API key verification is now handled inside the image generator function
                 # No need to check here as the function will handle it properly
                 
-                # Use the already processed selected_types
-                if not selected_types:
-                    os.remove(image_path)  # Clean up if validation fails
-                    # Reset the generation status
-                    with generation_status['lock']:
-                        generation_status['is_generating'] = False
-                    return jsonify({'error': 'Please select at least one test case type'}), 400
-                
-                # Generate test cases from image - one type at a time
-                test_cases = None
+                # selected_types was read and validated at the top of generate()
+                # Generate test cases from image - one call per type, run concurrently
+                test_case_parts = []
                 all_types_processed = True
                 error_messages = []
                 
+                logger.info("Generating %s test cases from image", selected_types)
+                outcomes = run_generation_jobs({
+                    f"{unique_id}_{test_type}": partial(
+                        cached_generation,
+                        f"image|{image_digest}|{test_type}",
+                        partial(generate_test_case_from_image, image_path, selected_types=[test_type])
+                    )
+                    for test_type in selected_types
+                }, generation_status)
+                
                 for test_type in selected_types:
-                    try:
-                        # Generate one type at a time
-                        logger.info(f"Generating {test_type} test cases from image")
-                        type_test_case = generate_test_case_from_image(
-                            image_path,
-                            selected_types=[test_type]
-                        )
-                        
+                    type_test_case, e = outcomes[f"{unique_id}_{test_type}"]
+                    if e is None:
                         if type_test_case:
-                            if test_cases:
-                                test_cases += "\n\n" + type_test_case
-                            else:
-                                test_cases = type_test_case
-                                
-                            # Mark this type as completed
-                            with generation_status['lock']:
-                                # Track completion per item ID and type
-                                completion_key = f"{unique_id}_{test_type}"
-                                generation_status['completed_types'].add(completion_key)
+                            test_case_parts.append(type_test_case)
                         else:
                             error_messages.append(f"Failed to generate {test_type} test cases from image")
-                            logger.error(f"Failed to generate {test_type} test cases from image")
+                            logger.error("Failed to generate %s test cases from image", test_type)
                             all_types_processed = False
-                    except ValueError as e:
+                    elif isinstance(e, ValueError):
                         error_message = str(e)
                         error_messages.append(error_message)
-                        logger.error(f"Error generating {test_type} test cases from image: {error_message}", exc_info=True)
+                        logger.error("Error generating %s test cases from image: %s", test_type, error_message, exc_info=e)
                         all_types_processed = False
                         
                         # Check for API key errors
@@ -673,20 +863,20 @@ def generate():
                             if os.path.exists(image_path):
                                 os.remove(image_path)
                             # Reset generation status
-                            with generation_status['lock']:
-                                generation_status['is_generating'] = False
+                            generation_status.finish()
                             # Render the error page
                             return render_template('error.html', error_message=error_message), 400
-                    except Exception as e:
+                    else:
                         error_messages.append(f"Error generating {test_type} test cases: {str(e)}")
-                        logger.error(f"Error generating {test_type} test cases from image: {str(e)}", exc_info=True)
+                        logger.error("Error generating %s test cases from image: %s", test_type, e, exc_info=e)
                         all_types_processed = False
                 
+                test_cases = "\n\n".join(test_case_parts)
+                
                 if not test_cases:
                     os.remove(image_path)  # Clean up if generation fails
                     # Reset the generation status
-                    with generation_status['lock']:
-                        generation_status['is_generating'] = False
+                    generation_status.finish()
                     
                     # Provide better error message
                     error_message = "Failed to generate test cases from image"
@@ -705,8 +895,9 @@ def generate():
                 
                 # Save test case files
                 file_base_name = f'test_image_{unique_id}'
-                txt_file = save_test_script(test_cases, file_base_name)
+                txt_future = file_executor.submit(save_test_script, test_cases, file_base_name)
                 excel_file = save_excel_report(test_cases, file_base_name)
+                txt_file = txt_future.result()
                 
                 if txt_file and excel_file:
                     results = {
@@ -740,7 +931,7 @@ def generate():
                         structured_test_data = parse_traditional_format(test_cases)
                     
                     # Create MongoDB handler and save test case data
-                    mongo_handler = MongoHandler()
+                    mongo_handler = get_mongo_handler()
                     url_key = mongo_handler.save_test_case({
                         'test_cases': formatted_test_cases,
                         'source_type': 'image',
@@ -781,34 +972,31 @@ def generate():
                                 event_data['user_role'] = current_user.get('role')
                             mongo_handler.track_event(event_data)
                     except Exception as e:
-                        logger.error(f"Failed to track image test case generation: {str(e)}")
+                        logger.error("Failed to track image test case generation: %s", e)
                     
                     # Mark all test types as completed
-                    with generation_status['lock']:
-                        generation_status['completed_types'] = generation_status['total_types'].copy()
-                        generation_status['is_generating'] = False
+                    generation_status.finish(all_completed=True)
                     
                     return jsonify({
                         'success': True,
                         'url_key': url_key,
+                        'generation_id': generation_id,
                         'files': results
                     })
                 else:
                     os.remove(image_path)  # Clean up if saving fails
                     # Reset the generation status
-                    with generation_status['lock']:
-                        generation_status['is_generating'] = False
+                    generation_status.finish()
                     return jsonify({'error': 'Failed to save test case files'}), 400
                     
             except Exception as e:
                 if os.path.exists(image_path):
                     os.remove(image_path)
                 # Reset the generation status
-                with generation_status['lock']:
-                    generation_status['is_generating'] = False
+                generation_status.finish()
                 
                 # Log the full error for debugging
-                logger.error(f"Image processing error: {str(e)}", exc_info=True)
+                logger.error("Image processing error: %s", e, exc_info=True)
                 
                 # Return a more specific error message
                 error_message = f'Image processing error: {str(e)}. Please ensure the image is clear and in a supported format (JPG, PNG, JPEG).'
@@ -824,180 +1012,150 @@ def generate():
                 return jsonify({'error': error_message}), 500
                 
         else:
-            # Existing Jira/Azure logic
-            data = request.json
-            source_type = data.get('sourceType', 'jira')
+            # Existing Jira/Azure logic (data, source_type and selected_types were read and validated above)
             item_ids = data.get('itemId', [])
             
             # Add debugging
-            logger.info(f"Processing request for source_type: {source_type}")
-            logger.info(f"Raw item_ids from request: {item_ids}")
-            
-            # Fix test case types handling for JSON requests
-            selected_types = data.get('testCaseTypes[]', data.get('testCaseTypes', []))
-            if isinstance(selected_types, str):
-                selected_types = [selected_types]
-            
-            if not selected_types:
-                return jsonify({'error': 'Please select at least one test case type'}), 400
+            logger.info("Processing request for source_type: %s", source_type)
+            logger.info("Raw item_ids from request: %s", item_ids)
             
             if isinstance(item_ids, str):
                 item_ids = [item_ids]
             
-            logger.info(f"Processed item_ids: {item_ids} (count: {len(item_ids)})")
-            logger.info(f"Selected test types: {selected_types}")
+            logger.info("Processed item_ids: %s (count: %s)", item_ids, len(item_ids))
+            logger.info("Selected test types: %s", selected_types)
             
             # Log batch processing info
             if len(item_ids) > 10:
-                logger.info(f"Large batch detected: {len(item_ids)} items. Processing in batches...")
+                logger.info("Large batch detected: %s items. Processing in batches...", len(item_ids))
             elif len(item_ids) > 5:
-                logger.info(f"Medium batch detected: {len(item_ids)} items.")
+                logger.info("Medium batch detected: %s items.", len(item_ids))
             else:
-                logger.info(f"Small batch: {len(item_ids)} items.")
+                logger.info("Small batch: %s items.", len(item_ids))
             
             results = {}
             all_types_processed = True
             
+            if source_type == 'azure':
+                logger.info("=== AZURE SECTION ENTERED ===")
+                # Get Azure configuration from request data
+                azure_config = data.get('azure_config')
+                # Only the keys are logged; the values include the PAT
+                logger.info("Azure config type: %s", type(azure_config))
+                
+                if azure_config:
+                    logger.info("Azure config keys: %s", list(azure_config.keys()) if isinstance(azure_config, dict) else 'Not a dict')
+                
+                # Only use frontend config if it exists and all required values are present
+                if azure_config and all(azure_config.values()):
+                    logger.info("Using frontend Azure config")
+                    azure_client = AzureClient(azure_config=azure_config)
+                else:
+                    logger.info("Using environment variables for Azure config")
+                    logger.info("Reason: azure_config exists: %s, all values present: %s", bool(azure_config), all(azure_config.values()) if azure_config else False)
+                    azure_client = AzureClient()  # Fall back to environment variables
+                
+                # Fetch every requested work item in one batched call
+                try:
+                    work_items_by_id = {work_item['id']: work_item for work_item in (azure_client.fetch_azure_work_items(item_ids) or [])}
+                except Exception as e:
+                    logger.error("Azure client error for items %s: %s", item_ids, e)
+                    return jsonify({'error': f'Azure DevOps connection error: {str(e)}'}), 500
+            
+            # Fetch every item first (failing fast on the first bad one), then run
+            # all (item, type) generations concurrently
+            sources = []
             for item_id in item_ids:
-                logger.info(f"Processing item_id: {item_id}")
-                test_cases = None
+                logger.info("Processing item_id: %s", item_id)
                 
                 if source_type == 'jira':
                     # Get Jira configuration from request data
                     jira_config = data.get('jira_config')
-                    logger.info(f"Fetching Jira issue for item_id: {item_id}")
+                    logger.info("Fetching Jira issue for item_id: %s", item_id)
                     
                     try:
                         issue = fetch_issue(item_id, jira_config)
                         if not issue:
-                            logger.warning(f"Failed to fetch Jira issue for {item_id}")
+                            logger.warning("Failed to fetch Jira issue for %s", item_id)
                             return jsonify({'error': f'Failed to fetch Jira issue {item_id}. Please check your credentials and ensure the issue exists.'}), 400
                     except Exception as e:
-                        logger.error(f"Jira connection error for {item_id}: {str(e)}")
+                        logger.error("Jira connection error for %s: %s", item_id, e)
                         return jsonify({'error': f'Jira connection error: {str(e)}. Please check your Jira configuration.'}), 500
                     
-                    logger.info(f"Successfully fetched Jira issue {item_id}: {issue.get('key', 'Unknown')}")
+                    logger.info("Successfully fetched Jira issue %s: %s", item_id, issue.get('key', 'Unknown'))
                     
-                    for test_type in selected_types:
-                        try:
-                            logger.info(f"Generating {test_type} test cases for {item_id}")
-                            # Generate one type at a time
-                            type_test_case = generate_test_case(
-                                description=issue['fields']['description'],
-                                summary=issue['fields']['summary'],
-                                selected_types=[test_type]
-                            )
-                            
-                            if type_test_case:
-                                if test_cases:
-                                    test_cases += "\n\n" + type_test_case
-                                else:
-                                    test_cases = type_test_case
-                                    
-                                # Mark this type as completed
-                                with generation_status['lock']:
-                                    # Track completion per item ID and type
-                                    completion_key = f"{item_id}_{test_type}"
-                                    generation_status['completed_types'].add(completion_key)
-                                    # Log progress for debugging
-                                    progress = (len(generation_status['completed_types']) / len(generation_status['total_types'])) * 100
-                                    logger.info(f"Progress update: {len(generation_status['completed_types'])}/{len(generation_status['total_types'])} = {progress:.1f}%")
-                                logger.info(f"Successfully generated {test_type} test cases for {item_id}")
-                            else:
-                                logger.warning(f"No test cases generated for {test_type} for {item_id}")
-                                all_types_processed = False
-                                
-                        except Exception as e:
-                            logger.error(f"Error generating {test_type} test cases for {item_id}: {str(e)}")
-                            all_types_processed = False
+                    sources.append((item_id, issue['fields']['description'], issue['fields']['summary']))
                             
                 elif source_type == 'azure':
-                    logger.info("=== AZURE SECTION ENTERED ===")
-                    # Get Azure configuration from request data
-                    azure_config = data.get('azure_config')
-                    logger.info(f"Azure config received: {azure_config}")
-                    logger.info(f"Azure config type: {type(azure_config)}")
-                    
-                    if azure_config:
-                        logger.info(f"Azure config keys: {list(azure_config.keys()) if isinstance(azure_config, dict) else 'Not a dict'}")
-                        logger.info(f"Azure config values: {list(azure_config.values()) if isinstance(azure_config, dict) else 'Not a dict'}")
-                    
-                    # Only use frontend config if it exists and all required values are present
-                    if azure_config and all(azure_config.values()):
-                        logger.info(f"Using frontend Azure config: {azure_config}")
-                        azure_client = AzureClient(azure_config=azure_config)
-                    else:
-                        logger.info("Using environment variables for Azure config")
-                        logger.info(f"Reason: azure_config exists: {bool(azure_config)}, all values present: {all(azure_config.values()) if azure_config else False}")
-                        azure_client = AzureClient()  # Fall back to environment variables
-                    
-                    # Capture Azure-specific errors
-                    try:
-                        work_items = azure_client.fetch_azure_work_items([item_id])
-                        
-                        if not work_items or len(work_items) == 0:
-                            # Check if it's an authentication issue
-                            if hasattr(azure_client, 'last_error'):
-                                error_msg = azure_client.last_error
-                                if '401' in error_msg:
-                                    return jsonify({'error': 'Azure DevOps authentication failed. Please check your Personal Access Token (PAT) and ensure it has "Work Items (Read)" permissions.'}), 401
-                                elif '404' in error_msg:
-                                    return jsonify({'error': f'Work item {item_id} not found in Azure DevOps. Please verify the work item ID exists in your project.'}), 404
-                                else:
-                                    return jsonify({'error': f'Azure DevOps error: {error_msg}'}), 400
+                    work_item = work_items_by_id.get(item_id)
+                    if not work_item:
+                        # Check if it's an authentication issue
+                        error_msg = azure_client.last_error
+                        if error_msg:
+                            if '401' in error_msg:
+                                return jsonify({'error': 'Azure DevOps authentication failed. Please check your Personal Access Token (PAT) and ensure it has "Work Items (Read)" permissions.'}), 401
+                            elif '404' in error_msg:
+                                return jsonify({'error': f'Work item {item_id} not found in Azure DevOps. Please verify the work item ID exists in your project.'}), 404
                             else:
-                                return jsonify({'error': f'Failed to fetch work item {item_id} from Azure DevOps. Please check your configuration and try again.'}), 400
-                    except Exception as e:
-                        logger.error(f"Azure client error for item {item_id}: {str(e)}")
-                        return jsonify({'error': f'Azure DevOps connection error: {str(e)}'}), 500
-                    
-                    # Define work_item from the fetched items
-                    work_item = work_items[0]
+                                return jsonify({'error': f'Azure DevOps error: {error_msg}'}), 400
+                        else:
+                            return jsonify({'error': f'Failed to fetch work item {item_id} from Azure DevOps. Please check your configuration and try again.'}), 400
                     
-                    for test_type in selected_types:
-                        try:
-                            # Generate one type at a time
-                            type_test_case = generate_test_case(
-                                description=work_item['description'],
-                                summary=work_item['title'],
-                                selected_types=[test_type]
-                            )
-                            
-                            if type_test_case:
-                                if test_cases:
-                                    test_cases += "\n\n" + type_test_case
-                                else:
-                                    test_cases = type_test_case
-                                    
-                                # Mark this type as completed
-                                with generation_status['lock']:
-                                    # Track completion per item ID and type
-                                    completion_key = f"{item_id}_{test_type}"
-                                    generation_status['completed_types'].add(completion_key)
-                                    # Log progress for debugging
-                                    progress = (len(generation_status['completed_types']) / len(generation_status['total_types'])) * 100
-                                    logger.info(f"Progress update: {len(generation_status['completed_types'])}/{len(generation_status['total_types'])} = {progress:.1f}%")
-                                logger.info(f"Successfully generated {test_type} test cases for {item_id}")
-                            else:
-                                all_types_processed = False
-                                
-                        except Exception as e:
-                            logger.error(f"Error generating {test_type} test cases: {str(e)}")
-                            all_types_processed = False
+                    sources.append((item_id, work_item['description'], work_item['title']))
+            
+            outcomes = run_generation_jobs({
+                f"{item_id}_{test_type}": partial(
+                    cached_generation,
+                    f"{source_type}|{item_id}|{test_type}|{description}|{summary}",
+                    partial(generate_test_case, description=description, summary=summary, selected_types=[test_type])
+                )
+                for item_id, description, summary in sources
+                for test_type in selected_types
+            }, generation_status)
+            
+            pending_saves = []
+            saves_by_name = {}
+            for item_id, _, _ in sources:
+                test_case_parts = []
+                for test_type in selected_types:
+                    type_test_case, e = outcomes[f"{item_id}_{test_type}"]
+                    if e is not None:
+                        logger.error("Error generating %s test cases for %s: %s", test_type, item_id, e)
+                        all_types_processed = False
+                    elif type_test_case:
+                        test_case_parts.append(type_test_case)
+                        logger.info("Successfully generated %s test cases for %s", test_type, item_id)
+                    else:
+                        logger.warning("No test cases generated for %s for %s", test_type, item_id)
+                        all_types_processed = False
+                test_cases = "\n\n".join(test_case_parts)
                 
                 # Only proceed if test cases were generated
                 if not test_cases:
-                    logger.warning(f"No test cases generated for item_id: {item_id}, skipping file creation")
+                    logger.warning("No test cases generated for item_id: %s, skipping file creation", item_id)
                     continue
                     
-                logger.info(f"Generated test cases for {item_id}, saving files...")
+                logger.info("Generated test cases for %s, saving files...", item_id)
                     
                 # Save files
-                safe_filename = ''.join(c for c in item_id if c.isalnum() or c in ('-', '_'))
+                safe_filename = UNSAFE_FILENAME_CHARS_RE.sub('', item_id)
                 file_base_name = f'test_{safe_filename}'
                 
-                txt_file = save_test_script(test_cases, file_base_name)
-                excel_file = save_excel_report(test_cases, file_base_name)
+                previous_saves = saves_by_name.get(file_base_name)
+                if previous_saves:
+                    # An earlier item writes the same files; let it finish so the last item still wins
+                    for future in previous_saves:
+                        future.result()
+                saves = (
+                    file_executor.submit(save_test_script, test_cases, file_base_name),
+                    file_executor.submit(save_excel_report, test_cases, file_base_name)
+                )
+                saves_by_name[file_base_name] = saves
+                pending_saves.append((item_id, test_cases, saves))
+            
+            for item_id, test_cases, (txt_future, excel_future) in pending_saves:
+                txt_file = txt_future.result()
+                excel_file = excel_future.result()
                 
                 if txt_file and excel_file:
                     results[item_id] = {
@@ -1005,18 +1163,15 @@ def generate():
                         'excel': excel_file,
                         'test_cases': test_cases  # Store the test cases content
                     }
-                    logger.info(f"Successfully saved files for {item_id}: txt={txt_file}, excel={excel_file}")
+                    logger.info("Successfully saved files for %s: txt=%s, excel=%s", item_id, txt_file, excel_file)
                 else:
-                    logger.error(f"Failed to save files for {item_id}: txt={txt_file}, excel={excel_file}")
-            
-            logger.info(f"Final results: {list(results.keys())} (total: {len(results)} items)")
+                    logger.error("Failed to save files for %s: txt=%s, excel=%s", item_id, txt_file, excel_file)
             
-            # After all item IDs and types are processed, update generation status
-            with generation_status['lock']:
-                generation_status['is_generating'] = False
+            logger.info("Final results: %s (total: %s items)", list(results.keys()), len(results))
             
             if not results:
                 logger.error("No results generated for any item IDs")
+                generation_status.finish()
                 # Provide more specific error messages based on the source type
                 if source_type == 'azure':
                     return jsonify({'error': 'No Azure DevOps work items were successfully processed. Please check your credentials and work item IDs.'}), 400
@@ -1042,7 +1197,7 @@ def generate():
                             })
             
                                 # Create MongoDB handler and save test case data
-                    mongo_handler = MongoHandler()
+                    mongo_handler = get_mongo_handler()
                     url_key = mongo_handler.save_test_case({
                         'files': results,
                         'test_cases': formatted_test_cases,
@@ -1050,8 +1205,7 @@ def generate():
                         'item_ids': item_ids
                     }, item_ids[0] if item_ids else None, source_type, current_user['id'] if current_user else None)
                     # Expose the url_key for redirect logic
-                    with generation_status['lock']:
-                        generation_status['final_url_key'] = url_key
+                    generation_status.final_url_key = url_key
                     
                     # Track successful test case generation with timing
                     generation_end_time = datetime.utcnow()
@@ -1086,16 +1240,20 @@ def generate():
                                 event_data['user_role'] = current_user.get('role')
                             mongo_handler.track_event(event_data)
                     except Exception as e:
-                        logger.error(f"Failed to track test case generation: {str(e)}")
+                        logger.error("Failed to track test case generation: %s", e)
+            
+            # After all item IDs and types are processed, update generation status
+            generation_status.finish()
             
             return jsonify({
                 'success': True,
                 'url_key': url_key,
+                'generation_id': generation_id,
                 'files': results
             })
             
     except Exception as e:
-        logger.error(f"Error during generation: {str(e)}", exc_info=True)
+        logger.error("Error during generation: %s", e, exc_info=True)
         # Capture error in MongoDB with context
         capture_exception(e, {
             "source_type": source_type,
@@ -1105,16 +1263,47 @@ def generate():
             "ip_address": request.remote_addr
         })
         # Reset the generation status in case of errors
-        with generation_status['lock']:
-            generation_status['is_generating'] = False
+        generation_status.finish()
         return jsonify({'error': str(e)}), 500
 
+def send_generated_file(directory, filename, download_name=None, temporary=False):
+    """Send directory/filename as an attachment with conditional and Range (206) support.
+
+    Temporary files are handed over as an open file object: they are deleted after
+    the request, before an X-Sendfile front-end would get to read them by path.
+    """
+    if temporary:
+        return send_file(
+            open(os.path.join(directory, filename), 'rb'),
+            as_attachment=True,
+            download_name=download_name or os.path.basename(filename),
+            conditional=True,
+            max_age=0
+        )
+    return send_from_directory(directory, filename, as_attachment=True, download_name=download_name, conditional=True, max_age=0)
+
+def remove_after_request(path):
+    """Queue path for deletion once the current response has been built"""
+    g.setdefault('temp_files', []).append(path)
+
+@app.after_request
+def remove_request_temp_files(response):
+    """Delete the temp files queued with remove_after_request"""
+    for path in g.pop('temp_files', ()):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error("Error removing temp file: %s", e)
+    return response
+
 @app.route('/api/download/<path:filename>')
 def download_file(filename):
     try:
         # Track download attempt
         try:
-            mongo_handler = MongoHandler()
+            mongo_handler = get_mongo_handler()
             event_data = {
                 "event_type": "file_download_attempted",
                 "event_data": {
@@ -1129,26 +1318,19 @@ def download_file(filename):
             }
             mongo_handler.track_event(event_data)
         except Exception as e:
-            logger.error(f"Failed to track download attempt: {str(e)}")
-        
-        # Handle cloud deployment paths
-        base_dir = os.path.dirname(__file__)
-        generated_dir = os.path.join(base_dir, 'tests', 'generated')
+            logger.error("Failed to track download attempt: %s", e)
         
-        # Ensure the generated directory exists
-        if not os.path.exists(generated_dir):
-            os.makedirs(generated_dir, exist_ok=True)
-            logger.info(f"Created generated directory: {generated_dir}")
+        generated_dir = GENERATED_DIR
         
         file_path = os.path.join(generated_dir, filename)
         
         # Log the file path for debugging
-        logger.info(f"Attempting to download file: {file_path}")
+        logger.info("Attempting to download file: %s", file_path)
         
         if not os.path.exists(file_path):
-            logger.error(f"File not found: {file_path}")
+            logger.error("File not found: %s", file_path)
             # Try to find the file by searching for it in the generated directory
-            logger.info(f"Searching for file in: {generated_dir}")
+            logger.info("Searching for file in: %s", generated_dir)
             
             matching_files = []
             if os.path.exists(generated_dir):
@@ -1160,9 +1342,9 @@ def download_file(filename):
                 # Use the first matching file
                 filename = matching_files[0]
                 file_path = os.path.join(generated_dir, filename)
-                logger.info(f"Found matching file: {filename}")
+                logger.info("Found matching file: %s", filename)
             else:
-                logger.error(f"No matching files found for: {filename}")
+                logger.error("No matching files found for: %s", filename)
                 return jsonify({'error': 'File not found'}), 404
         
         # Check if status values were provided
@@ -1174,101 +1356,77 @@ def download_file(filename):
         # If it's an Excel file and status values are provided, update the file
         if status_values and filename.endswith('.xlsx'):
             try:
-                status_dict = json.loads(status_values)
-                logger.info(f"Updating Excel file with status values: {status_dict}")
+                status_dict = orjson.loads(status_values)
+                logger.info("Updating Excel file with status values: %s", status_dict)
                 
-                # Update the Excel file with status values
-                import pandas as pd
-                df = pd.read_excel(file_path)
+                # Update the Status cells in place; the rest of the workbook is left untouched
+                from openpyxl import load_workbook
+                wb = load_workbook(file_path)
+                ws = wb.active
+                
+                header = [cell.value for cell in ws[1]]
+                title_col = header.index('Title') + 1 if 'Title' in header else None
+                if 'Status' in header:
+                    status_col = header.index('Status') + 1
+                else:
+                    status_col = len(header) + 1
+                    ws.cell(row=1, column=status_col, value='Status')
                 
                 # Update each row where Title matches status key
                 updated_count = 0
-                for index, row in df.iterrows():
-                    title = row.get('Title', '')
-                    if title and title in status_dict:
-                        df.at[index, 'Status'] = status_dict[title]
-                        updated_count += 1
+                if title_col:
+                    for row_idx, (title,) in enumerate(ws.iter_rows(min_row=2, min_col=title_col, max_col=title_col, values_only=True), start=2):
+                        if title and title in status_dict:
+                            ws.cell(row=row_idx, column=status_col, value=status_dict[title])
+                            updated_count += 1
                 
-                logger.info(f"Updated {updated_count} rows with status values")
+                logger.info("Updated %s rows with status values", updated_count)
                 
                 # Save to a temporary file
                 temp_file_path = f"{file_path}.temp.xlsx"
-                df.to_excel(temp_file_path, index=False)
+                wb.save(temp_file_path)
                 
                 # Use the temporary file for download with custom filename if provided
-                if custom_filename:
-                    response = send_file(temp_file_path, as_attachment=True, download_name=custom_filename)
-                else:
-                    response = send_file(temp_file_path, as_attachment=True)
+                response = send_generated_file(generated_dir, os.path.relpath(temp_file_path, generated_dir), custom_filename, temporary=True)
                 
                 # Set up cleanup after request is complete
-                @after_this_request
-                def remove_temp_file(response):
-                    try:
-                        if os.path.exists(temp_file_path):
-                            os.remove(temp_file_path)
-                    except Exception as e:
-                        logger.error(f"Error removing temp file: {e}")
-                    return response
+                remove_after_request(temp_file_path)
                     
             except Exception as e:
-                logger.error(f"Error updating Excel with status values: {e}")
+                logger.error("Error updating Excel with status values: %s", e)
                 # Fall back to original file if error occurs
-                if custom_filename:
-                    response = send_file(file_path, as_attachment=True, download_name=custom_filename)
-                else:
-                    response = send_file(file_path, as_attachment=True)
+                response = send_generated_file(generated_dir, filename, custom_filename)
         
         # For TXT files with status values
         elif status_values and filename.endswith('.txt'):
             try:
-                status_dict = json.loads(status_values)
-                logger.info(f"Updating TXT file with status values: {status_dict}")
-                
-                # Read the original content
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                status_dict = orjson.loads(status_values)
+                logger.info("Updating TXT file with status values: %s", status_dict)
                 
                 # Create a temporary file
                 temp_file_path = f"{file_path}.temp.txt"
                 
-                # Write updated content with status values appended
-                with open(temp_file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                    f.write("\n\n# STATUS VALUES\n")
+                # Copy the original content in chunks, then append the status values
+                with open(file_path, 'rb') as src, open(temp_file_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, 64 * 1024)
+                    dst.write(b"\n\n# STATUS VALUES\n")
                     for title, status in status_dict.items():
                         if status:  # Only include non-empty status values
-                            f.write(f"{title}: {status}\n")
+                            dst.write(f"{title}: {status}\n".encode('utf-8'))
                 
                 # Use the temporary file for download with custom filename if provided
-                if custom_filename:
-                    response = send_file(temp_file_path, as_attachment=True, download_name=custom_filename)
-                else:
-                    response = send_file(temp_file_path, as_attachment=True)
+                response = send_generated_file(generated_dir, os.path.relpath(temp_file_path, generated_dir), custom_filename, temporary=True)
                 
                 # Set up cleanup after request is complete
-                @after_this_request
-                def remove_temp_file(response):
-                    try:
-                        if os.path.exists(temp_file_path):
-                            os.remove(temp_file_path)
-                    except Exception as e:
-                        logger.error(f"Error removing temp file: {e}")
-                    return response
+                remove_after_request(temp_file_path)
                     
             except Exception as e:
-                logger.error(f"Error updating TXT with status values: {e}")
+                logger.error("Error updating TXT with status values: %s", e)
                 # Fall back to original file if error occurs
-                if custom_filename:
-                    response = send_file(file_path, as_attachment=True, download_name=custom_filename)
-                else:
-                    response = send_file(file_path, as_attachment=True)
+                response = send_generated_file(generated_dir, filename, custom_filename)
         else:
             # Default case - no status values or not a handled file type
-            if custom_filename:
-                response = send_file(file_path, as_attachment=True, download_name=custom_filename)
-            else:
-                response = send_file(file_path, as_attachment=True)
+            response = send_generated_file(generated_dir, filename, custom_filename)
             
         # Track successful download
         try:
@@ -1288,29 +1446,26 @@ def download_file(filename):
             }
             mongo_handler.track_event(event_data)
         except Exception as e:
-            logger.error(f"Failed to track successful download: {str(e)}")
+            logger.error("Failed to track successful download: %s", e)
         
-        # Add cache control headers to prevent caching
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
-        return response
+        # send_file sets its own Cache-Control, so the global default would not apply
+        return no_cache(response)
     except Exception as e:
-        logger.error(f"Error downloading file: {e}")
+        logger.error("Error downloading file: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/files/<url_key>')
 def get_files_for_url_key(url_key):
     """Get list of files associated with a URL key"""
     try:
-        logger.info(f"Requested files for URL key: {url_key}")
+        logger.info("Requested files for URL key: %s", url_key)
         
         # Get the document from MongoDB
-        mongo_handler = MongoHandler()
+        mongo_handler = get_mongo_handler()
         doc = mongo_handler.collection.find_one({"url_key": url_key})
         
         if not doc:
-            logger.error(f"No document found for URL key: {url_key}")
+            logger.error("No document found for URL key: %s", url_key)
             return jsonify({'error': 'Document not found'}), 404
         
         files = []
@@ -1339,7 +1494,7 @@ def get_files_for_url_key(url_key):
             
             if source_type and item_id:
                 # Generate possible file names based on the source type and item_id
-                base_dir = os.path.join(os.path.dirname(__file__), 'tests', 'generated')
+                base_dir = GENERATED_DIR
                 
                 if os.path.exists(base_dir):
                     # Look for files that match the item_id pattern
@@ -1347,26 +1502,26 @@ def get_files_for_url_key(url_key):
                         if item_id in filename and (filename.endswith('.xlsx') or filename.endswith('.txt')):
                             files.append(filename)
         
-        logger.info(f"Found {len(files)} files for URL key {url_key}: {files}")
+        logger.info("Found %s files for URL key %s: %s", len(files), url_key, files)
         
         return jsonify({'files': files})
         
     except Exception as e:
-        logger.error(f"Error getting files for URL key {url_key}: {str(e)}", exc_info=True)
+        logger.error("Error getting files for URL key %s: %s", url_key, e, exc_info=True)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/ai-content/<url_key>')
 def get_ai_content(url_key):
     """Get AI-generated content for a URL key"""
     try:
-        logger.info(f"Requested AI content for URL key: {url_key}")
+        logger.info("Requested AI content for URL key: %s", url_key)
         
         # Get the document from MongoDB
-        mongo_handler = MongoHandler()
+        mongo_handler = get_mongo_handler()
         doc = mongo_handler.collection.find_one({"url_key": url_key})
         
         if not doc:
-            logger.error(f"No document found for URL key: {url_key}")
+            logger.error("No document found for URL key: %s", url_key)
             return jsonify({'error': 'Document not found'}), 404
         
         # Check if the document has test_cases content
@@ -1391,7 +1546,7 @@ def get_ai_content(url_key):
                     if isinstance(file_info, dict) and 'txt' in file_info:
                         # Try to read the text file
                         try:
-                            base_dir = os.path.join(os.path.dirname(__file__), 'tests', 'generated')
+                            base_dir = GENERATED_DIR
                             file_path = os.path.join(base_dir, file_info['txt'])
                             
                             if os.path.exists(file_path):
@@ -1399,27 +1554,27 @@ def get_ai_content(url_key):
                                     content = f.read()
                                 return jsonify({'content': content})
                         except Exception as e:
-                            logger.warning(f"Could not read file {file_info['txt']}: {e}")
+                            logger.warning("Could not read file %s: %s", file_info['txt'], e)
         
-        logger.warning(f"No AI content found for URL key: {url_key}")
+        logger.warning("No AI content found for URL key: %s", url_key)
         return jsonify({'error': 'No AI content found'}), 404
         
     except Exception as e:
-        logger.error(f"Error getting AI content for URL key {url_key}: {str(e)}", exc_info=True)
+        logger.error("Error getting AI content for URL key %s: %s", url_key, e, exc_info=True)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/results/<url_key>/test-cases')
 def get_test_cases_for_url_key(url_key):
     """Get test cases data for a URL key"""
     try:
-        logger.info(f"Requested test cases for URL key: {url_key}")
+        logger.info("Requested test cases for URL key: %s", url_key)
         
         # Get the document from MongoDB
-        mongo_handler = MongoHandler()
+        mongo_handler = get_mongo_handler()
         doc = mongo_handler.collection.find_one({"url_key": url_key})
         
         if not doc:
-            logger.error(f"No document found for URL key: {url_key}")
+            logger.error("No document found for URL key: %s", url_key)
             return jsonify({'error': 'Document not found'}), 404
         
         # Check if the document has test_data
@@ -1441,7 +1596,7 @@ def get_test_cases_for_url_key(url_key):
                     if isinstance(file_info, dict) and 'excel' in file_info:
                         # Try to read the Excel file and extract test cases
                         try:
-                            base_dir = os.path.join(os.path.dirname(__file__), 'tests', 'generated')
+                            base_dir = GENERATED_DIR
                             file_path = os.path.join(base_dir, file_info['excel'])
                             
                             if os.path.exists(file_path):
@@ -1463,7 +1618,7 @@ def get_test_cases_for_url_key(url_key):
                                 if records:
                                     return jsonify({'test_cases': records})
                         except Exception as e:
-                            logger.warning(f"Could not read Excel file {file_info['excel']}: {e}")
+                            logger.warning("Could not read Excel file %s: %s", file_info['excel'], e)
             
             # If no files found, try to parse the test_cases string if it exists
             if 'test_cases' in test_data and isinstance(test_data['test_cases'], str):
@@ -1488,27 +1643,27 @@ def get_test_cases_for_url_key(url_key):
                         if parsed_cases:
                             return jsonify({'test_cases': parsed_cases})
                 except Exception as e:
-                    logger.warning(f"Could not parse test cases string: {e}")
+                    logger.warning("Could not parse test cases string: %s", e)
         
-        logger.warning(f"No test cases found for URL key: {url_key}")
+        logger.warning("No test cases found for URL key: %s", url_key)
         return jsonify({'error': 'No test cases found'}), 404
         
     except Exception as e:
-        logger.error(f"Error getting test cases for URL key {url_key}: {str(e)}", exc_info=True)
+        logger.error("Error getting test cases for URL key %s: %s", url_key, e, exc_info=True)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/ai-tests/<url_key>')
 def get_ai_tests_for_url_key(url_key):
     """Get AI test cases for a URL key"""
     try:
-        logger.info(f"Requested AI tests for URL key: {url_key}")
+        logger.info("Requested AI tests for URL key: %s", url_key)
         
         # Get the document from MongoDB
-        mongo_handler = MongoHandler()
+        mongo_handler = get_mongo_handler()
         doc = mongo_handler.collection.find_one({"url_key": url_key})
         
         if not doc:
-            logger.error(f"No document found for URL key: {url_key}")
+            logger.error("No document found for URL key: %s", url_key)
             return jsonify({'error': 'Document not found'}), 404
         
         # Check if the document has test_data
@@ -1530,7 +1685,7 @@ def get_ai_tests_for_url_key(url_key):
                     if isinstance(file_info, dict) and 'excel' in file_info:
                         # Try to read the Excel file and extract test cases
                         try:
-                            base_dir = os.path.join(os.path.dirname(__file__), 'tests', 'generated')
+                            base_dir = GENERATED_DIR
                             file_path = os.path.join(base_dir, file_info['excel'])
                             
                             if os.path.exists(file_path):
@@ -1552,7 +1707,7 @@ def get_ai_tests_for_url_key(url_key):
                                 if records:
                                     return jsonify({'test_cases': records})
                         except Exception as e:
-                            logger.warning(f"Could not read Excel file {file_info['excel']}: {e}")
+                            logger.warning("Could not read Excel file %s: %s", file_info['excel'], e)
             
             # If no files found, try to parse the test_cases string if it exists
             if 'test_cases' in test_data and isinstance(test_data['test_cases'], str):
@@ -1577,41 +1732,44 @@ def get_ai_tests_for_url_key(url_key):
                         if parsed_cases:
                             return jsonify({'test_cases': parsed_cases})
                 except Exception as e:
-                    logger.warning(f"Could not parse test cases string: {e}")
+                    logger.warning("Could not parse test cases string: %s", e)
         
-        logger.warning(f"No AI tests found for URL key: {url_key}")
+        logger.warning("No AI tests found for URL key: %s", url_key)
         return jsonify({'error': 'No AI tests found'}), 404
         
     except Exception as e:
-        logger.error(f"Error getting AI tests for URL key {url_key}: {str(e)}", exc_info=True)
+        logger.error("Error getting AI tests for URL key %s: %s", url_key, e, exc_info=True)
         return jsonify({'error': str(e)}), 500
 
+def read_excel_fast(file_path, **kwargs):
+    """Read an .xlsx with the Rust-backed calamine engine, falling back to the default engine"""
+    import pandas as pd
+    try:
+        return pd.read_excel(file_path, engine='calamine', **kwargs)
+    except Exception as e:
+        # calamine is optional (python-calamine / pandas >= 2.2); keep the openpyxl path working
+        logger.debug("calamine read failed for %s, falling back to default engine: %s", file_path, e)
+        return pd.read_excel(file_path, **kwargs)
+
 @app.route('/api/content/<path:filename>')
 def get_file_content(filename):
     try:
-        logger.info(f"Requested content for file: {filename}")
+        logger.info("Requested content for file: %s", filename)
         
         # Convert undefined or None to more descriptive error
         if filename == 'undefined' or filename is None:
-            logger.error(f"Invalid filename: '{filename}'")
+            logger.error("Invalid filename: '%s'", filename)
             return jsonify({'error': 'Invalid filename provided'}), 400
             
-        # Handle cloud deployment paths
-        base_dir = os.path.dirname(__file__)
-        generated_dir = os.path.join(base_dir, 'tests', 'generated')
-        
-        # Ensure the generated directory exists
-        if not os.path.exists(generated_dir):
-            os.makedirs(generated_dir, exist_ok=True)
-            logger.info(f"Created generated directory: {generated_dir}")
+        generated_dir = GENERATED_DIR
             
         # Check if the file exists in the generated directory
         file_path = os.path.join(generated_dir, filename)
-        logger.info(f"Looking for file at: {file_path}")
+        logger.info("Looking for file at: %s", file_path)
         
         if not os.path.exists(file_path):
             # Try to find the file by searching for it in the generated directory
-            logger.info(f"File not found at exact path, searching in {generated_dir}")
+            logger.info("File not found at exact path, searching in %s", generated_dir)
             
             # Check if filename contains any part of actual files in the directory
             matching_files = []
@@ -1624,116 +1782,101 @@ def get_file_content(filename):
                 # Use the first matching file
                 filename = matching_files[0]
                 file_path = os.path.join(generated_dir, filename)
-                logger.info(f"Found matching file: {filename}")
+                logger.info("Found matching file: %s", filename)
             else:
-                logger.error(f"File not found: {file_path}")
+                logger.error("File not found: %s", file_path)
                 return jsonify({'error': 'File not found'}), 404
         
         if filename.endswith('.xlsx'):
             import pandas as pd
             import numpy as np
-            import json
             
-            logger.info(f"Reading Excel file: {filename}")
+            logger.info("Reading Excel file: %s", filename)
             
             try:
                 # Read the Excel file
-                df = pd.read_excel(file_path)
-                logger.info(f"Excel file read successfully with {len(df)} rows and columns: {list(df.columns)}")
+                df = read_excel_fast(file_path)
+                logger.info("Excel file read successfully with %s rows and columns: %s", len(df), list(df.columns))
                 
                 # Get status values if provided
                 status_values = request.args.get('status')
                 status_dict = {}
                 if status_values:
                     try:
-                        status_dict = json.loads(status_values)
-                        logger.info(f"Applying status values to content: {status_dict}")
+                        status_dict = orjson.loads(status_values)
+                        logger.info("Applying status values to content: %s", status_dict)
                     except Exception as e:
-                        logger.error(f"Error parsing status values: {e}")
+                        logger.error("Error parsing status values: %s", e)
                 
-                # Convert to records and handle NaN values
-                records = []
-                for index, row in df.iterrows():
-                    record = {}
-                    for column in df.columns:
-                        value = row[column]
-                        # Handle NaN, NaT, and other non-JSON-serializable values
-                        if pd.isna(value):
-                            record[column] = None
-                        else:
-                            record[column] = value
-                    
-                    # Update status if available
-                    title = record.get('Title', '')
-                    if title and title in status_dict:
-                        record['Status'] = status_dict[title]
-                    
-                    # Parse Steps field if it's a string with numbered steps
-                    if 'Steps' in record and isinstance(record['Steps'], str):
-                        steps_text = record['Steps']
-                        # If it looks like numbered steps, convert to array
-                        if re.search(r'^\d+\.', steps_text):
-                            steps = re.split(r'\n\s*\d+\.|\n', steps_text)
+                # Convert to records in one pass (no Series per row); NaN/NaT become None.
+                # The object cast keeps float columns from turning None back into NaN
+                records = df.astype(object).where(df.notna(), None).to_dict(orient='records')
+                
+                # Convert numbered Steps text to arrays with one regex pass over the column;
+                # the .str methods return NaN for non-string cells, which na=False skips
+                if 'Steps' in df.columns and pd.api.types.is_string_dtype(df['Steps'].dtype):
+                    numbered = df['Steps'].str.match(r'\d+\.', na=False)
+                    if numbered.any():
+                        split_steps = df['Steps'][numbered].str.split(r'\n\s*\d+\.|\n', regex=True)
+                        for position, steps in zip(numbered.to_numpy().nonzero()[0], split_steps):
                             # Clean up steps
                             steps = [s.strip() for s in steps if s.strip()]
                             if steps:
-                                record['Steps'] = steps
-                    
-                    records.append(record)
+                                records[position]['Steps'] = steps
+                
+                # Update status if available
+                if status_dict:
+                    for record in records:
+                        title = record.get('Title', '')
+                        if title and title in status_dict:
+                            record['Status'] = status_dict[title]
                 
-                logger.info(f"Converted Excel file {filename} to {len(records)} records")
+                logger.info("Converted Excel file %s to %s records", filename, len(records))
                 
                 # If no records were found, check if it might be due to incorrect column names
                 if not records or (len(records) == 1 and not any(records[0].values())):
-                    logger.warning(f"No valid records found in Excel file, checking for column issues")
+                    logger.warning("No valid records found in Excel file, checking for column issues")
                     
                     # Try to read the raw data and convert manually
-                    raw_data = pd.read_excel(file_path, header=None)
+                    raw_data = read_excel_fast(file_path, header=None, dtype=object)
                     if len(raw_data) > 1:  # At least has header row + one data row
                         # Assuming first row is header
                         headers = [str(h).strip() for h in raw_data.iloc[0]]
                         
-                        # Create records from remaining rows
-                        manual_records = []
-                        for i in range(1, len(raw_data)):
-                            record = {}
-                            for j, header in enumerate(headers):
-                                if j < len(raw_data.columns):
-                                    value = raw_data.iloc[i, j]
-                                    if pd.isna(value):
-                                        record[header] = None
-                                    else:
-                                        record[header] = value
-                            manual_records.append(record)
+                        # Create records from remaining rows, masking NaN to None in one pass
+                        body = raw_data.iloc[1:]
+                        body = body.where(body.notna(), None)
+                        manual_records = [dict(zip(headers, row)) for row in body.itertuples(index=False, name=None)]
                         
                         if manual_records:
-                            logger.info(f"Manually extracted {len(manual_records)} records with headers: {headers}")
+                            logger.info("Manually extracted %s records with headers: %s", len(manual_records), headers)
                             records = manual_records
                 
                 return jsonify({
                     'content': records
                 })
             except Exception as e:
-                logger.error(f"Error processing Excel file {filename}: {str(e)}", exc_info=True)
+                logger.error("Error processing Excel file %s: %s", filename, e, exc_info=True)
                 return jsonify({'error': f"Error processing Excel file: {str(e)}"}), 500
         else:
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
-                logger.info(f"Successfully read text file: {filename} ({len(content)} characters)")
+                logger.info("Successfully read text file: %s (%s characters)", filename, len(content))
                 return jsonify({'content': content})
             except Exception as e:
-                logger.error(f"Error reading text file {filename}: {str(e)}")
+                logger.error("Error reading text file %s: %s", filename, e)
                 return jsonify({'error': f"Error reading text file: {str(e)}"}), 500
     except Exception as e:
-        logger.error(f"Error in get_file_content for {filename}: {str(e)}", exc_info=True)
+        # Client-facing 404: skip the traceback walk, these are mostly bad filenames
+        logger.error("Error in %s for %s: %s", "get_file_content", filename, e)
         return jsonify({'error': str(e)}), 404
 
 @app.route('/api/update-status', methods=['POST'])
 def update_status():
     try:
         data = request.json
-        logger.info(f"Received status update request: {data}")
+        logger.info("Received status update request: %s", data)
         
         url_key = data.get('key')
         test_case_id = data.get('test_case_id')
@@ -1752,7 +1895,7 @@ def update_status():
         if status.strip() == '':
             return jsonify({'error': 'Status cannot be empty'}), 400
 
-        mongo_handler = MongoHandler()
+        mongo_handler = get_mongo_handler()
         
         # First verify the document exists
         doc = mongo_handler.collection.find_one({"url_key": url_key})
@@ -1787,10 +1930,10 @@ def update_status():
                             {"url_key": url_key},
                             {"$set": {f"test_data.{i}.Status": status}}
                         )
-                        logger.info(f"Updated status in test_data array index {i}")
+                        logger.info("Updated status in test_data array index %s", i)
                         break
             
-            logger.info(f"Successfully updated status for test case '{test_case_id}'")
+            logger.info("Successfully updated status for test case '%s'", test_case_id)
             return jsonify({'success': True})
         else:
             error_msg = f"Failed to update status for test case {test_case_id} in document {url_key}"
@@ -1798,28 +1941,17 @@ def update_status():
             return jsonify({'error': error_msg}), 404
 
     except Exception as e:
-        logger.error(f"Error updating status: {str(e)}")
+        logger.error("Error updating status: %s", e)
         return jsonify({'error': str(e)}), 500
 
-# Initialize MongoDB handler
-mongo_handler = MongoHandler()
+# Initialize MongoDB handler (the same shared instance get_mongo_handler returns)
+mongo_handler = get_mongo_handler()
 
 @app.route('/api/share', methods=['POST'])
 def share_test_case():
     try:
-        # Check if user is authenticated
-        current_user = None
-        auth_header = request.headers.get('Authorization')
-        if auth_header and auth_header.startswith('Bearer '):
-            try:
-                token = auth_header.split(' ')[1]
-                auth_mongo_handler = MongoHandler()
-                user_info = auth_mongo_handler.verify_jwt_token(token)
-                if user_info and user_info.get('success'):
-                    current_user = user_info['user']
-            except Exception as e:
-                logger.warning(f"Failed to verify auth token: {str(e)}")
-                # Continue without authentication
+        # Check if user is authenticated (anonymous sharing is allowed)
+        current_user = get_request_user()
 
         # Handle both JSON and form data for cloud compatibility
         if request.is_json:
@@ -1831,11 +1963,11 @@ def share_test_case():
             for key, value in data.items():
                 if isinstance(value, str) and value.startswith('{'):
                     try:
-                        data[key] = json.loads(value)
+                        data[key] = orjson.loads(value)
                     except:
                         pass
         
-        logger.info(f"Share request data: {data}")
+        logger.info("Share request data: %s", data)
         
         test_data = data.get('test_data')
         item_id = data.get('item_id')
@@ -1847,7 +1979,7 @@ def share_test_case():
             return jsonify({'error': 'No test data provided'}), 400
 
         # Create a new MongoDB handler for this request
-        mongo_handler = MongoHandler()
+        mongo_handler = get_mongo_handler()
         if not mongo_handler:
             logger.error("MongoDB handler not initialized")
             return jsonify({'error': 'Database connection error'}), 500
@@ -1863,25 +1995,31 @@ def share_test_case():
         if status_values:
             try:
                 mongo_handler.update_status_dict(url_key, status_values)
-                logger.info(f"Saved status values for {url_key}: {status_values}")
+                logger.info("Saved status values for %s: %s", url_key, status_values)
             except Exception as e:
-                logger.error(f"Error saving status values: {e}")
+                logger.error("Error saving status values: %s", e)
                 # Continue without status values if there's an error
         
         # Create the share URL - use BASE_URL from settings or detect from request headers
         from config.settings import BASE_URL
         
+        # Snapshot the proxy headers once instead of re-reading them per check
+        headers = request.headers
+        forwarded_host = headers.get('X-Forwarded-Host')
+        forwarded_proto = headers.get('X-Forwarded-Proto')
+        host = headers.get('Host')
+        is_local_host = bool(host) and (host.startswith('127.0.0.1') or host.startswith('localhost'))
+        
         # Try to get the actual domain from request headers (for production)
-        if request.headers.get('X-Forwarded-Host'):
+        if forwarded_host:
             # Use the forwarded host (common in production with reverse proxies)
-            base_url = f"https://{request.headers.get('X-Forwarded-Host')}"
-        elif request.headers.get('X-Forwarded-Proto') and request.headers.get('Host'):
+            base_url = f"https://{forwarded_host}"
+        elif forwarded_proto and host:
             # Use forwarded protocol and host
-            protocol = request.headers.get('X-Forwarded-Proto', 'https')
-            base_url = f"{protocol}://{request.headers.get('Host')}"
-        elif request.headers.get('Host') and not request.headers.get('Host').startswith('127.0.0.1') and not request.headers.get('Host').startswith('localhost'):
+            base_url = f"{forwarded_proto}://{host}"
+        elif host and not is_local_host:
             # Use the Host header if it's not localhost
-            base_url = f"https://{request.headers.get('Host')}"
+            base_url = f"https://{host}"
         else:
             # Fall back to BASE_URL from settings
             base_url = BASE_URL.rstrip('/')
@@ -1889,15 +2027,11 @@ def share_test_case():
         share_url = f"{base_url}/view/{url_key}"
         
         # Log URL generation details for debugging
-        logger.info(f"URL generation details:")
-        logger.info(f"  - X-Forwarded-Host: {request.headers.get('X-Forwarded-Host')}")
-        logger.info(f"  - X-Forwarded-Proto: {request.headers.get('X-Forwarded-Proto')}")
-        logger.info(f"  - Host: {request.headers.get('Host')}")
-        logger.info(f"  - BASE_URL from settings: {BASE_URL}")
-        logger.info(f"  - Selected base_url: {base_url}")
-        logger.info(f"  - Generated share URL: {share_url}")
-        logger.info(f"  - Request URL: {request.url}")
-        logger.info(f"  - Request base URL: {request.base_url}")
+        logger.debug(
+            "URL generation: X-Forwarded-Host=%s X-Forwarded-Proto=%s Host=%s BASE_URL=%s "
+            "selected=%s share_url=%s request_url=%s request_base_url=%s",
+            forwarded_host, forwarded_proto, host, BASE_URL, base_url, share_url, request.url, request.base_url
+        )
         
         # Track successful share creation
         try:
@@ -1910,7 +2044,7 @@ def share_test_case():
                     "has_status_values": bool(status_values),
                     "status_values_count": len(status_values) if status_values else 0
                 },
-                "user_agent": request.headers.get('User-Agent'),
+                "user_agent": headers.get('User-Agent'),
                 "ip_address": request.remote_addr,
                 "source_type": None,
                 "test_case_types": [],
@@ -1918,7 +2052,7 @@ def share_test_case():
             }
             mongo_handler.track_event(event_data)
         except Exception as e:
-            logger.error(f"Failed to track successful share creation: {str(e)}")
+            logger.error("Failed to track successful share creation: %s", e)
         
         return jsonify({
             'success': True,
@@ -1926,15 +2060,43 @@ def share_test_case():
             'url_key': url_key
         })
     except Exception as e:
-        logger.error(f"Error in share_test_case: {str(e)}")
+        logger.error("Error in share_test_case: %s", e)
         return jsonify({'error': str(e)}), 500
 
+@lru_cache(maxsize=128)
+def parse_excel_records(excel_path, mtime):
+    """Parse a generated Excel file into records; mtime is part of the cache key"""
+    return tuple(read_excel_fast(excel_path).to_dict('records'))
+
+# Shared views larger than this apply status values with pandas Series.map
+VECTORIZED_STATUS_THRESHOLD = 500
+
+def apply_status_vectorized(test_data, status_dict, status_timestamps):
+    """Apply status values to a large test_data list in place, matching the plain loop.
+
+    Rows are matched on title membership rather than on the mapped value, so
+    statuses and timestamps stored as None are still assigned.
+    """
+    import pandas as pd
+    titles = pd.Series([tc.get('Title') if isinstance(tc, dict) else None for tc in test_data], dtype=object)
+    has_status = titles.isin(list(status_dict))
+    if not has_status.any():
+        return
+    # object dtype keeps None values from being turned into NaN by map()
+    statuses = titles.map(pd.Series(status_dict, dtype=object))
+    has_timestamp = has_status & titles.isin(list(status_timestamps))
+    timestamps = titles.map(pd.Series(status_timestamps, dtype=object))
+    for idx in has_status.to_numpy().nonzero()[0]:
+        test_data[idx]['Status'] = statuses.iat[idx]
+    for idx in has_timestamp.to_numpy().nonzero()[0]:
+        test_data[idx]['StatusUpdatedAt'] = timestamps.iat[idx]
+
 @app.route('/view/<url_key>')
 def view_shared_test_case(url_key):
     try:
         # Track view page visit
         try:
-            mongo_handler = MongoHandler()
+            mongo_handler = get_mongo_handler()
             event_data = {
                 "event_type": "shared_page_visited",
                 "event_data": {
@@ -1949,7 +2111,7 @@ def view_shared_test_case(url_key):
             }
             mongo_handler.track_event(event_data)
         except Exception as e:
-            logger.error(f"Failed to track view page visit: {str(e)}")
+            logger.error("Failed to track view page visit: %s", e)
         
         # Check if JSON format was requested
         format_param = request.args.get('format', '').lower()
@@ -1969,12 +2131,12 @@ def view_shared_test_case(url_key):
         if 'test_data' in test_case:
             # If test_data is a list, it's already structured
             if isinstance(test_case['test_data'], list):
-                logger.info(f"Test data for {url_key} is already a list with {len(test_case['test_data'])} items")
+                logger.info("Test data for %s is already a list with %s items", url_key, len(test_case['test_data']))
             else:
                 # If test_data is a dict with test_cases array, extract it
                 if isinstance(test_case['test_data'], dict) and 'test_cases' in test_case['test_data']:
                     test_case['test_data'] = test_case['test_data']['test_cases']
-                    logger.info(f"Extracted test_cases array with {len(test_case['test_data'])} items")
+                    logger.info("Extracted test_cases array with %s items", len(test_case['test_data']))
                 # If test_data is a dict with files, try to parse the files
                 elif isinstance(test_case['test_data'], dict) and 'files' in test_case['test_data']:
                     try:
@@ -1984,19 +2146,20 @@ def view_shared_test_case(url_key):
                         
                         if excel_file:
                             # Try to read Excel file
-                            excel_path = os.path.join(os.path.dirname(__file__), 'tests', 'generated', excel_file)
+                            excel_path = os.path.join(GENERATED_DIR, excel_file)
                             if os.path.exists(excel_path):
-                                import pandas as pd
-                                df = pd.read_excel(excel_path)
-                                structured_data = df.to_dict('records')
+                                # Generated files never change once written, so the parse is cached per mtime
+                                cached_records = parse_excel_records(excel_path, os.path.getmtime(excel_path))
+                                # Copy the rows since status values are applied to them in place below
+                                structured_data = [dict(record) for record in cached_records]
                                 test_case['test_data'] = structured_data
-                                logger.info(f"Parsed Excel file into {len(structured_data)} records")
+                                logger.info("Parsed Excel file into %s records", len(structured_data))
                         
                         # If we couldn't get data from Excel, check if there's a txt file
                         if not isinstance(test_case['test_data'], list) and 'txt' in files:
                             txt_file = files.get('txt')
                             if txt_file:
-                                txt_path = os.path.join(os.path.dirname(__file__), 'tests', 'generated', txt_file)
+                                txt_path = os.path.join(GENERATED_DIR, txt_file)
                                 if os.path.exists(txt_path):
                                     with open(txt_path, 'r', encoding='utf-8') as f:
                                         txt_content = f.read()
@@ -2015,33 +2178,36 @@ def view_shared_test_case(url_key):
                                     
                                     if structured_data:
                                         test_case['test_data'] = structured_data
-                                        logger.info(f"Parsed text file into {len(structured_data)} records")
+                                        logger.info("Parsed text file into %s records", len(structured_data))
                     except Exception as e:
-                        logger.error(f"Error processing files for view: {str(e)}")
+                        logger.error("Error processing files for view: %s", e)
         
         # Apply any status values that might exist
         if 'status' in test_case and isinstance(test_case['status'], dict) and isinstance(test_case['test_data'], list):
             status_dict = test_case['status']
             status_timestamps = test_case.get('status_timestamps', {})
-            for tc in test_case['test_data']:
-                if 'Title' in tc and tc['Title'] in status_dict:
-                    tc['Status'] = status_dict[tc['Title']]
-                    # Add timestamp information
-                    if tc['Title'] in status_timestamps:
-                        tc['StatusUpdatedAt'] = status_timestamps[tc['Title']]
+            if want_json and len(test_case['test_data']) > VECTORIZED_STATUS_THRESHOLD:
+                apply_status_vectorized(test_case['test_data'], status_dict, status_timestamps)
+            else:
+                for tc in test_case['test_data']:
+                    if 'Title' in tc and tc['Title'] in status_dict:
+                        tc['Status'] = status_dict[tc['Title']]
+                        # Add timestamp information
+                        if tc['Title'] in status_timestamps:
+                            tc['StatusUpdatedAt'] = status_timestamps[tc['Title']]
         
         # Return JSON or HTML based on the format parameter
         if want_json:
-            # Convert ObjectId to string for JSON serialization
-            if '_id' in test_case:
-                test_case['_id'] = str(test_case['_id'])
-                
+            # ObjectId is stringified by the JSON provider
             return jsonify(test_case)
         else:
             return render_template('view.html', test_case=test_case)
     except Exception as e:
-        logger.error(f"Error in view_shared_test_case: {str(e)}", exc_info=True)
-        if format_param == 'json':
+        # Only the JSON branch surfaces a 5xx; the HTML branch is a plain 404 that
+        # bots probing share URLs hit constantly, so skip the traceback there
+        want_traceback = request.args.get('format', '').lower() == 'json'
+        logger.error("Error in %s: %s", "view_shared_test_case", e, exc_info=want_traceback)
+        if want_traceback:
             return jsonify({'error': str(e)}), 500
         else:
             return render_template('404.html'), 404
@@ -2062,10 +2228,10 @@ def download_shared_excel(url_key):
         status_dict = {}
         if status_values:
             try:
-                status_dict = json.loads(status_values)
-                logger.info(f"SHARED EXCEL: Received {len(status_dict)} status values: {status_dict}")
+                status_dict = orjson.loads(status_values)
+                logger.info("SHARED EXCEL: Received %s status values: %s", len(status_dict), status_dict)
             except Exception as e:
-                logger.error(f"SHARED EXCEL: Error parsing status values: {e}")
+                logger.error("SHARED EXCEL: Error parsing status values: %s", e)
         else:
             logger.info("SHARED EXCEL: No status values provided")
         
@@ -2086,7 +2252,6 @@ def download_shared_excel(url_key):
         test_data = test_case['test_data']
         
         # Now format for Excel generation
-        import json
         formatted_data = ""
         
         # Track which test cases have status updates
@@ -2133,13 +2298,10 @@ def download_shared_excel(url_key):
             
             formatted_data += "\n\n"
         
-        logger.info(f"SHARED EXCEL: Updated {updated_count} test cases with status values")
+        logger.info("SHARED EXCEL: Updated %s test cases with status values", updated_count)
         
-        # Add a summary of all status values at the end for debugging
-        formatted_data += "\n\n# STATUS SUMMARY\n"
-        for title, status in status_dict.items():
-            if status:
-                formatted_data += f"{title}: {status}\n"
+        # Log the status summary for debugging instead of appending it to the file content
+        logger.debug("SHARED EXCEL: Status summary: %s", status_dict)
         
         test_data_str = formatted_data
         
@@ -2151,54 +2313,120 @@ def download_shared_excel(url_key):
             return jsonify({'error': 'Failed to generate Excel file'}), 500
         
         # Return the Excel file with the custom filename
-        file_path = os.path.join(os.path.dirname(__file__), 'tests', 'generated', excel_file)
+        file_path = os.path.join(GENERATED_DIR, excel_file)
         response = send_file(file_path, as_attachment=True, download_name=custom_filename)
         
         # Add aggressive cache control headers to prevent caching
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
+        no_cache(response)
         response.headers["X-Status-Updated-Count"] = str(updated_count)
         response.headers["X-Status-Update-Time"] = str(datetime.now())
         
         return response
     except Exception as e:
-        logger.error(f"Error generating Excel file: {str(e)}")
+        logger.error("Error generating Excel file: %s", e)
         return jsonify({'error': str(e)}), 500
 
 # Add this after the generate endpoint
 @app.route('/api/generation-status')
 def get_generation_status():
     try:
-        with generation_status['lock']:
-            # Calculate progress percentage based on completed types vs total types
+        generation_id = request.args.get('id')
+        status = generation_statuses.get(generation_id) if generation_id else latest_generation_status
+        if status is None:
+            # Unknown or expired id: report an idle run so the client stops polling
+            status = GenerationStatus()
+        # Read is_generating first: a finished run has already stored its final_url_key
+        is_generating = status.is_generating
+        completed_types = list(status.completed_types)
+        total_types = list(status.total_types)
+        
+        # Calculate progress percentage based on completed types vs total types
+        progress_percentage = 0
+        if total_types:
+            progress_percentage = (len(completed_types) / len(total_types)) * 100
+            
+        # Ensure progress is a valid number between 0-100
+        if math.isnan(progress_percentage) or progress_percentage < 0:
             progress_percentage = 0
-            if generation_status['total_types']:
-                progress_percentage = (len(generation_status['completed_types']) / len(generation_status['total_types'])) * 100
-                
-            # Ensure progress is a valid number between 0-100
-            if math.isnan(progress_percentage) or progress_percentage < 0:
-                progress_percentage = 0
-            elif progress_percentage > 100:
-                progress_percentage = 100
-            
-            response = {
-                'is_generating': generation_status['is_generating'],
-                'completed_types': list(generation_status['completed_types']),
-                'total_types': list(generation_status['total_types']),
-                'progress_percentage': progress_percentage,
-                'files_ready': not generation_status['is_generating'],
-                'phase': generation_status.get('phase', ''),
-                'current_test_type': generation_status.get('current_test_type', ''),
-                'log': list(generation_status.get('log', [])),
-                'final_url_key': generation_status.get('final_url_key', '')  # Include final URL key when available
-            }
-            logger.info(f"Generation status response - final_url_key: {response['final_url_key']}")
+        elif progress_percentage > 100:
+            progress_percentage = 100
+        
+        response = {
+            'is_generating': is_generating,
+            'completed_types': completed_types,
+            'total_types': total_types,
+            'progress_percentage': progress_percentage,
+            'files_ready': not is_generating,
+            'phase': status.phase,
+            'current_test_type': status.current_test_type,
+            'log': list(status.log),
+            'final_url_key': status.final_url_key  # Include final URL key when available
+        }
+        logger.info("Generation status response - final_url_key: %s", response['final_url_key'])
         return jsonify(response)
     except Exception as e:
-        logger.error(f"Error getting generation status: {str(e)}")
+        logger.error("Error getting generation status: %s", e)
         return jsonify({'error': str(e), 'progress_percentage': 0, 'is_generating': False, 'files_ready': True}), 500
 
+def load_direct_test_data(doc, response_data):
+    """Fill response_data for Image and URL documents that store test_data as a list"""
+    logger.info("Found direct test_data list for %s source type", doc.get('source_type', 'unknown'))
+    response_data['test_data'] = doc['test_data']
+    
+    # For URL source type, use the actual URL as item_id instead of file keys
+    if doc.get('source_type') == 'url' and 'url' in doc:
+        doc['item_ids'] = [doc['url']]
+        logger.info("Set URL as item_id: %s", doc['url'])
+    # For Image source type, use a descriptive identifier
+    elif doc.get('source_type') == 'image':
+        doc['item_ids'] = ['Uploaded Image']
+        logger.info("Set Image item_id: Uploaded Image")
+    
+    response_data['document'] = doc
+    logger.info("Successfully loaded %s test cases from direct test_data", len(doc['test_data']))
+
+def load_nested_url_test_data(doc, nested_test_data, response_data):
+    """Fill response_data from URL data nested under test_data; returns True when loaded"""
+    logger.info("Found URL data with nested structure")
+    
+    # Extract the actual test cases from the nested structure
+    if 'test_data' in nested_test_data and isinstance(nested_test_data['test_data'], list):
+        response_data['test_data'] = nested_test_data['test_data']
+        
+        # Set the source type and URL from the nested structure
+        doc['source_type'] = nested_test_data['source_type']
+        doc['url'] = nested_test_data.get('url', '')
+        doc['item_ids'] = [nested_test_data.get('url', '')]
+        
+        response_data['document'] = doc
+        logger.info("Successfully loaded %s URL test cases from nested structure", len(nested_test_data['test_data']))
+        return True
+    return False
+
+def load_nested_image_test_data(doc, nested_test_data, response_data):
+    """Fill response_data from Image data nested under test_data; returns True when loaded"""
+    logger.info("Found Image data with nested structure")
+    
+    # Extract the actual test cases from the nested structure
+    if 'test_data' in nested_test_data and isinstance(nested_test_data['test_data'], list):
+        response_data['test_data'] = nested_test_data['test_data']
+        
+        # Set the source type and image_id from the nested structure
+        doc['source_type'] = nested_test_data['source_type']
+        doc['image_id'] = nested_test_data.get('image_id', '')
+        doc['item_ids'] = ['Uploaded Image']
+        
+        response_data['document'] = doc
+        logger.info("Successfully loaded %s Image test cases from nested structure", len(nested_test_data['test_data']))
+        return True
+    return False
+
+# Loaders for nested test_data dicts, keyed on the nested source_type
+NESTED_TEST_DATA_LOADERS = {
+    'url': load_nested_url_test_data,
+    'image': load_nested_image_test_data
+}
+
 @app.route('/api/shared-status', methods=['GET'])
 def get_shared_status():
     try:
@@ -2208,8 +2436,8 @@ def get_shared_status():
         if not url_key:
             return jsonify({'error': 'Missing URL key parameter'}), 400
             
-        logger.info(f"Fetching shared status for URL key: {url_key}")
-        mongo_handler = MongoHandler()
+        logger.info("Fetching shared status for URL key: %s", url_key)
+        mongo_handler = get_mongo_handler()
         
         # Get all status values for the test cases in this document
         # Force refresh from database rather than using cached data
@@ -2232,16 +2460,20 @@ def get_shared_status():
                 response_data['document'] = doc
                 
                 if 'test_data' in doc:
+                    # Bind the lookups shared by every branch below; writes still go through doc
+                    test_data = doc['test_data']
+                    source_type = doc.get('source_type') or ''
+                    
                     # Check for different document structures
-                    if 'files' in doc['test_data']:
-                        response_data['files'] = doc['test_data']['files']
+                    if 'files' in test_data:
+                        response_data['files'] = test_data['files']
                         
                         # Extract item IDs from files structure
-                        files_data = doc['test_data']['files']
+                        files_data = test_data['files']
                         if files_data:
                             # Extract item IDs from file keys
                             item_ids = list(files_data.keys())
-                            logger.info(f"Extracted item IDs from files: {item_ids}")
+                            logger.info("Extracted item IDs from files: %s", item_ids)
                             
                             # Update the document with proper item_ids
                             doc['item_ids'] = item_ids
@@ -2250,30 +2482,29 @@ def get_shared_status():
                                 del doc['item_id']
                             
                             # Add source_type from test_data if available
-                            if 'source_type' in doc['test_data']:
-                                doc['source_type'] = doc['test_data']['source_type']
-                                logger.info(f"Added source_type to document: {doc['source_type']}")
+                            if 'source_type' in test_data:
+                                doc['source_type'] = test_data['source_type']
+                                logger.info("Added source_type to document: %s", doc['source_type'])
                             else:
                                 # Set default source type based on context
                                 doc['source_type'] = 'Jira'
-                                logger.info(f"Using default source_type: Jira")
+                                logger.info("Using default source_type: Jira")
                             
                             # Update response_data document
                             response_data['document'] = doc
                         
                         # Extract test cases from files structure
                         try:
-                            from utils.file_handler import parse_traditional_format
                             # Get test cases from ALL files, not just the first one
                             all_test_cases = []
                             
                             # Process each file to get test cases
                             for file_key, file_data in files_data.items():
-                                logger.info(f"Processing file: {file_key}")
+                                logger.info("Processing file: %s", file_key)
                                 
                                 if 'test_cases' in file_data and isinstance(file_data['test_cases'], str):
                                     test_cases_content = file_data['test_cases']
-                                    logger.info(f"Found test cases content for {file_key} (length: {len(test_cases_content)})")
+                                    logger.info("Found test cases content for %s (length: %s)", file_key, len(test_cases_content))
                                     
                                     parsed_test_cases = parse_traditional_format(test_cases_content)
                                     if parsed_test_cases:
@@ -2283,95 +2514,49 @@ def get_shared_status():
                                                 tc['Title'] = f"{tc['Title']} ({file_key})"
                                         
                                         all_test_cases.extend(parsed_test_cases)
-                                        logger.info(f"Successfully parsed {len(parsed_test_cases)} test cases from {file_key}")
+                                        logger.info("Successfully parsed %s test cases from %s", len(parsed_test_cases), file_key)
                                     else:
-                                        logger.warning(f"No test cases parsed from {file_key}")
+                                        logger.warning("No test cases parsed from %s", file_key)
                                 else:
-                                    logger.warning(f"No test_cases string found in {file_key}")
+                                    logger.warning("No test_cases string found in %s", file_key)
                             
                             if all_test_cases:
                                 response_data['test_data'] = all_test_cases
-                                logger.info(f"Successfully combined {len(all_test_cases)} total test cases from all files")
+                                logger.info("Successfully combined %s total test cases from all files", len(all_test_cases))
                                 # Don't process test_cases array if we successfully processed files
                                 return jsonify(response_data)
                             else:
                                 logger.warning("No test cases found in any files")
                         except Exception as e:
-                            logger.warning(f"Error parsing test cases from files: {e}")
-                            import traceback
-                            logger.warning(f"Traceback: {traceback.format_exc()}")
+                            # exc_info defers traceback formatting to the handler that emits the record
+                            logger.warning("Error parsing test cases from files: %s", e, exc_info=True)
                             
                     # Handle Image and URL source types that store test_data directly
-                    elif 'test_data' in doc and isinstance(doc['test_data'], list):
-                        logger.info(f"Found direct test_data list for {doc.get('source_type', 'unknown')} source type")
-                        response_data['test_data'] = doc['test_data']
-                        
-                        # For URL source type, use the actual URL as item_id instead of file keys
-                        if doc.get('source_type') == 'url' and 'url' in doc:
-                            doc['item_ids'] = [doc['url']]
-                            logger.info(f"Set URL as item_id: {doc['url']}")
-                        # For Image source type, use a descriptive identifier
-                        elif doc.get('source_type') == 'image':
-                            doc['item_ids'] = ['Uploaded Image']
-                            logger.info(f"Set Image item_id: Uploaded Image")
-                        
-                        response_data['document'] = doc
-                        logger.info(f"Successfully loaded {len(doc['test_data'])} test cases from direct test_data")
-                        return jsonify(response_data)
+                    elif isinstance(test_data, list):
+                        # Fast path: list documents never reach the test_cases conversion below
+                        load_direct_test_data(doc, response_data)
+                        return no_cache(jsonify(response_data))
                     
                     # Handle nested test_data structure (URL generation stores data this way)
-                    elif 'test_data' in doc and isinstance(doc['test_data'], dict):
-                        logger.info(f"Found nested test_data dict for {doc.get('source_type', 'unknown')} source type")
+                    elif isinstance(test_data, dict):
+                        logger.info("Found nested test_data dict for %s source type", source_type or 'unknown')
                         
-                        nested_test_data = doc['test_data']
+                        nested_source_type = test_data.get('source_type')
+                        loader = NESTED_TEST_DATA_LOADERS.get(nested_source_type)
                         
-                        # Check if this is URL data with nested structure (only when the document itself is URL type)
+                        # Only when the document itself is of the same type (or untyped)
                         if (
-                            (doc.get('source_type') in (None, '', 'url')) 
-                            and 'source_type' in nested_test_data 
-                            and nested_test_data['source_type'] == 'url'
-                        ):
-                            logger.info(f"Found URL data with nested structure")
-                            
-                            # Extract the actual test cases from the nested structure
-                            if 'test_data' in nested_test_data and isinstance(nested_test_data['test_data'], list):
-                                response_data['test_data'] = nested_test_data['test_data']
-                                
-                                # Set the source type and URL from the nested structure
-                                doc['source_type'] = nested_test_data['source_type']
-                                doc['url'] = nested_test_data.get('url', '')
-                                doc['item_ids'] = [nested_test_data.get('url', '')]
-                                
-                                response_data['document'] = doc
-                                logger.info(f"Successfully loaded {len(nested_test_data['test_data'])} URL test cases from nested structure")
-                                return jsonify(response_data)
-                        
-                        # Check if this is Image data with nested structure (only when the document itself is Image type)
-                        elif (
-                            (doc.get('source_type') in (None, '', 'image'))
-                            and 'source_type' in nested_test_data 
-                            and nested_test_data['source_type'] == 'image'
+                            loader
+                            and source_type in ('', nested_source_type)
+                            and loader(doc, test_data, response_data)
                         ):
-                            logger.info(f"Found Image data with nested structure")
-                            
-                            # Extract the actual test cases from the nested structure
-                            if 'test_data' in nested_test_data and isinstance(nested_test_data['test_data'], list):
-                                response_data['test_data'] = nested_test_data['test_data']
-                                
-                                # Set the source type and image_id from the nested structure
-                                doc['source_type'] = nested_test_data['source_type']
-                                doc['image_id'] = nested_test_data.get('image_id', '')
-                                doc['item_ids'] = ['Uploaded Image']
-                                
-                                response_data['document'] = doc
-                                logger.info(f"Successfully loaded {len(nested_test_data['test_data'])} Image test cases from nested structure")
-                                return jsonify(response_data)
+                            return jsonify(response_data)
                             
                     # Only process test_cases array if files processing failed
-                    if 'test_cases' in doc['test_data'] and isinstance(doc['test_data']['test_cases'], list):
+                    if 'test_cases' in test_data and isinstance(test_data['test_cases'], list):
                         # Handle the test_cases array structure
-                        test_cases_list = doc['test_data']['test_cases']
-                        logger.info(f"Found test_cases list with {len(test_cases_list)} items")
+                        test_cases_list = test_data['test_cases']
+                        logger.info("Found test_cases list with %s items", len(test_cases_list))
                         
                         # Convert the test_cases structure to the expected format
                         converted_test_cases = []
@@ -2381,7 +2566,6 @@ def get_shared_status():
                                 content = tc.get('content', '')
                                 if content and isinstance(content, str):
                                     # Try to parse this content as a test case
-                                    from utils.file_handler import parse_traditional_format
                                     parsed = parse_traditional_format(content)
                                     if parsed:
                                         converted_test_cases.extend(parsed)
@@ -2398,31 +2582,37 @@ def get_shared_status():
                         
                         if converted_test_cases:
                             response_data['test_data'] = converted_test_cases
-                            logger.info(f"Successfully converted {len(converted_test_cases)} test cases from test_cases structure")
-                            
-                    elif isinstance(doc['test_data'], list):
-                        # This is a shared view document with test data array
-                        response_data['test_data'] = doc['test_data']
+                            logger.info("Successfully converted %s test cases from test_cases structure", len(converted_test_cases))
             
         response = jsonify(response_data)
         
         # Add cache control headers to prevent caching
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
-        
-        return response
+        return no_cache(response)
     except Exception as e:
-        logger.error(f"Error retrieving shared status: {str(e)}")
+        logger.error("Error retrieving shared status: %s", e)
         return jsonify({'error': str(e)}), 500
 
 # Analytics tracking endpoints
+# Seconds clients should wait before resending analytics when the writer queue is full
+TRACKING_RETRY_AFTER_SECONDS = 5
+
+def tracking_busy_response():
+    """503 with Retry-After, sent when analytics tracking is shedding load"""
+    response = jsonify({'error': 'Analytics tracking is busy, please retry later'})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(TRACKING_RETRY_AFTER_SECONDS)
+    return response
+
 @app.route('/api/analytics/track', methods=['POST'])
 def track_analytics():
     """Track user events and interactions"""
     try:
-        data = request.json
-        if not data:
+        # Decode the body with orjson directly; the body is not needed again, so skip caching it
+        try:
+            data = orjson.loads(request.get_data(cache=False) or b'null')
+        except orjson.JSONDecodeError:
+            return jsonify({'error': 'Invalid JSON body'}), 400
+        if not isinstance(data, dict) or not data:
             return jsonify({'error': 'No data provided'}), 400
         
         # Get client information
@@ -2437,22 +2627,18 @@ def track_analytics():
             "item_count": data.get("item_count", 0)
         }
 
+        mongo_handler = get_mongo_handler()
+
         # If authenticated, attach user_id for RBAC-aware analytics
-        auth_header = request.headers.get('Authorization')
-        if auth_header and auth_header.startswith('Bearer '):
-            try:
-                token = auth_header.split(' ')[1]
-                mh = MongoHandler()
-                verification = mh.verify_jwt_token(token)
-                if verification and verification.get('success'):
-                    event_user = verification['user']
-                    event_data['user_id'] = event_user.get('id')
-                    event_data['user_role'] = event_user.get('role')
-            except Exception:
-                pass
+        event_user = get_request_user()
+        if event_user:
+            event_data['user_id'] = event_user.get('id')
+            event_data['user_role'] = event_user.get('role')
         
-        mongo_handler = MongoHandler()
-        success = mongo_handler.track_event(event_data)
+        try:
+            success = mongo_handler.track_event(event_data)
+        except EventQueueFull:
+            return tracking_busy_response()
         
         if success:
             return jsonify({'success': True, 'message': 'Event tracked successfully'})
@@ -2460,44 +2646,46 @@ def track_analytics():
             return jsonify({'error': 'Failed to track event'}), 500
             
     except Exception as e:
-        logger.error(f"Error tracking analytics: {str(e)}")
+        logger.error("Error tracking analytics: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/analytics/session', methods=['POST'])
 def track_session():
     """Track user session and page visits"""
     try:
-        data = request.json
-        if not data:
+        headers = request.headers
+        
+        # Decode the body with orjson directly; the body is not needed again, so skip caching it
+        try:
+            data = orjson.loads(request.get_data(cache=False) or b'null')
+        except orjson.JSONDecodeError:
+            return jsonify({'error': 'Invalid JSON body'}), 400
+        if not isinstance(data, dict) or not data:
             return jsonify({'error': 'No data provided'}), 400
         
         # Get client information
         session_data = {
             "session_id": data.get("session_id"),
-            "user_agent": request.headers.get('User-Agent'),
+            "user_agent": headers.get('User-Agent'),
             "ip_address": request.remote_addr,
-            "referrer": request.headers.get('Referer'),
+            "referrer": headers.get('Referer'),
             "page_visited": data.get("page_visited"),
             "country": data.get("country"),
             "city": data.get("city")
         }
 
+        mongo_handler = get_mongo_handler()
+
         # Attach user if available
-        auth_header = request.headers.get('Authorization')
-        if auth_header and auth_header.startswith('Bearer '):
-            try:
-                token = auth_header.split(' ')[1]
-                mh = MongoHandler()
-                verification = mh.verify_jwt_token(token)
-                if verification and verification.get('success'):
-                    user = verification['user']
-                    session_data['user_id'] = user.get('id')
-                    session_data['user_role'] = user.get('role')
-            except Exception:
-                pass
+        user = get_request_user()
+        if user:
+            session_data['user_id'] = user.get('id')
+            session_data['user_role'] = user.get('role')
         
-        mongo_handler = MongoHandler()
-        success = mongo_handler.track_user_session(session_data)
+        try:
+            success = mongo_handler.track_user_session(session_data)
+        except EventQueueFull:
+            return tracking_busy_response()
         
         if success:
             return jsonify({'success': True, 'message': 'Session tracked successfully'})
@@ -2505,38 +2693,27 @@ def track_session():
             return jsonify({'error': 'Failed to track session'}), 500
             
     except Exception as e:
-        logger.error(f"Error tracking session: {str(e)}")
+        logger.error("Error tracking session: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/analytics/summary', methods=['GET'])
+@require_auth()
 def get_analytics_summary():
     """Get analytics summary with RBAC: admin gets system-wide, users get their own."""
     try:
-        # Verify auth token
-        auth_header = request.headers.get('Authorization')
-        mh = MongoHandler()
-        current_user = None
-        if auth_header and auth_header.startswith('Bearer '):
-            try:
-                token = auth_header.split(' ')[1]
-                user_info = mh.verify_jwt_token(token)
-                if user_info and user_info.get('success'):
-                    current_user = user_info['user']
-            except Exception:
-                pass
-
-        if not current_user:
-            return jsonify({'success': False, 'message': 'Authentication required'}), 401
+        args = request.args
+        current_user = g.current_user
+        mh = get_mongo_handler()
 
         # Parse date filters
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
+        start_date = args.get('start_date')
+        end_date = args.get('end_date')
         
         # Parse other filters
-        source_type = request.args.get('source_type')
+        source_type = args.get('source_type')
         
         # Fallback to days parameter if no date range provided
-        days = request.args.get('days', 30, type=int)
+        days = args.get('days', 30, type=int)
         
         mongo_handler = mh
         
@@ -2564,61 +2741,77 @@ def get_analytics_summary():
             return jsonify({'error': 'Failed to get analytics summary'}), 500
             
     except Exception as e:
-        logger.error(f"Error getting analytics summary: {str(e)}")
+        logger.error("Error getting analytics summary: %s", e)
         return jsonify({'error': str(e)}), 500
 
+def parse_ymd(value):
+    """Parse a YYYY-MM-DD string directly instead of going through strptime"""
+    return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+
+def bounded_int_arg(name, default, lo, hi):
+    """Query-string integer clamped to [lo, hi]; default when missing or not a plain number"""
+    value = request.args.get(name)
+    # isdigit() rejects bad input without building a ValueError
+    if value is None or not value.isdigit():
+        return default
+    number = int(value)
+    return lo if number < lo else hi if number > hi else number
+
+def parse_iso_datetime(value):
+    """Parse an ISO 8601 string, accepting a trailing 'Z' for UTC"""
+    try:
+        # Python 3.11+ parses the 'Z' suffix natively, with no intermediate string
+        return datetime.fromisoformat(value)
+    except ValueError:
+        if value.endswith('Z'):
+            return datetime.fromisoformat(value[:-1] + '+00:00')
+        raise
+
 @app.route('/api/analytics/detailed', methods=['GET'])
+@require_auth(admin=True)
 def get_detailed_analytics():
     """Get detailed analytics with filters. Admin only."""
     try:
-        # RBAC: admin only
-        auth_header = request.headers.get('Authorization')
-        if not (auth_header and auth_header.startswith('Bearer ')):
-            return jsonify({'success': False, 'message': 'Authentication required'}), 401
-        mh = MongoHandler()
-        token = auth_header.split(' ')[1]
-        verification = mh.verify_jwt_token(token)
-        if not verification or not verification.get('success') or verification['user'].get('role') != 'admin':
-            return jsonify({'success': False, 'message': 'Forbidden'}), 403
+        args = request.args
+        mh = get_mongo_handler()
 
         filters = {}
         
         # Parse date filters and normalize to full-day bounds
-        start_date = request.args.get('start_date')
+        start_date = args.get('start_date')
         if start_date:
             try:
                 # Support plain YYYY-MM-DD by anchoring to start of day
                 if len(start_date) == 10:
-                    filters['start_date'] = datetime.strptime(start_date, '%Y-%m-%d')
+                    filters['start_date'] = parse_ymd(start_date)
                 else:
-                    filters['start_date'] = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+                    filters['start_date'] = parse_iso_datetime(start_date)
             except Exception:
-                filters['start_date'] = datetime.strptime(start_date[:10], '%Y-%m-%d')
+                filters['start_date'] = parse_ymd(start_date[:10])
         
-        end_date = request.args.get('end_date')
+        end_date = args.get('end_date')
         if end_date:
             try:
                 if len(end_date) == 10:
                     # Make end inclusive by extending to end of day
-                    end_dt = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1) - timedelta(milliseconds=1)
+                    end_dt = parse_ymd(end_date) + timedelta(days=1) - timedelta(milliseconds=1)
                     filters['end_date'] = end_dt
                 else:
-                    filters['end_date'] = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+                    filters['end_date'] = parse_iso_datetime(end_date)
             except Exception:
-                end_dt = datetime.strptime(end_date[:10], '%Y-%m-%d') + timedelta(days=1) - timedelta(milliseconds=1)
+                end_dt = parse_ymd(end_date[:10]) + timedelta(days=1) - timedelta(milliseconds=1)
                 filters['end_date'] = end_dt
         
         # Parse other filters
-        event_type = request.args.get('event_type')
+        event_type = args.get('event_type')
         if event_type:
             filters['event_type'] = event_type
         
-        source_type = request.args.get('source_type')
+        source_type = args.get('source_type')
         if source_type:
             filters['source_type'] = source_type
         
-        mongo_handler = MongoHandler()
-        events = mongo_handler.get_detailed_analytics(filters)
+        events = mh.get_detailed_analytics(filters)
         
         if events is not None:
             return jsonify({'success': True, 'data': events})
@@ -2626,68 +2819,36 @@ def get_detailed_analytics():
             return jsonify({'error': 'Failed to get detailed analytics'}), 500
             
     except Exception as e:
-        logger.error(f"Error getting detailed analytics: {str(e)}")
+        logger.error("Error getting detailed analytics: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/test-cases/recent', methods=['GET'])
+@require_auth()
 def get_recent_test_cases():
     """Get recent test cases for the authenticated user"""
     try:
-        # Verify auth token
-        auth_header = request.headers.get('Authorization')
-        if not (auth_header and auth_header.startswith('Bearer ')):
-            return jsonify({'success': False, 'message': 'Authentication required'}), 401
-        
-        mh = MongoHandler()
-        token = auth_header.split(' ')[1]
-        user_info = mh.verify_jwt_token(token)
-        
-        if not user_info or not user_info.get('success'):
-            return jsonify({'success': False, 'message': 'Invalid token'}), 401
-        
-        user_id = user_info['user']['id']
+        mh = get_mongo_handler()
+        user_id = g.current_user['id']
         
         # Get recent test cases for this user
         test_cases = mh.get_user_test_cases(user_id, limit=10)
         
-        if test_cases:
-            # Convert ObjectId to string for JSON serialization
-            for tc in test_cases:
-                if '_id' in tc:
-                    tc['_id'] = str(tc['_id'])
-                if 'created_at' in tc:
-                    tc['created_at'] = tc['created_at'].isoformat()
-            
-            return jsonify({
-                'success': True,
-                'test_cases': test_cases
-            })
-        else:
-            return jsonify({
-                'success': True,
-                'test_cases': []
-            })
+        # orjson writes created_at as ISO 8601 natively and default=str covers ObjectId,
+        # so the documents are serialized as-is without a conversion pass
+        return app.response_class(
+            orjson.dumps({'success': True, 'test_cases': test_cases or []}, default=str),
+            mimetype='application/json'
+        )
             
     except Exception as e:
-        logger.error(f"Error getting recent test cases: {str(e)}")
+        logger.error("Error getting recent test cases: %s", e)
         return jsonify({'success': False, 'message': 'Failed to retrieve test cases'}), 500
 
 @app.route('/api/analytics/errors', methods=['GET'])
+@require_auth(admin=True)
 def get_error_analytics():
     """Get error analytics from MongoDB (admin only)"""
     try:
-        # RBAC: admin only
-        auth_header = request.headers.get('Authorization')
-        if not (auth_header and auth_header.startswith('Bearer ')):
-            return jsonify({'success': False, 'message': 'Authentication required'}), 401
-        mh = MongoHandler()
-        token = auth_header.split(' ')[1]
-        verification = mh.verify_jwt_token(token)
-        if not verification or not verification.get('success') or verification['user'].get('role') != 'admin':
-            return jsonify({'success': False, 'message': 'Forbidden'}), 403
-        
-        from utils.error_logger import error_logger
-        
         # Get query parameters
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
@@ -2703,7 +2864,7 @@ def get_error_analytics():
                 # Use the larger of the calculated days or 30 as fallback
                 days = max(days_diff, 30)
             except Exception as e:
-                logger.warning(f"Error parsing date range, using default 30 days: {e}")
+                logger.warning("Error parsing date range, using default 30 days: %s", e)
                 days = 30
         else:
             # Fallback to days parameter if no date range provided
@@ -2723,9 +2884,15 @@ def get_error_analytics():
         return jsonify({'success': True, 'data': error_summary})
         
     except Exception as e:
-        logger.error(f"Error getting error analytics: {str(e)}")
+        logger.error("Error getting error analytics: %s", e)
         return jsonify({'error': str(e)}), 500
 
+# Top-level fields returned by /api/mongo-document
+MONGO_DOCUMENT_PROJECTION = {
+    "_id": 1, "url_key": 1, "test_data": 1, "source_type": 1, "item_id": 1, "item_ids": 1,
+    "url": 1, "status": 1, "status_timestamps": 1, "created_at": 1
+}
+
 @app.route('/api/mongo-document/<url_key>', methods=['GET'])
 def get_mongo_document(url_key):
     """Get MongoDB document content directly"""
@@ -2733,13 +2900,16 @@ def get_mongo_document(url_key):
         if not url_key:
             return jsonify({'error': 'Missing URL key parameter'}), 400
             
-        logger.info(f"Retrieving MongoDB document for URL key: {url_key}")
-        mongo_handler = MongoHandler()
-        
-        # Try to get the document by url_key or _id (for short tokens)
-        doc = mongo_handler.collection.find_one({"url_key": url_key})
-        if not doc:
-            doc = mongo_handler.collection.find_one({"_id": url_key})
+        logger.info("Retrieving MongoDB document for URL key: %s", url_key)
+        mongo_handler = get_mongo_handler()
+        
+        # Both branches of the $or are index lookups: _id implicitly, url_key via url_key_unique
+        # Get the document by url_key or _id (for short tokens) in one round trip,
+        # fetching only the fields the results page reads
+        doc = mongo_handler.collection.find_one(
+            {"$or": [{"url_key": url_key}, {"_id": url_key}]},
+            MONGO_DOCUMENT_PROJECTION
+        )
         if not doc:
             return jsonify({'error': 'Document not found'}), 404
             
@@ -2756,13 +2926,9 @@ def get_mongo_document(url_key):
         response = jsonify(response_data)
         
         # Add cache control headers to prevent caching
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
-        
-        return response
+        return no_cache(response)
     except Exception as e:
-        logger.error(f"Error retrieving MongoDB document: {str(e)}")
+        logger.error("Error retrieving MongoDB document: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/notify-status-change', methods=['GET'])
@@ -2776,19 +2942,20 @@ def notify_status_change():
             return jsonify({'error': 'Missing URL key parameter'}), 400
             
         # Log the notification
-        logger.info(f"Received status change notification for key={url_key}, testCaseId={test_case_id}, status={status}")
+        logger.info("Received status change notification for key=%s, testCaseId=%s, status=%s", url_key, test_case_id, status)
         
         # Update a special flag in MongoDB to indicate status has changed
         # This can be used to trigger immediate sync in other views
+        now = datetime.utcnow()
         mongo_handler.collection.update_one(
             {"url_key": url_key},
             {
                 "$set": {
-                    "status_updated_at": datetime.utcnow(),
+                    "status_updated_at": now,
                     "last_status_change": {
                         "test_case_id": test_case_id,
                         "status": status,
-                        "timestamp": datetime.utcnow()
+                        "timestamp": now
                     }
                 }
             }
@@ -2801,13 +2968,9 @@ def notify_status_change():
         })
         
         # Add cache control headers to prevent caching
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
-        
-        return response
+        return no_cache(response)
     except Exception as e:
-        logger.error(f"Error processing status change notification: {str(e)}")
+        logger.error("Error processing status change notification: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/debug/force-sync', methods=['GET'])
@@ -2819,10 +2982,10 @@ def debug_force_sync():
             return jsonify({'error': 'Missing URL key parameter'}), 400
             
         # logger.info(f"DEBUG: Forcing status sync for URL key: {url_key}")
-        mongo_handler = MongoHandler()
+        mongo_handler = get_mongo_handler()
         
-        # Get the document
-        doc = mongo_handler.collection.find_one({"url_key": url_key})
+        # Get the document; only test_data is needed to rebuild the status values
+        doc = mongo_handler.collection.find_one({"url_key": url_key}, {"test_data": 1})
         if not doc:
             return jsonify({'error': 'Document not found'}), 404
             
@@ -2836,64 +2999,47 @@ def debug_force_sync():
         # logger.info(f"DEBUG: Document is shared view: {is_shared_view}")
         
         # Get current status values from the document
-        updated_status = {}
-        
         if is_shared_view:
             # Shared view - test_data is a list of test case objects
-            for i, tc in enumerate(doc['test_data']):
-                title = tc.get('Title', '')
-                status = tc.get('Status', '')
-                if title:
-                    # logger.info(f"DEBUG: Shared view TC[{i}]: {title} = {status}")
-                    updated_status[title] = status
-                    
-            # Update all status values in the document too
-            # Directly update the status field of each test case in the list
-            for i, tc in enumerate(doc['test_data']):
-                title = tc.get('Title', '')
-                if title in updated_status:
-                    # logger.info(f"DEBUG: Updating TC[{i}] status: {title} = {updated_status[title]}")
-                    mongo_handler.collection.update_one(
-                        {"url_key": url_key},
-                        {"$set": {f"test_data.{i}.Status": updated_status[title]}}
-                    )
-        else:
+            test_cases = doc['test_data']
+            titles = [tc.get('Title', '') for tc in test_cases]
+            statuses = [tc.get('Status', '') for tc in test_cases]
+            status_path = "test_data.{}.Status"
+        elif 'test_data' in doc and 'test_cases' in doc['test_data']:
             # Main view - test_data.test_cases is a list of test case objects
-            if 'test_data' in doc and 'test_cases' in doc['test_data']:
-                for i, tc in enumerate(doc['test_data']['test_cases']):
-                    title = tc.get('Title', tc.get('title', ''))
-                    status = tc.get('Status', tc.get('status', ''))
-                    if title:
-                        # logger.info(f"DEBUG: Main view TC[{i}]: {title} = {status}")
-                        updated_status[title] = status
-                        
-                # Update all status values in the document too
-                # Directly update the status field of each test case in the list
-                for i, tc in enumerate(doc['test_data']['test_cases']):
-                    title = tc.get('Title', tc.get('title', ''))
-                    if title in updated_status:
-                        # logger.info(f"DEBUG: Updating TC[{i}] status: {title} = {updated_status[title]}")
-                        mongo_handler.collection.update_one(
-                            {"url_key": url_key},
-                            {"$set": {f"test_data.test_cases.{i}.status": updated_status[title]}}
-                        )
+            test_cases = doc['test_data']['test_cases']
+            titles = [tc.get('Title', tc.get('title', '')) for tc in test_cases]
+            statuses = [tc.get('Status', tc.get('status', '')) for tc in test_cases]
+            status_path = "test_data.test_cases.{}.status"
+        else:
+            titles = statuses = []
+            status_path = None
+        
+        # Later duplicates of a title win, as before
+        updated_status = {title: status for title, status in zip(titles, statuses) if title}
+        
+        # Update all status values in the document too
+        # Directly update the status field of each titled test case in the list
+        sync_ops = [
+            UpdateOne({"url_key": url_key}, {"$set": {status_path.format(i): updated_status[title]}})
+            for i, title in enumerate(titles) if title
+        ]
                     
-        # Update the central status dictionary
+        # Flag the forced sync; $inc avoids the racy read-then-write of the counter
+        sync_update = {"status_force_synced_at": datetime.utcnow()}
+        
+        # Update the central status dictionary in the same write
         if updated_status:
             # logger.info(f"DEBUG: Updating status dictionary with {len(updated_status)} values")
-            mongo_handler.collection.update_one(
-                {"url_key": url_key},
-                {"$set": {"status": updated_status}}
-            )
+            sync_update["status"] = updated_status
             
-        # Add a flag to indicate the sync was forced
-        mongo_handler.collection.update_one(
+        sync_ops.append(UpdateOne(
             {"url_key": url_key},
-            {"$set": {
-                "status_force_synced_at": datetime.now(),
-                "status_force_sync_count": doc.get("status_force_sync_count", 0) + 1
-            }}
-        )
+            {"$set": sync_update, "$inc": {"status_force_sync_count": 1}}
+        ))
+        
+        # Send every update in a single round trip
+        mongo_handler.collection.bulk_write(sync_ops, ordered=False)
         
         return jsonify({
             'success': True,
@@ -2902,41 +3048,39 @@ def debug_force_sync():
             'is_shared_view': is_shared_view
         })
     except Exception as e:
-        logger.error(f"Error during force sync: {str(e)}")
+        logger.error("Error during force sync: %s", e)
         return jsonify({'error': str(e)}), 500
 
+# Load balancers poll /health constantly; reuse the last payload for a few seconds
+health_cache = TTLCache(maxsize=1, ttl=5)
+
 @app.route('/health')
 def health_check():
     """Health check endpoint for cloud deployment"""
     try:
-        # Check MongoDB connection
-        mongo_status = "OK"
-        try:
-            if mongo_handler:
-                # Try a simple operation
-                mongo_handler.collection.find_one()
-            else:
-                mongo_status = "Not initialized"
-        except Exception as e:
-            mongo_status = f"Error: {str(e)}"
-        
-        # Check file system
-        fs_status = "OK"
-        try:
-            base_dir = os.path.dirname(__file__)
-            generated_dir = os.path.join(base_dir, 'tests', 'generated')
-            if not os.path.exists(generated_dir):
-                os.makedirs(generated_dir, exist_ok=True)
-        except Exception as e:
-            fs_status = f"Error: {str(e)}"
+        payload = health_cache.get('health')
+        if payload is None:
+            # Check MongoDB connection
+            mongo_status = "OK"
+            try:
+                if mongo_handler:
+                    # ping is answered by the server without touching a collection
+                    mongo_handler.client.admin.command('ping')
+                else:
+                    mongo_status = "Not initialized"
+            except Exception as e:
+                mongo_status = f"Error: {str(e)}"
+            
+            payload = {
+                'status': 'healthy',
+                'timestamp': datetime.now().isoformat(),
+                'mongodb': mongo_status,
+                'filesystem': generated_dir_status,
+                'environment': 'production' if os.getenv('RENDER') else 'development'
+            }
+            health_cache.set('health', payload)
         
-        return jsonify({
-            'status': 'healthy',
-            'timestamp': datetime.now().isoformat(),
-            'mongodb': mongo_status,
-            'filesystem': fs_status,
-            'environment': 'production' if os.getenv('RENDER') else 'development'
-        })
+        return jsonify(payload)
     except Exception as e:
         return jsonify({
             'status': 'unhealthy',
@@ -2944,17 +3088,122 @@ def health_check():
             'timestamp': datetime.now().isoformat()
         }), 500
 
+def credential_cache_key(*parts):
+    """Hash credentials into a cache key so raw secrets are never held as dict keys"""
+    return hashlib.blake2b('\x1f'.join(str(part) for part in parts).encode('utf-8'), digest_size=16).hexdigest()
+
+def if_none_match_contains(etag):
+    """Whether If-None-Match names etag; flask-compress sends compressed bodies
+    with the ETag rewritten to "<etag>:<algorithm>", so the suffix is ignored"""
+    if_none_match = request.if_none_match
+    if if_none_match.star_tag:
+        return True
+    return any(tag.split(':', 1)[0] == etag for tag in if_none_match.as_set(include_weak=True))
+
+def cache_successful_response(cache, key_parts, cache_control=None, etag=False):
+    """Serve a view's 200 responses from cache, keyed on the credential parts key_parts() returns.
+
+    Error responses are never cached so a fixed credential takes effect immediately.
+    cache_control, when given, is sent on every 200 response so browsers can cache too.
+    With etag=True the body hash is sent as an ETag and a matching If-None-Match gets a 304.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = credential_cache_key(fn.__name__, *key_parts())
+            cached = cache.get(key)
+            if cached is not None:
+                body, body_etag = cached
+                response = None
+            else:
+                rv = fn(*args, **kwargs)
+                response, status = rv if isinstance(rv, tuple) else (rv, None)
+                if (status or response.status_code) != 200 or not response.is_json:
+                    return rv
+                body = response.get_data()
+                body_etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+                cache.set(key, (body, body_etag))
+            if etag and if_none_match_contains(body_etag):
+                response = app.response_class(status=304)
+            elif response is None:
+                response = app.response_class(body, mimetype='application/json')
+            if etag:
+                response.set_etag(body_etag)
+            if cache_control:
+                response.headers['Cache-Control'] = cache_control
+            return response
+        return wrapper
+    return decorator
+
+def request_credentials():
+    """Credential fields posted to the Jira/Azure verify and fetch endpoints"""
+    data = request.get_json(silent=True) or {}
+    return [
+        str(data.get(field) or '').strip()
+        for field in ('jiraUrl', 'jiraUser', 'jiraToken', 'azureUrl', 'azureOrg', 'azureProject', 'azurePat')
+    ]
+
+# Successful credential verifications, reused for 30 seconds
+verification_cache = TTLCache(maxsize=256, ttl=30)
+
+# Jira/Azure suggestion lists per credential set, reused for a minute
+fetch_items_cache = TTLCache(maxsize=128, ttl=60)
+
+# Jira/Azure clients per credential set, keyed on the hashed credentials
+upstream_client_cache = TTLCache(maxsize=64, ttl=30 * 60)
+
+def get_jira_client(jira_url, jira_user, jira_token):
+    """JiraClient per credential set, so its keep-alive session survives across requests"""
+    return upstream_client_cache.get_or_compute(
+        credential_cache_key('jira', jira_url, jira_user, jira_token),
+        lambda: JiraClient(jira_url, jira_user, jira_token)
+    )
+
+def get_azure_client(azure_url, azure_org, azure_pat):
+    """AzureClient per credential set, so its keep-alive session survives across requests"""
+    return upstream_client_cache.get_or_compute(
+        credential_cache_key('azure', azure_url, azure_org, azure_pat),
+        lambda: AzureClient(azure_url, azure_org, azure_pat)
+    )
+
+# Statuses offered as suggestions. JQL and WIQL compare status names
+# case-insensitively, so casing variants would only repeat the same clause.
+JIRA_SUGGESTION_STATUSES = ('To Do', 'Ready for QA')
+AZURE_SUGGESTION_STATES = ('Ready for QA', 'Re-open', 'Reopened', 'Re-opened')
+
+@lru_cache(maxsize=4)
+def get_openai_client(api_key):
+    """OpenAI client per API key, so its HTTP connection pool survives across requests"""
+    return OpenAI(api_key=api_key)
+
+# OpenAI error classification: one case-insensitive scan of the message, then the
+# details of the highest-priority bucket that matched (order matters)
+OPENAI_ERROR_RE = re.compile(r'authentication|api key|rate limit|quota', re.IGNORECASE)
+OPENAI_ERROR_DETAILS = (
+    ('authentication', "Invalid API key or authentication issue"),
+    ('api key', "Invalid API key or authentication issue"),
+    ('rate limit', "Rate limited by OpenAI. Try again later or check your usage tier."),
+    ('quota', "You have exceeded your quota. Check your billing settings on OpenAI dashboard."),
+)
+DEFAULT_OPENAI_ERROR_DETAILS = "Check that your API key is valid and your account has sufficient credits"
+
+def classify_openai_error(error_message):
+    """Map an OpenAI error message to user-facing troubleshooting details"""
+    matched = {match.lower() for match in OPENAI_ERROR_RE.findall(error_message)}
+    if matched:
+        for keyword, details in OPENAI_ERROR_DETAILS:
+            if keyword in matched:
+                return details
+    return DEFAULT_OPENAI_ERROR_DETAILS
+
 @app.route('/api/verify-api-key')
+@cache_successful_response(verification_cache, lambda: [settings.OPENAI_API_KEY])
 def verify_api_key():
     """
     Endpoint to verify if the OpenAI API key is configured correctly
     """
-    import openai
-    import json
-    
     try:
-        # Get API key using lazy loading
-        from config.settings import OPENAI_API_KEY
+        OPENAI_API_KEY = settings.OPENAI_API_KEY
         # Check if API key exists
         if not OPENAI_API_KEY or OPENAI_API_KEY == "your_openai_api_key_here" or OPENAI_API_KEY == "missing_api_key":
             return jsonify({
@@ -2963,9 +3212,8 @@ def verify_api_key():
                 'details': 'Please configure a valid API key in your .env file. The API key should start with "sk-"'
             }), 400
             
-        # Try to initialize the client
-        from openai import OpenAI
-        client = OpenAI(api_key=OPENAI_API_KEY)
+        # Reuse the client for this key
+        client = get_openai_client(OPENAI_API_KEY)
         
         # Test the API key with a simple models list request
         try:
@@ -2999,7 +3247,7 @@ def verify_api_key():
                     'details': 'API responded without error but no data was returned'
                 }), 400
         except Exception as api_error:
-            logger.error(f"Error validating API key: {str(api_error)}")
+            logger.error("Error validating API key: %s", api_error)
             return jsonify({
                 'status': 'error',
                 'message': f'API verification failed: {str(api_error)}',
@@ -3008,14 +3256,7 @@ def verify_api_key():
             
     except Exception as e:
         error_message = str(e)
-        error_details = "Check that your API key is valid and your account has sufficient credits"
-        
-        if "authentication" in error_message.lower() or "api key" in error_message.lower():
-            error_details = "Invalid API key or authentication issue"
-        elif "rate limit" in error_message.lower():
-            error_details = "Rate limited by OpenAI. Try again later or check your usage tier."
-        elif "quota" in error_message.lower():
-            error_details = "You have exceeded your quota. Check your billing settings on OpenAI dashboard."
+        error_details = classify_openai_error(error_message)
             
         return jsonify({
             'status': 'error',
@@ -3032,14 +3273,14 @@ def setup_help():
 def shorten_url():
     try:
         url_params = request.json
-        logger.info(f"Received URL params for shortening: {url_params}")
+        logger.info("Received URL params for shortening: %s", url_params)
         
         if not url_params:
             logger.error("No URL parameters provided")
             return jsonify({'error': 'No URL parameters provided'}), 400
 
         # Check if this URL data already has a short key
-        mongo_handler = MongoHandler()
+        mongo_handler = get_mongo_handler()
         
         # Extract the key and files from the parameters
         existing_key = url_params.get('key')
@@ -3053,31 +3294,28 @@ def shorten_url():
         # If there's a key in the params and it's longer than 8 chars, 
         # check if we already have a short key for this data
         if existing_key and len(existing_key) > 8:
-            logger.info(f"Found long key {existing_key}, checking for existing short URL")
+            logger.info("Found long key %s, checking for existing short URL", existing_key)
             # Search for existing document with these params
-            existing_doc = mongo_handler.collection.find_one({
-                "url_params.files": files,
-                "url_params.item_ids": item_ids,
-                "type": "shortened_url"
-            })
-            if existing_doc:
-                logger.info(f"Found existing short URL: {existing_doc['_id']}")
+            existing_short_key = mongo_handler.find_shortened_url(files, item_ids)
+            if existing_short_key:
+                logger.info("Found existing short URL: %s", existing_short_key)
                 return jsonify({
-                    'shortened_url': f'/results?token={existing_doc["_id"]}'
+                    'shortened_url': f'/results?token={existing_short_key}'
                 })
 
         # Generate new short URL
         short_key = mongo_handler.save_url_data(url_params)
-        logger.info(f"Generated new short URL with key: {short_key}")
+        logger.info("Generated new short URL with key: %s", short_key)
         
         return jsonify({
             'shortened_url': f'/results?token={short_key}'
         })
     except Exception as e:
-        logger.error(f"Error creating shortened URL: {str(e)}")
+        logger.error("Error creating shortened URL: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/verify-jira', methods=['POST'])
+@cache_successful_response(verification_cache, request_credentials)
 def verify_jira_connection():
     """Verify Jira connection and credentials"""
     try:
@@ -3094,14 +3332,13 @@ def verify_jira_connection():
             jira_url = 'https://' + jira_url
         
         # Test connection by fetching user info
-        from jira.jira_client import JiraClient
-        jira_client = JiraClient(jira_url, jira_user, jira_token)
+        jira_client = get_jira_client(jira_url, jira_user, jira_token)
         
         # Try to get current user info
         user_info = jira_client.get_current_user()
         
         if user_info:
-            logger.info(f"Jira connection successful for user: {user_info.get('displayName', 'Unknown')}")
+            logger.info("Jira connection successful for user: %s", user_info.get('displayName', 'Unknown'))
             return jsonify({
                 'success': True,
                 'message': 'Connection successful',
@@ -3111,9 +3348,17 @@ def verify_jira_connection():
             return jsonify({'success': False, 'error': 'Could not authenticate with Jira'}), 401
             
     except Exception as e:
-        logger.error(f"Jira verification error: {str(e)}")
+        logger.error("Jira verification error: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# Pooled session for URL reachability probes so repeat hosts reuse their TCP/TLS connections
+url_probe_session = requests.Session()
+url_probe_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=Retry(total=1, backoff_factor=0.3))
+# Per attempt; with the single retry an unreachable host still fails in about 10s
+URL_PROBE_TIMEOUT_SECONDS = 5
+url_probe_session.mount('https://', url_probe_adapter)
+url_probe_session.mount('http://', url_probe_adapter)
+
 @app.route('/api/test-url', methods=['POST'])
 def test_url():
     """Test if a URL is accessible"""
@@ -3130,8 +3375,11 @@ def test_url():
             if not all([parsed_url.scheme, parsed_url.netloc]):
                 return jsonify({'success': False, 'error': 'Invalid URL format'}), 400
                 
-            # Try to access the URL
-            response = requests.get(url, timeout=10)
+            # Try to access the URL; HEAD skips downloading the body, GET is only
+            # needed for servers that do not implement HEAD
+            response = url_probe_session.head(url, timeout=URL_PROBE_TIMEOUT_SECONDS, allow_redirects=True)
+            if response.status_code in (405, 501):
+                response = url_probe_session.get(url, timeout=URL_PROBE_TIMEOUT_SECONDS)
             if response.status_code == 200:
                 return jsonify({'success': True, 'message': 'URL is accessible'})
             else:
@@ -3141,10 +3389,11 @@ def test_url():
             return jsonify({'success': False, 'error': 'Failed to connect to URL'}), 400
             
     except Exception as e:
-        logger.error(f"URL test error: {str(e)}")
+        logger.error("URL test error: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/verify-azure', methods=['POST'])
+@cache_successful_response(verification_cache, request_credentials)
 def verify_azure_connection():
     """Verify Azure DevOps connection and credentials"""
     try:
@@ -3162,14 +3411,13 @@ def verify_azure_connection():
             azure_url = 'https://' + azure_url
         
         # Test connection by fetching project info
-        from azure_integration.azure_client import AzureClient
-        azure_client = AzureClient(azure_url, azure_org, azure_pat)
+        azure_client = get_azure_client(azure_url, azure_org, azure_pat)
         
         # Try to get project info
         project_info = azure_client.get_project(azure_project)
         
         if project_info:
-            logger.info(f"Azure connection successful for project: {project_info.get('name', 'Unknown')}")
+            logger.info("Azure connection successful for project: %s", project_info.get('name', 'Unknown'))
             return jsonify({
                 'success': True,
                 'message': 'Connection successful',
@@ -3179,10 +3427,11 @@ def verify_azure_connection():
             return jsonify({'success': False, 'error': 'Could not authenticate with Azure DevOps'}), 401
             
     except Exception as e:
-        logger.error(f"Azure verification error: {str(e)}")
+        logger.error("Azure verification error: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/fetch-jira-items', methods=['POST'])
+@cache_successful_response(fetch_items_cache, request_credentials, cache_control='private, max-age=60', etag=True)
 def fetch_jira_items():
     """Fetch recent Jira items for suggestions"""
     try:
@@ -3198,17 +3447,10 @@ def fetch_jira_items():
         if not jira_url.startswith(('http://', 'https://')):
             jira_url = 'https://' + jira_url
         
-        from jira.jira_client import JiraClient
-        jira_client = JiraClient(jira_url, jira_user, jira_token)
+        jira_client = get_jira_client(jira_url, jira_user, jira_token)
         
         # Fetch all issues filtered by desired statuses
-        desired_statuses = [
-            'To Do',
-            'Ready for QA',
-            'Ready for Qa',  # case/variant safety
-            'Ready For QA'
-        ]
-        issues = jira_client.get_recent_issues(limit=None, statuses=desired_statuses)
+        issues = jira_client.get_recent_issues(limit=None, statuses=JIRA_SUGGESTION_STATUSES)
         
         if issues:
             # Format items for suggestions
@@ -3221,8 +3463,8 @@ def fetch_jira_items():
                     'status': issue.get('fields', {}).get('status', {}).get('name', '')
                 })
             
-            logger.info(f"Fetched {len(items)} Jira items for suggestions")
-            return jsonify({
+            logger.info("Fetched %s Jira items for suggestions", len(items))
+            return json_response({
                 'success': True,
                 'items': items
             })
@@ -3230,56 +3472,55 @@ def fetch_jira_items():
             return jsonify({'success': False, 'error': 'No issues found'}), 404
             
     except Exception as e:
-        logger.error(f"Error fetching Jira items: {str(e)}")
+        logger.error("Error fetching Jira items: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/fetch-azure-items', methods=['POST'])
+@cache_successful_response(fetch_items_cache, request_credentials, cache_control='private, max-age=60', etag=True)
 def fetch_azure_items():
     """Fetch recent Azure DevOps work items for suggestions"""
     try:
         data = request.json
-        logger.info(f"Received Azure data: {data}")
+        # Never log the payload itself: it carries the PAT
+        logger.debug("Received Azure data keys=%s", list(data.keys()) if isinstance(data, dict) else None)
         
         azure_url = data.get('azureUrl', '').strip()
         azure_org = data.get('azureOrg', '').strip()
         azure_project = data.get('azureProject', '').strip()
         azure_pat = data.get('azurePat', '').strip()
         
-        logger.info(f"Processed Azure fields - URL: '{azure_url}', Org: '{azure_org}', Project: '{azure_project}', PAT: {'*' * len(azure_pat) if azure_pat else 'None'}")
+        logger.debug("Processed Azure fields - URL: '%s', Org: '%s', Project: '%s', PAT provided: %s",
+                     azure_url, azure_org, azure_project, bool(azure_pat))
         
         if not azure_url or not azure_org or not azure_project or not azure_pat:
-            logger.error(f"Missing Azure fields - URL: {bool(azure_url)}, Org: {bool(azure_org)}, Project: {bool(azure_project)}, PAT: {bool(azure_pat)}")
+            logger.error("Missing Azure fields - URL: %s, Org: %s, Project: %s, PAT: %s",
+                         bool(azure_url), bool(azure_org), bool(azure_project), bool(azure_pat))
             return jsonify({'success': False, 'error': 'Missing required fields'}), 400
         
         # Add https:// if missing
         if not azure_url.startswith(('http://', 'https://')):
             azure_url = 'https://' + azure_url
         
-        from azure_integration.azure_client import AzureClient
-        azure_client = AzureClient(azure_url, azure_org, azure_pat)
+        # Shared per credential set: pass the project to each call instead of
+        # setting azure_project on the client
+        azure_client = get_azure_client(azure_url, azure_org, azure_pat)
         
-        # Set the project for this operation
-        azure_client.azure_project = azure_project
+        # The project access check and the work item query are independent,
+        # so run them concurrently instead of paying for two serial round-trips
+        logger.info("Testing Azure project access and fetching work items for project: %s", azure_project)
+        project_future = upstream_executor.submit(azure_client.get_project, azure_project)
+        items_future = upstream_executor.submit(azure_client.get_recent_work_items, azure_project, None, AZURE_SUGGESTION_STATES)
         
-        # Test project access first
-        logger.info(f"Testing Azure project access: {azure_project}")
-        project_info = azure_client.get_project(azure_project)
+        project_info = project_future.result()
         if not project_info:
-            logger.error(f"Failed to access Azure project: {azure_project}")
+            items_future.cancel()
+            logger.error("Failed to access Azure project: %s", azure_project)
             return jsonify({'success': False, 'error': f'Cannot access project {azure_project}. Please check your permissions.'}), 403
         
-        logger.info(f"Successfully accessed Azure project: {project_info.get('name', azure_project)}")
+        logger.info("Successfully accessed Azure project: %s", project_info.get('name', azure_project))
         
-        # Fetch all work items filtered by QA-ready/reopen states
-        logger.info(f"Fetching Azure work items for project: {azure_project} with QA-ready filters")
-        desired_states = [
-            'Ready for QA',
-            'Re-open',
-            'Reopened',
-            'Re-opened'  # include common variants
-        ]
-        work_items = azure_client.get_recent_work_items(azure_project, limit=None, states=desired_states)
-        logger.info(f"Retrieved {len(work_items) if work_items else 0} Azure work items")
+        work_items = items_future.result()
+        logger.info("Retrieved %d Azure work items", len(work_items) if work_items else 0)
         
         if work_items:
             # Format items for suggestions
@@ -3292,8 +3533,8 @@ def fetch_azure_items():
                     'status': item.get('fields', {}).get('System.State', '')
                 })
             
-            logger.info(f"Fetched {len(items)} Azure work items for suggestions")
-            return jsonify({
+            logger.info("Fetched %d Azure work items for suggestions", len(items))
+            return json_response({
                 'success': True,
                 'items': items
             })
@@ -3301,10 +3542,8 @@ def fetch_azure_items():
             return jsonify({'success': False, 'error': 'No work items found'}), 404
             
     except Exception as e:
-        logger.error(f"Error fetching Azure items: {str(e)}")
-        logger.error(f"Error type: {type(e)}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        # exc_info defers traceback formatting to the handler, only when the record is emitted
+        logger.error("Error fetching Azure items (%s): %s", type(e).__name__, e, exc_info=True)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/export-excel', methods=['POST'])
@@ -3323,30 +3562,49 @@ def export_excel():
         if not test_cases:
             return jsonify({'error': 'No test cases provided'}), 400
         
-        logger.info(f"Exporting {len(test_cases)} test cases to Excel for {source_type}")
+        logger.info("Exporting %s test cases to Excel for %s", len(test_cases), source_type)
         
-        # Create Excel file
-        from utils.file_handler import create_excel_report
-        excel_data = create_excel_report(test_cases, status_values, source_type, item_ids)
+        # Create Excel file in a spooled temp file (disk-backed once it grows) and
+        # stream it out in chunks rather than building one bytes blob
+        excel_file = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+        try:
+            create_excel_report(test_cases, status_values, source_type, item_ids, output=excel_file)
+        except Exception:
+            excel_file.close()
+            raise
+        excel_file.seek(0)
         
         # Generate filename
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"test_cases_{source_type}_{timestamp}.xlsx"
         
-        # Create response
-        from flask import Response
-        response = Response(
-            excel_data,
+        # send_file streams the file object and closes it when the response is done
+        return send_file(
+            excel_file,
             mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+            as_attachment=True,
+            download_name=filename
         )
         
-        return response
-        
     except Exception as e:
-        logger.error(f"Error exporting to Excel: {str(e)}")
+        logger.error("Error exporting to Excel: %s", e)
         return jsonify({'error': f'Export failed: {str(e)}'}), 500
 
+# Longest password accepted for new passwords; bounds the bcrypt input (DoS by huge passwords).
+# Sign-in does not enforce it so accounts created before the cap keep working
+MAX_PASSWORD_LENGTH = 128
+
+# bcrypt checks are CPU-bound; a pool sized to the cores caps how many run at
+# once so a burst of sign-ins cannot starve every other request
+auth_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix='auth')
+SIGNIN_TIMEOUT_SECONDS = 5
+
+# Sign-ins queued or running on auth_executor; past this, new ones get a 503
+# straight away instead of growing the executor's unbounded queue
+MAX_PENDING_SIGNINS = (os.cpu_count() or 4) * 4
+signin_slots = threading.BoundedSemaphore(MAX_PENDING_SIGNINS)
+SIGNIN_BUSY_MESSAGE = 'Login is temporarily busy, please try again'
+
 # Authentication API routes
 @app.route('/api/auth/signup', methods=['POST'])
 def signup_api():
@@ -3354,7 +3612,7 @@ def signup_api():
     try:
         data = request.json
         if not data:
-            return jsonify({'success': False, 'message': 'No data provided'}), 400
+            return NO_DATA_RESPONSE()
         
         name = data.get('name', '').strip()
         email = data.get('email', '').strip()
@@ -3370,8 +3628,11 @@ def signup_api():
         if not password or len(password) < 8:
             return jsonify({'success': False, 'message': 'Password must be at least 8 characters long'}), 400
         
+        if len(password) > MAX_PASSWORD_LENGTH:
+            return jsonify({'success': False, 'message': f'Password must be at most {MAX_PASSWORD_LENGTH} characters long'}), 400
+        
         # Create user
-        mongo_handler = MongoHandler()
+        mongo_handler = get_mongo_handler()
         result = mongo_handler.create_user(email, password, name)
         
         if result['success']:
@@ -3383,7 +3644,7 @@ def signup_api():
             return jsonify({'success': False, 'message': result['message']}), 400
             
     except Exception as e:
-        logger.error(f"Error in signup API: {str(e)}")
+        logger.error("Error in signup API: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred during registration'}), 500
 
 @app.route('/api/auth/signin', methods=['POST'])
@@ -3392,7 +3653,7 @@ def signin_api():
     try:
         data = request.json
         if not data:
-            return jsonify({'success': False, 'message': 'No data provided'}), 400
+            return NO_DATA_RESPONSE()
         
         email = data.get('email', '').strip()
         password = data.get('password', '')
@@ -3401,9 +3662,25 @@ def signin_api():
         if not email or not password:
             return jsonify({'success': False, 'message': 'Email and password are required'}), 400
         
-        # Authenticate user
-        mongo_handler = MongoHandler()
-        result = mongo_handler.authenticate_user(email, password)
+        # Authenticate user on the bounded bcrypt pool
+        mongo_handler = get_mongo_handler()
+        if not signin_slots.acquire(blocking=False):
+            logger.warning("Sign-in rejected, too many password verifications pending")
+            return jsonify({'success': False, 'message': SIGNIN_BUSY_MESSAGE}), 503
+        try:
+            future = auth_executor.submit(mongo_handler.authenticate_user, email, password)
+        except Exception:
+            signin_slots.release()
+            raise
+        # The slot is freed when the check finishes or is cancelled
+        future.add_done_callback(lambda _: signin_slots.release())
+        try:
+            result = future.result(timeout=SIGNIN_TIMEOUT_SECONDS)
+        except FutureTimeoutError:
+            # Drop the check if it has not started yet; a running one finishes on its own
+            future.cancel()
+            logger.warning("Sign-in timed out waiting for password verification")
+            return jsonify({'success': False, 'message': SIGNIN_BUSY_MESSAGE}), 503
         
         if result['success']:
             return jsonify({
@@ -3416,7 +3693,7 @@ def signin_api():
             return jsonify({'success': False, 'message': result['message']}), 401
             
     except Exception as e:
-        logger.error(f"Error in signin API: {str(e)}")
+        logger.error("Error in signin API: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred during login'}), 500
 
 @app.route('/api/auth/dashboard', methods=['GET'])
@@ -3425,80 +3702,52 @@ def dashboard_api():
     try:
         # Get token from Authorization header
         auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'success': False, 'message': 'Authorization token required'}), 401
+        if not auth_header or auth_header[:7] != 'Bearer ':
+            return TOKEN_REQUIRED_RESPONSE()
         
-        token = auth_header.split(' ')[1]
+        token = auth_header[7:].strip()
         
-        # Verify token and get user info
-        mongo_handler = MongoHandler()
-        user_info = mongo_handler.verify_jwt_token(token)
+        # Verify token (memoized per token, so dashboard polls skip the decode) and get user info
+        mongo_handler = get_mongo_handler()
+        user_info = verify_jwt_token_cached(token)
         
         if not user_info or not user_info.get('success'):
-            return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
+            return INVALID_TOKEN_RESPONSE()
         
         user_id = user_info['user']['id']
         
-        # Get user's test cases
-        test_cases = mongo_handler.get_user_test_cases(user_id)
+        # Recent test cases and their statistics come back from a single aggregation;
+        # created_at is stored in UTC, so the month boundary is computed in UTC too
+        month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        dashboard = mongo_handler.get_user_dashboard(user_id, month_start)
+        test_cases = dashboard['test_cases']
         
-        # Calculate statistics with robust datetime handling
-        total_count = len(test_cases)
-        current_month = datetime.now().month
-        current_year = datetime.now().year
-        
-        this_month_count = 0
         last_generated = 'Never'
-        
-        if test_cases:
-            for tc in test_cases:
-                created_at = tc.get('created_at')
-                if created_at:
-                    try:
-                        # Handle both string and datetime objects
-                        if isinstance(created_at, str):
-                            # Try parsing as ISO format
-                            parsed_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                        else:
-                            # It's already a datetime object
-                            parsed_date = created_at
-                        
-                        # Check if it's from current month/year
-                        if parsed_date.month == current_month and parsed_date.year == current_year:
-                            this_month_count += 1
-                            
-                    except Exception as e:
-                        logger.warning(f"Failed to parse date for test case {tc.get('_id')}: {str(e)}")
-                        continue
-            
-            # Find the latest test case
+        created_at = dashboard['latest_created_at']
+        if created_at:
             try:
-                latest = max(test_cases, key=lambda x: x.get('created_at', datetime.min))
-                if latest.get('created_at'):
-                    created_at = latest['created_at']
-                    if isinstance(created_at, str):
-                        last_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    else:
-                        last_date = created_at
-                    last_generated = last_date.strftime('%B %d, %Y')
+                # Handle both string and datetime objects
+                if isinstance(created_at, str):
+                    created_at = parse_iso_datetime(created_at)
+                last_generated = created_at.strftime('%B %d, %Y')
             except Exception as e:
-                logger.warning(f"Failed to determine latest test case: {str(e)}")
+                logger.warning("Failed to determine latest test case: %s", e)
                 last_generated = 'Unknown'
         
         stats = {
-            'total': total_count,
-            'this_month': this_month_count,
+            'total': dashboard['total'],
+            'this_month': dashboard['this_month'],
             'last_generated': last_generated
         }
         
-        return jsonify({
+        return json_response({
             'success': True,
             'test_cases': test_cases,
             'stats': stats
         })
         
     except Exception as e:
-        logger.error(f"Error in dashboard API: {str(e)}", exc_info=True)
+        logger.error("Error in dashboard API: %s", e, exc_info=True)
         return jsonify({'success': False, 'message': 'An error occurred while loading dashboard'}), 500
 
 @app.route('/api/auth/reset-password', methods=['POST'])
@@ -3507,7 +3756,7 @@ def reset_password_api():
     try:
         data = request.json
         if not data:
-            return jsonify({'success': False, 'message': 'No data provided'}), 400
+            return NO_DATA_RESPONSE()
         
         email = data.get('email', '').strip()
         
@@ -3516,7 +3765,7 @@ def reset_password_api():
             return jsonify({'success': False, 'message': 'Please provide a valid email address'}), 400
         
         # Check if user exists
-        mongo_handler = MongoHandler()
+        mongo_handler = get_mongo_handler()
         user = mongo_handler.users_collection.find_one({'email': email})
         
         if not user:
@@ -3530,7 +3779,7 @@ def reset_password_api():
         token_result = mongo_handler.create_password_reset_token(email)
         
         if not token_result['success']:
-            logger.error(f"Failed to create reset token for {email}: {token_result.get('message', 'Unknown error')}")
+            logger.error("Failed to create reset token for %s: %s", email, token_result.get('message', 'Unknown error'))
             return jsonify({
                 'success': True,
                 'message': 'If an account with that email exists, a password reset link has been sent.'
@@ -3538,8 +3787,6 @@ def reset_password_api():
         
         # Send password reset email
         try:
-            from utils.email_notifier import send_password_reset_email
-            
             email_sent = send_password_reset_email(
                 email=email,
                 reset_token=token_result['token'],
@@ -3547,15 +3794,15 @@ def reset_password_api():
             )
             
             if email_sent:
-                logger.info(f"Password reset email sent successfully to: {email}")
+                logger.info("Password reset email sent successfully to: %s", email)
             else:
-                logger.error(f"Failed to send password reset email to: {email}")
+                logger.error("Failed to send password reset email to: %s", email)
                 
         except Exception as email_error:
-            logger.error(f"Error sending password reset email to {email}: {str(email_error)}")
+            logger.error("Error sending password reset email to %s: %s", email, email_error)
             # Don't fail the request if email sending fails
         
-        logger.info(f"Password reset requested for email: {email}")
+        logger.info("Password reset requested for email: %s", email)
         
         return jsonify({
             'success': True,
@@ -3563,7 +3810,7 @@ def reset_password_api():
         })
             
     except Exception as e:
-        logger.error(f"Error in reset password API: {str(e)}")
+        logger.error("Error in reset password API: %s", e)
         capture_exception(e, {"endpoint": "/api/auth/reset-password", "email": data.get('email', '') if data else ''})
         return jsonify({'success': False, 'message': 'An error occurred during password reset'}), 500
 
@@ -3573,7 +3820,7 @@ def reset_password_confirm_api():
     try:
         data = request.json
         if not data:
-            return jsonify({'success': False, 'message': 'No data provided'}), 400
+            return NO_DATA_RESPONSE()
         
         token = data.get('token', '').strip()
         new_password = data.get('new_password', '').strip()
@@ -3589,268 +3836,196 @@ def reset_password_confirm_api():
         if len(new_password) < 6:
             return jsonify({'success': False, 'message': 'Password must be at least 6 characters long'}), 400
         
+        if len(new_password) > MAX_PASSWORD_LENGTH:
+            return jsonify({'success': False, 'message': f'Password must be at most {MAX_PASSWORD_LENGTH} characters long'}), 400
+        
         if new_password != confirm_password:
             return jsonify({'success': False, 'message': 'Passwords do not match'}), 400
         
         # Use the reset token to change password
-        mongo_handler = MongoHandler()
+        mongo_handler = get_mongo_handler()
         result = mongo_handler.use_password_reset_token(token, new_password)
         
         if result['success']:
-            logger.info(f"Password reset successfully completed for token: {token[:10]}...")
+            logger.info("Password reset successfully completed for token: %s...", token[:10])
             return jsonify({
                 'success': True,
                 'message': 'Password reset successfully. You can now sign in with your new password.'
             })
         else:
-            logger.warning(f"Password reset failed for token: {token[:10]}... - {result.get('message', 'Unknown error')}")
+            logger.warning("Password reset failed for token: %s... - %s", token[:10], result.get('message', 'Unknown error'))
             return jsonify({
                 'success': False,
                 'message': result.get('message', 'Failed to reset password')
             }), 400
             
     except Exception as e:
-        logger.error(f"Error in reset password confirm API: {str(e)}")
+        logger.error("Error in reset password confirm API: %s", e)
         capture_exception(e, {"endpoint": "/api/auth/reset-password-confirm", "token": data.get('token', '')[:10] if data else ''})
         return jsonify({'success': False, 'message': 'An error occurred during password reset'}), 500
 
 # Admin API endpoints
+
+# Admin-wide dashboard reads (identical for every admin), shared for 5 seconds so
+# polling from several tabs/admins costs one MongoDB read per interval
+admin_read_cache = TTLCache(maxsize=64, ttl=5)
+
+def collapsed_admin_read(name, compute):
+    """Serve an admin-wide read from admin_read_cache; concurrent misses share one compute()"""
+    current_user = get_request_user()
+    if not current_user or current_user.get('role') != 'admin':
+        # Non-admins always go through the handler's own access check
+        return compute()
+    return admin_read_cache.get_or_compute(name, compute, should_cache=lambda result: result.get('success'))
+
 @app.route('/api/auth/system-overview', methods=['GET'])
+@require_auth()
 def system_overview_api():
     """Get system overview (admin only)"""
     try:
-        # Get token from Authorization header
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'success': False, 'message': 'Authorization token required'}), 401
-        
-        token = auth_header.split(' ')[1]
-        
-        # Verify token and get user info
-        mongo_handler = MongoHandler()
-        user_info = mongo_handler.verify_jwt_token(token)
-        
-        if not user_info or not user_info.get('success'):
-            return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
-        
-        user_id = user_info['user']['id']
+        mongo_handler = get_mongo_handler()
+        user_id = get_request_user()['id']
         
         # Get system overview
-        system_overview = mongo_handler.get_system_overview(user_id)
+        system_overview = collapsed_admin_read('system_overview', lambda: mongo_handler.get_system_overview(user_id))
         
         if system_overview['success']:
-            return jsonify(system_overview)
+            return json_response(system_overview)
         else:
             return jsonify({'success': False, 'message': system_overview['message']}), 403
             
     except Exception as e:
-        logger.error(f"Error in system overview API: {str(e)}")
+        logger.error("Error in system overview API: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred while loading system overview'}), 500
 
 @app.route('/api/auth/recent-users', methods=['GET'])
+@require_auth()
 def recent_users_api():
     """Get recent users (admin only)"""
     try:
-        # Get token from Authorization header
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'success': False, 'message': 'Authorization token required'}), 401
-        
-        token = auth_header.split(' ')[1]
-        
-        # Verify token and get user info
-        mongo_handler = MongoHandler()
-        user_info = mongo_handler.verify_jwt_token(token)
-        
-        if not user_info or not user_info.get('success'):
-            return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
-        
-        user_id = user_info['user']['id']
+        mongo_handler = get_mongo_handler()
+        user_id = get_request_user()['id']
         
         # Get recent users
-        users = mongo_handler.get_all_users(user_id)
+        users = collapsed_admin_read('recent_users', lambda: mongo_handler.get_recent_users(user_id, limit=10))
         
         if users['success']:
-            # Return only first 10 users for recent users
-            recent_users = users['users'][:10] if 'users' in users else []
-            return jsonify({
+            return json_response({
                 'success': True,
-                'users': recent_users
+                'users': users['users']
             })
         else:
             return jsonify({'success': False, 'message': users['message']}), 403
             
     except Exception as e:
-        logger.error(f"Error in recent users API: {str(e)}")
+        logger.error("Error in recent users API: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred while loading recent users'}), 500
 
 @app.route('/api/auth/all-users', methods=['GET'])
+@require_auth()
 def all_users_api():
     """Get all users with pagination (admin only)"""
     try:
-        # Get token from Authorization header
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'success': False, 'message': 'Authorization token required'}), 401
-        
-        token = auth_header.split(' ')[1]
-        
-        # Verify token and get user info
-        mongo_handler = MongoHandler()
-        user_info = mongo_handler.verify_jwt_token(token)
-        
-        if not user_info or not user_info.get('success'):
-            return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
-        
-        user_id = user_info['user']['id']
+        mongo_handler = get_mongo_handler()
+        user_id = get_request_user()['id']
         
         # Get pagination parameters
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 10))
+        page = bounded_int_arg('page', 1, 1, 10000)
+        per_page = bounded_int_arg('per_page', 10, 1, 100)
         
         # Get all users
         users = mongo_handler.get_all_users_paginated(user_id, page, per_page)
         
         if users['success']:
-            return jsonify(users)
+            return json_response(users)
         else:
             return jsonify({'success': False, 'message': users['message']}), 403
             
     except Exception as e:
-        logger.error(f"Error in all users API: {str(e)}")
+        logger.error("Error in all users API: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred while loading users'}), 500
 
 @app.route('/api/auth/system-health', methods=['GET'])
+@require_auth()
 def system_health_api():
     """Get system health status (admin only)"""
     try:
-        # Get token from Authorization header
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'success': False, 'message': 'Authorization token required'}), 401
-        
-        token = auth_header.split(' ')[1]
-        
-        # Verify token and get user info
-        mongo_handler = MongoHandler()
-        user_info = mongo_handler.verify_jwt_token(token)
-        
-        if not user_info or not user_info.get('success'):
-            return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
-        
-        user_id = user_info['user']['id']
+        mongo_handler = get_mongo_handler()
+        user_id = get_request_user()['id']
         
         # Get system health
-        health = mongo_handler.get_system_health(user_id)
+        health = collapsed_admin_read('system_health', lambda: mongo_handler.get_system_health(user_id))
         
         if health['success']:
-            return jsonify(health)
+            return json_response(health)
         else:
             return jsonify({'success': False, 'message': health['message']}), 403
             
     except Exception as e:
-        logger.error(f"Error in system health API: {str(e)}")
+        logger.error("Error in system health API: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred while checking system health'}), 500
 
 @app.route('/api/auth/user-analytics', methods=['GET'])
+@require_auth()
 def user_analytics_api():
     """Get detailed user analytics (admin only)"""
     try:
-        # Get token from Authorization header
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'success': False, 'message': 'Authorization token required'}), 401
-        
-        token = auth_header.split(' ')[1]
-        
-        # Verify token and get user info
-        mongo_handler = MongoHandler()
-        user_info = mongo_handler.verify_jwt_token(token)
-        
-        if not user_info or not user_info.get('success'):
-            return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
-        
-        user_id = user_info['user']['id']
+        mongo_handler = get_mongo_handler()
+        user_id = get_request_user()['id']
         
         # Get user analytics
         analytics = mongo_handler.get_detailed_user_analytics(user_id)
         
         if analytics['success']:
-            return jsonify(analytics)
+            return json_response(analytics)
         else:
             return jsonify({'success': False, 'message': analytics['message']}), 403
             
     except Exception as e:
-        logger.error(f"Error in user analytics API: {str(e)}")
+        logger.error("Error in user analytics API: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred while loading user analytics'}), 500
 
 @app.route('/api/auth/create-user', methods=['POST'])
+@require_auth()
 def create_user_api():
     """Create a new user (admin only)"""
     try:
-        # Get token from Authorization header
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'success': False, 'message': 'Authorization token required'}), 401
-        
-        token = auth_header.split(' ')[1]
-        
-        # Verify token and get user info
-        mongo_handler = MongoHandler()
-        user_info = mongo_handler.verify_jwt_token(token)
-        
-        if not user_info or not user_info.get('success'):
-            return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
-        
-        user_id = user_info['user']['id']
+        mongo_handler = get_mongo_handler()
+        user_id = get_request_user()['id']
         
         # Get user data from request
-        data = request.get_json()
+        # silent: a missing or malformed JSON body is reported as 'No data provided', not a 400/500
+        data = request.get_json(silent=True)
         if not data:
-            return jsonify({'success': False, 'message': 'No data provided'}), 400
+            return NO_DATA_RESPONSE()
         
         # Create user
         result = mongo_handler.create_user_by_admin(user_id, data)
         
         if result['success']:
-            return jsonify(result)
+            return json_response(result)
         else:
             return jsonify({'success': False, 'message': result['message']}), 400
             
     except Exception as e:
-        logger.error(f"Error in create user API: {str(e)}")
+        logger.error("Error in create user API: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred while creating user'}), 500
 
 @app.route('/api/auth/export-data', methods=['GET'])
+@require_auth()
 def export_data_api():
     """Export system data (admin only)"""
     try:
-        # Get token from Authorization header
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'success': False, 'message': 'Authorization token required'}), 401
-        
-        token = auth_header.split(' ')[1]
-        
-        # Verify token and get user info
-        mongo_handler = MongoHandler()
-        user_info = mongo_handler.verify_jwt_token(token)
-        
-        if not user_info or not user_info.get('success'):
-            return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
-        
-        user_id = user_info['user']['id']
+        mongo_handler = get_mongo_handler()
+        user_id = get_request_user()['id']
         
         # Export data
         export_result = mongo_handler.export_system_data(user_id)
         
         if export_result['success']:
-            from flask import Response
-            from bson import json_util
-            # Use BSON json_util to safely serialize datetime and ObjectId types
-            payload = json_util.dumps(export_result['data'], indent=2)
+            # Stream the export record by record instead of building the whole dump in memory
             return Response(
-                payload,
+                stream_with_context(export_result['chunks']),
                 mimetype='application/json',
                 headers={
                     'Content-Disposition': f'attachment; filename=system-export-{datetime.now().strftime("%Y%m%d")}.json'
@@ -3860,229 +4035,181 @@ def export_data_api():
             return jsonify({'success': False, 'message': export_result['message']}), 403
             
     except Exception as e:
-        logger.error(f"Error in export data API: {str(e)}")
+        logger.error("Error in export data API: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred while exporting data'}), 500
 
 @app.route('/api/auth/system-logs', methods=['GET'])
+@require_auth()
 def system_logs_api():
     """Get system logs (admin only)"""
     try:
-        # Get token from Authorization header
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'success': False, 'message': 'Authorization token required'}), 401
-        
-        token = auth_header.split(' ')[1]
-        
-        # Verify token and get user info
-        mongo_handler = MongoHandler()
-        user_info = mongo_handler.verify_jwt_token(token)
-        
-        if not user_info or not user_info.get('success'):
-            return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
-        
-        user_id = user_info['user']['id']
+        mongo_handler = get_mongo_handler()
+        user_id = get_request_user()['id']
         
         # Get system logs
         logs = mongo_handler.get_system_logs(user_id)
         
         if logs['success']:
-            return jsonify(logs)
+            return json_response(logs)
         else:
             return jsonify({'success': False, 'message': logs['message']}), 403
             
     except Exception as e:
-        logger.error(f"Error in system logs API: {str(e)}")
+        logger.error("Error in system logs API: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred while loading system logs'}), 500
 
 @app.route('/api/auth/backup-system', methods=['POST'])
+@require_auth()
 def backup_system_api():
     """Create system backup (admin only)"""
     try:
-        # Get token from Authorization header
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'success': False, 'message': 'Authorization token required'}), 401
-        
-        token = auth_header.split(' ')[1]
-        
-        # Verify token and get user info
-        mongo_handler = MongoHandler()
-        user_info = mongo_handler.verify_jwt_token(token)
-        
-        if not user_info or not user_info.get('success'):
-            return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
-        
-        user_id = user_info['user']['id']
+        mongo_handler = get_mongo_handler()
+        user_id = get_request_user()['id']
         
         # Create backup
         backup_result = mongo_handler.create_system_backup(user_id)
         
         if backup_result['success']:
-            return jsonify(backup_result)
+            return json_response(backup_result)
         else:
             return jsonify({'success': False, 'message': backup_result['message']}), 403
             
     except Exception as e:
-        logger.error(f"Error in backup system API: {str(e)}")
+        logger.error("Error in backup system API: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred while creating backup'}), 500
 
 @app.route('/api/auth/system-settings', methods=['POST'])
+@require_auth()
 def system_settings_api():
     """Update system settings (admin only)"""
     try:
-        # Get token from Authorization header
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'success': False, 'message': 'Authorization token required'}), 401
-        
-        token = auth_header.split(' ')[1]
-        
-        # Verify token and get user info
-        mongo_handler = MongoHandler()
-        user_info = mongo_handler.verify_jwt_token(token)
-        
-        if not user_info or not user_info.get('success'):
-            return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
-        
-        user_id = user_info['user']['id']
+        mongo_handler = get_mongo_handler()
+        user_id = get_request_user()['id']
         
         # Get settings data from request
-        data = request.get_json()
+        # silent: a missing or malformed JSON body is reported as 'No data provided', not a 400/500
+        data = request.get_json(silent=True)
         if not data:
-            return jsonify({'success': False, 'message': 'No data provided'}), 400
+            return NO_DATA_RESPONSE()
         
         # Update settings
         result = mongo_handler.update_system_settings(user_id, data)
         
         if result['success']:
-            return jsonify(result)
+            return json_response(result)
         else:
             return jsonify({'success': False, 'message': result['message']}), 400
             
     except Exception as e:
-        logger.error(f"Error in system settings API: {str(e)}")
+        logger.error("Error in system settings API: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred while updating settings'}), 500
 
 @app.route('/api/auth/user-details/<user_id>', methods=['GET'])
+@require_auth()
 def user_details_api(user_id):
     """Get user details (admin only)"""
     try:
-        # Get token from Authorization header
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'success': False, 'message': 'Authorization token required'}), 401
-        
-        token = auth_header.split(' ')[1]
-        
-        # Verify token and get user info
-        mongo_handler = MongoHandler()
-        user_info = mongo_handler.verify_jwt_token(token)
-        
-        if not user_info or not user_info.get('success'):
-            return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
-        
-        admin_user_id = user_info['user']['id']
+        mongo_handler = get_mongo_handler()
+        admin_user_id = get_request_user()['id']
         
         # Get user details
         result = mongo_handler.get_user_details(admin_user_id, user_id)
         
         if result['success']:
-            return jsonify(result)
+            return json_response(result)
         else:
             return jsonify({'success': False, 'message': result['message']}), 403
             
     except Exception as e:
-        logger.error(f"Error in user details API: {str(e)}")
+        logger.error("Error in user details API: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred while loading user details'}), 500
 
 @app.route('/api/auth/update-user/<user_id>', methods=['PUT'])
+@require_auth()
 def update_user_api(user_id):
     """Update user (admin only)"""
     try:
-        # Get token from Authorization header
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'success': False, 'message': 'Authorization token required'}), 401
-        
-        token = auth_header.split(' ')[1]
-        
-        # Verify token and get user info
-        mongo_handler = MongoHandler()
-        user_info = mongo_handler.verify_jwt_token(token)
-        
-        if not user_info or not user_info.get('success'):
-            return jsonify({'success': False, 'message': 'Invalid or expired token'}), 401
-        
-        admin_user_id = user_info['user']['id']
+        mongo_handler = get_mongo_handler()
+        admin_user_id = get_request_user()['id']
         
         # Get user data from request
-        data = request.get_json()
+        # silent: a missing or malformed JSON body is reported as 'No data provided', not a 400/500
+        data = request.get_json(silent=True)
         if not data:
-            return jsonify({'success': False, 'message': 'No data provided'}), 400
+            return NO_DATA_RESPONSE()
         
         # Update user
         result = mongo_handler.update_user_by_admin(admin_user_id, user_id, data)
         
         if result['success']:
-            return jsonify(result)
+            # Role or active-state changes must not wait for cached verifications to expire
+            jwt_verification_cache.clear()
+            return json_response(result)
         else:
             return jsonify({'success': False, 'message': result['message']}), 400
             
     except Exception as e:
-        logger.error(f"Error in update user API: {str(e)}")
+        logger.error("Error in update user API: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred while updating user'}), 500
 
 # Error handlers for custom error pages
+@lru_cache(maxsize=None)
+def render_error_page(error_message):
+    """error.html rendered once per message; the page has no per-request content"""
+    return render_template('error.html', error_message=error_message)
+
+def is_api_request():
+    """Whether the current request targets an /api/ endpoint (classified once per request on flask.g)"""
+    is_api = g.get('is_api')
+    if is_api is None:
+        is_api = g.is_api = request.path[:5] == '/api/'
+    return is_api
+
+def error_handler_response(api_response, error_message, status):
+    """JSON for API endpoints, HTML for regular pages"""
+    if is_api_request():
+        return api_response()
+    return render_error_page(error_message), status
+
+API_NOT_FOUND_RESPONSE = prebuilt_response({'error': 'API endpoint not found'}, 404)
+API_INTERNAL_ERROR_RESPONSE = prebuilt_response({'error': 'Internal server error occurred'}, 500)
+API_FORBIDDEN_RESPONSE = prebuilt_response({'error': 'Access forbidden'}, 403)
+API_BAD_REQUEST_RESPONSE = prebuilt_response({'error': 'Bad request'}, 400)
+
 @app.errorhandler(404)
 def not_found_error(error):
     """Handle 404 Not Found errors"""
-    logger.warning(f"404 error: {request.url}")
-    # Return JSON for API endpoints, HTML for regular pages
-    if request.path.startswith('/api/'):
-        return jsonify({'error': 'API endpoint not found'}), 404
-    return render_template('error.html', error_message="The page you're looking for doesn't exist. Please check the URL and try again."), 404
+    logger.warning("404 error: %s", request.url)
+    return error_handler_response(API_NOT_FOUND_RESPONSE, "The page you're looking for doesn't exist. Please check the URL and try again.", 404)
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 Internal Server errors"""
-    logger.error(f"500 error: {str(error)}")
-    # Return JSON for API endpoints, HTML for regular pages
-    if request.path.startswith('/api/'):
-        return jsonify({'error': 'Internal server error occurred'}), 500
-    return render_template('error.html', error_message="Something went wrong on our end. Please try again later."), 500
+    logger.error("500 error: %s", error)
+    return error_handler_response(API_INTERNAL_ERROR_RESPONSE, "Something went wrong on our end. Please try again later.", 500)
 
 @app.errorhandler(403)
 def forbidden_error(error):
     """Handle 403 Forbidden errors"""
-    logger.warning(f"403 error: {request.url}")
-    # Return JSON for API endpoints, HTML for regular pages
-    if request.path.startswith('/api/'):
-        return jsonify({'error': 'Access forbidden'}), 403
-    return render_template('error.html', error_message="You don't have permission to access this resource."), 403
+    logger.warning("403 error: %s", request.url)
+    return error_handler_response(API_FORBIDDEN_RESPONSE, "You don't have permission to access this resource.", 403)
 
 @app.errorhandler(400)
 def bad_request_error(error):
     """Handle 400 Bad Request errors"""
-    logger.warning(f"400 error: {request.url}")
-    # Return JSON for API endpoints, HTML for regular pages
-    if request.path.startswith('/api/'):
-        return jsonify({'error': 'Bad request'}), 400
-    return render_template('error.html', error_message="The request was invalid. Please check your input and try again."), 400
+    logger.warning("400 error: %s", request.url)
+    return error_handler_response(API_BAD_REQUEST_RESPONSE, "The request was invalid. Please check your input and try again.", 400)
 
 @app.after_request
 def add_global_no_cache_headers(response):
-    try:
-        if 'Cache-Control' not in response.headers:
-            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-        if 'Pragma' not in response.headers:
-            response.headers["Pragma"] = "no-cache"
-        if 'Expires' not in response.headers:
-            response.headers["Expires"] = "0"
-    except Exception:
-        # Fail-safe: never break the response pipeline due to header issues
-        pass
+    """Default every response to NO_CACHE_HEADERS unless the view set its own caching headers"""
+    if request.endpoint == 'static':
+        return response
+    headers = response.headers
+    for name, value in NO_CACHE_HEADERS.items():
+        headers.setdefault(name, value)
     return response
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0',port=5008)
+    # Threaded so slow admin/Mongo requests do not block other requests in development
+    app.run(host='0.0.0.0', port=5008, threaded=True)
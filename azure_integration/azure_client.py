@@ -4,13 +4,21 @@ from utils.error_monitor import monitor_azure_api, monitor_critical_system
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 from config.settings import AZURE_DEVOPS_URL, AZURE_DEVOPS_ORG, AZURE_DEVOPS_PROJECT, AZURE_DEVOPS_PAT
 
+# Upper bound on concurrent work item detail requests per query
+MAX_DETAIL_WORKERS = 16
+
+# Azure DevOps returns at most 200 work items per list request
+MAX_BATCH_WORK_ITEMS = 200
+
 class AzureClient:
     def __init__(self, azure_url=None, azure_org=None, azure_pat=None, azure_config=None):
-        print(f"🔧 AzureClient constructor called with: azure_config={azure_config}")
+        print(f"🔧 AzureClient constructor called with azure_config keys: {list(azure_config.keys()) if azure_config else None}")
         
         if azure_config:
             # Use config values if provided, otherwise fall back to environment variables
@@ -29,6 +37,12 @@ class AzureClient:
             
         self.last_error = None  # Store the last error message
         
+        # Keep-alive session shared by all calls (and detail-fetch threads) on this client;
+        # the pool is larger than MAX_DETAIL_WORKERS so threads never wait on a connection
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=32))
+        self.session.mount('http://', HTTPAdapter(pool_maxsize=32))
+        
         # Ensure azure_url is properly formatted
         if self.azure_url and isinstance(self.azure_url, str):
             # Add scheme if missing
@@ -74,43 +88,42 @@ class AzureClient:
             print("❌ Azure DevOps Personal Access Token cannot be empty")
             return None
 
-        results = []
-        for work_item_id in work_item_ids:
-            url = f"{self.azure_url}/{self.azure_org}/{self.azure_project}/_apis/wit/workitems/{work_item_id}?api-version=6.0"
-            headers = {
-                "Accept": "application/json",
-                "Authorization": f"Basic {base64.b64encode(f':{self.azure_pat}'.encode()).decode()}"
+        headers = {
+            "Accept": "application/json",
+            "Authorization": f"Basic {base64.b64encode(f':{self.azure_pat}'.encode()).decode()}"
+        }
+
+        # Clean HTML tags from the description
+        def clean_html(text):
+            soup = BeautifulSoup(text, "html.parser")
+            return soup.get_text()
+
+        def to_result(work_item_id, work_item):
+            description = work_item.get("fields", {}).get("System.Description", "No Description Found")
+            description_cleaned = clean_html(description)
+            title = work_item.get("fields", {}).get("System.Title", "No Title Found")
+            print(f"✅ Successfully fetched work item {work_item_id}")
+            return {
+                "id": work_item_id,
+                "title": title,
+                "description": description_cleaned
             }
 
+        def fetch_one(work_item_id):
+            url = f"{self.azure_url}/{self.azure_org}/{self.azure_project}/_apis/wit/workitems/{work_item_id}?api-version=6.0"
+            response = None
             try:
                 # Make the API call with monitoring
                 @monitor_azure_api(critical=True)
                 def make_azure_request():
-                    return requests.get(url, headers=headers)
+                    return self.session.get(url, headers=headers)
                 
                 response = make_azure_request()
                 if response.status_code == 200:
-                    work_item = response.json()
-                    
-                    # Clean HTML tags from the description
-                    def clean_html(text):
-                        soup = BeautifulSoup(text, "html.parser")
-                        return soup.get_text()
-
-                    description = work_item.get("fields", {}).get("System.Description", "No Description Found")
-                    description_cleaned = clean_html(description)
-                    title = work_item.get("fields", {}).get("System.Title", "No Title Found")
-                    
-                    results.append({
-                        "id": work_item_id,
-                        "title": title,
-                        "description": description_cleaned
-                    })
-                    print(f"✅ Successfully fetched work item {work_item_id}")
-                else:
-                    error_msg = f"Failed to fetch work item {work_item_id}: {response.status_code}"
-                    self.last_error = error_msg
-                    print(f"❌ {error_msg}")
+                    return to_result(work_item_id, response.json())
+                error_msg = f"Failed to fetch work item {work_item_id}: {response.status_code}"
+                self.last_error = error_msg
+                print(f"❌ {error_msg}")
             except Exception as e:
                 error_msg = f"Error processing work item {work_item_id}: {str(e)}"
                 self.last_error = error_msg
@@ -123,6 +136,63 @@ class AzureClient:
                     "azure_project": self.azure_project,
                     "response_status": getattr(response, 'status_code', None)
                 })
+            return None
+
+        # Fetch the items in batches through the list endpoint instead of one
+        # request per id; errorPolicy=omit leaves out ids that cannot be read
+        results = []
+        for start in range(0, len(work_item_ids), MAX_BATCH_WORK_ITEMS):
+            batch_ids = work_item_ids[start:start + MAX_BATCH_WORK_ITEMS]
+            ids_param = ",".join(str(work_item_id).strip() for work_item_id in batch_ids)
+            url = f"{self.azure_url}/{self.azure_org}/{self.azure_project}/_apis/wit/workitems?ids={ids_param}&errorPolicy=omit&api-version=6.0"
+            response = None
+
+            try:
+                # Make the API call with monitoring
+                @monitor_azure_api(critical=True)
+                def make_azure_request():
+                    return self.session.get(url, headers=headers)
+                
+                response = make_azure_request()
+            except Exception as e:
+                print(f"❌ Error fetching work items {ids_param}: {str(e)}")
+                capture_exception(e, {
+                    "work_item_ids": ids_param,
+                    "azure_url": self.azure_url,
+                    "azure_org": self.azure_org,
+                    "azure_project": self.azure_project
+                })
+
+            if response is not None and response.status_code == 401:
+                # Every item would fail the same way
+                error_msg = f"Failed to fetch work items {ids_param}: 401"
+                self.last_error = error_msg
+                print(f"❌ {error_msg}")
+                continue
+
+            if response is None or response.status_code != 200:
+                # One bad id can fail the whole batch; fall back to per-item requests
+                # so only the failing ids are lost
+                print(f"⚠️ Batch fetch failed ({getattr(response, 'status_code', None)}), fetching work items one by one")
+                for work_item_id in batch_ids:
+                    result = fetch_one(work_item_id)
+                    if result:
+                        results.append(result)
+                continue
+
+            work_items_by_id = {
+                str(work_item["id"]): work_item
+                for work_item in response.json().get("value", [])
+                if work_item and "id" in work_item
+            }
+            for work_item_id in batch_ids:
+                work_item = work_items_by_id.get(str(work_item_id).strip())
+                if not work_item:
+                    error_msg = f"Failed to fetch work item {work_item_id}: 404"
+                    self.last_error = error_msg
+                    print(f"❌ {error_msg}")
+                    continue
+                results.append(to_result(work_item_id, work_item))
 
         return results
 
@@ -135,7 +205,7 @@ class AzureClient:
                 "Authorization": f"Basic {base64.b64encode(f':{self.azure_pat}'.encode()).decode()}"
             }
             
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=30)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -161,8 +231,10 @@ class AzureClient:
             where_clauses = [f"[System.TeamProject] = '{project_name}'"]
             if states and isinstance(states, (list, tuple)) and len(states) > 0:
                 # Build an IN clause for the provided states
+                # WIQL compares case-insensitively, so casing duplicates are dropped
                 # Quote each state value safely
-                quoted_states = ", ".join([f"'{s}'" for s in states])
+                unique_states = {s.lower(): s for s in states}.values()
+                quoted_states = ", ".join([f"'{s}'" for s in unique_states])
                 where_clauses.append(f"[System.State] IN ({quoted_states})")
 
             where_sql = " AND ".join(where_clauses)
@@ -176,7 +248,7 @@ class AzureClient:
             payload = {"query": wiql_query}
             
             print(f"🔍 Making WIQL request to: {url}")
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = self.session.post(url, headers=headers, json=payload, timeout=30)
             print(f"🔍 WIQL response status: {response.status_code}")
             
             if response.status_code != 200:
@@ -189,18 +261,25 @@ class AzureClient:
             print(f"🔍 Found {len(work_items)} work items in WIQL response")
             
             # Get details for each work item
-            detailed_items = []
             # Use all items if limit is None, otherwise use the limit
             items_to_process = work_items if limit is None else work_items[:limit]
-            for item in items_to_process:
+
+            def fetch_details(item):
                 item_id = item['id']
                 item_url = f"{self.azure_url}/{self.azure_org}/{project_name}/_apis/wit/workitems/{item_id}?api-version=6.0"
                 
-                item_response = requests.get(item_url, headers=headers, timeout=30)
+                item_response = self.session.get(item_url, headers=headers, timeout=30)
                 if item_response.status_code == 200:
-                    detailed_items.append(item_response.json())
-                else:
-                    print(f"❌ Failed to get details for work item {item_id}: {item_response.status_code}")
+                    return item_response.json()
+                print(f"❌ Failed to get details for work item {item_id}: {item_response.status_code}")
+                return None
+
+            # The detail requests are independent, so overlap them instead of
+            # waiting on each round-trip in turn; map() keeps the WIQL order
+            detailed_items = []
+            if items_to_process:
+                with ThreadPoolExecutor(max_workers=min(MAX_DETAIL_WORKERS, len(items_to_process))) as pool:
+                    detailed_items = [details for details in pool.map(fetch_details, items_to_process) if details is not None]
             
             print(f"🔍 Successfully fetched details for {len(detailed_items)} work items")
             return detailed_items
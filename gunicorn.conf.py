@@ -0,0 +1,23 @@
+"""
+Gunicorn settings, picked up automatically when running `gunicorn app:app`
+from the project root.
+
+The API handlers mostly wait on MongoDB and upstream HTTP calls, so each
+worker serves requests on a thread pool (gthread) instead of gunicorn's
+default single-threaded sync worker. pymongo's MongoClient and the shared
+handler objects are thread-safe, so threads overlap that I/O without
+monkey-patching the stdlib.
+"""
+
+import os
+
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '5008')}")
+# Generation progress, the URL-generation background thread and the in-memory
+# caches live in one process, so a status poll must reach the worker that
+# started the run: scale with threads, not workers
+workers = int(os.getenv("GUNICORN_WORKERS", "1"))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "16"))
+# Generation requests wait on the LLM for a long time
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "300"))
+keepalive = 5
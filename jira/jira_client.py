@@ -3,6 +3,7 @@ from utils.error_logger import capture_exception, capture_message, set_tag, set_
 from utils.error_monitor import monitor_jira_api, monitor_critical_system
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any, List
 from config.settings import JIRA_URL, JIRA_USER, JIRA_API_TOKEN
 
@@ -70,14 +71,18 @@ class JiraClient:
         self.jira_user = jira_user
         self.jira_token = jira_token
         self.headers = {"Accept": "application/json"}
+        # Keep-alive session so repeated calls on this client reuse TCP/TLS connections
+        self.session = requests.Session()
+        self.session.auth = (self.jira_user, self.jira_token)
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=32))
+        self.session.mount('http://', HTTPAdapter(pool_maxsize=32))
     
     def get_current_user(self) -> Optional[Dict[str, Any]]:
         """Get current user information"""
         try:
             url = f"{self.jira_url}/rest/api/3/myself"
-            response = requests.get(
+            response = self.session.get(
                 url,
-                auth=(self.jira_user, self.jira_token),
                 headers=self.headers,
                 timeout=30
             )
@@ -96,7 +101,9 @@ class JiraClient:
             url = f"{self.jira_url}/rest/api/3/search"
             jql_clauses = []
             if statuses:
-                quoted_statuses = ", ".join([f'"{s}"' for s in statuses])
+                # JQL matches status names case-insensitively; drop casing duplicates
+                unique_statuses = {s.lower(): s for s in statuses}.values()
+                quoted_statuses = ", ".join([f'"{s}"' for s in unique_statuses])
                 jql_clauses.append(f"status in ({quoted_statuses})")
             # Always order by last updated
             jql_clauses.append("ORDER BY updated DESC")
@@ -111,9 +118,8 @@ class JiraClient:
                 "fields": ["summary", "issuetype", "status"]
             }
             
-            response = requests.post(
+            response = self.session.post(
                 url,
-                auth=(self.jira_user, self.jira_token),
                 headers=self.headers,
                 json=payload,
                 timeout=30
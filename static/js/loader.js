@@ -42,11 +42,15 @@ async function checkGenerationStatus(loader, result, itemIds) {
     
     isGenerating = true;
     let pollCount = 0;
+    // Poll this run's own status when the server returned a generation id
+    const statusUrl = result && result.generation_id
+        ? `/api/generation-status?id=${encodeURIComponent(result.generation_id)}`
+        : '/api/generation-status';
     const maxPolls = 240; // 2 minutes at 500ms intervals
     
     const pollStatus = async () => {
         try {
-            const response = await fetch('/api/generation-status');
+            const response = await fetch(statusUrl);
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
             }
@@ -150,7 +150,7 @@ def save_excel_report(test_cases: str, base_name: str) -> Optional[str]:
         print(f"❌ Error saving Excel report: {e}")
         return None
 
-def create_excel_report(test_cases: List[Dict], status_values: Dict, source_type: str, item_ids: List[str]) -> bytes:
+def create_excel_report(test_cases: List[Dict], status_values: Dict, source_type: str, item_ids: List[str], output=None) -> Optional[bytes]:
     """Create an Excel report from test cases data.
     
     Args:
@@ -158,33 +158,22 @@ def create_excel_report(test_cases: List[Dict], status_values: Dict, source_type
         status_values (Dict): Status values for test cases
         source_type (str): Source type (e.g., 'Jira', 'Azure')
         item_ids (List[str]): List of item IDs
+        output: Optional binary file object to write the workbook into
         
     Returns:
-        bytes: Excel file as bytes
+        Optional[bytes]: Excel file as bytes, or None when written to output
     """
     try:
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.utils import get_column_letter
         
-        # Create a new workbook
-        wb = Workbook()
-        
-        # Remove default sheet
-        wb.remove(wb.active)
+        # Write-only workbook: rows are serialized as they are appended instead of
+        # keeping a cell object per value for the whole report
+        wb = Workbook(write_only=True)
         
         # Create summary sheet
         summary_ws = wb.create_sheet("Summary")
         
-        # Add summary information
-        summary_ws['A1'] = f"Test Cases Report - {source_type}"
-        summary_ws['A1'].font = Font(bold=True, size=16)
-        
-        summary_ws['A3'] = f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        summary_ws['A4'] = f"Source Type: {source_type}"
-        summary_ws['A5'] = f"Item IDs: {', '.join(item_ids)}"
-        summary_ws['A6'] = f"Total Test Cases: {len(test_cases)}"
-        
         # Add status summary
         status_counts = {}
         for tc in test_cases:
@@ -192,13 +181,23 @@ def create_excel_report(test_cases: List[Dict], status_values: Dict, source_type
             status = status_values.get(tc_id, 'Not Tested')
             status_counts[status] = status_counts.get(status, 0) + 1
         
-        summary_ws['A8'] = "Status Summary:"
-        summary_ws['A8'].font = Font(bold=True)
+        # Add summary information
+        title_cell = WriteOnlyCell(summary_ws, value=f"Test Cases Report - {source_type}")
+        title_cell.font = Font(bold=True, size=16)
+        summary_ws.append([title_cell])
+        summary_ws.append([])
+        summary_ws.append([f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
+        summary_ws.append([f"Source Type: {source_type}"])
+        summary_ws.append([f"Item IDs: {', '.join(item_ids)}"])
+        summary_ws.append([f"Total Test Cases: {len(test_cases)}"])
+        summary_ws.append([])
+        
+        status_header = WriteOnlyCell(summary_ws, value="Status Summary:")
+        status_header.font = Font(bold=True)
+        summary_ws.append([status_header])
         
-        row = 9
         for status, count in status_counts.items():
-            summary_ws[f'A{row}'] = f"{status}: {count}"
-            row += 1
+            summary_ws.append([f"{status}: {count}"])
         
         # Create test cases sheet
         tc_ws = wb.create_sheet("Test Cases")
@@ -206,67 +205,97 @@ def create_excel_report(test_cases: List[Dict], status_values: Dict, source_type
         # Define headers
         headers = ['Title', 'Scenario', 'Steps', 'Expected Result', 'Status', 'Item ID']
         
-        # Add headers
-        for col, header in enumerate(headers, 1):
-            cell = tc_ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-        
-        # Add test cases data
-        for row, tc in enumerate(test_cases, 2):
+        # Build the row values first: write-only sheets need their column widths
+        # before any row is written
+        rows = []
+        for tc in test_cases:
             # Extract item ID from title (e.g., "Title (KAN-6)" -> "KAN-6")
             title = tc.get('Title', '')
             item_id = ''
             if '(' in title and ')' in title:
                 item_id = title.split('(')[-1].split(')')[0]
             
-            tc_ws.cell(row=row, column=1, value=tc.get('Title', ''))
-            tc_ws.cell(row=row, column=2, value=tc.get('Scenario', ''))
-            
             # Handle Steps field - convert list to string if needed
             steps = tc.get('Steps', '')
             if isinstance(steps, list):
                 steps = '\n'.join([f"{i+1}. {step}" for i, step in enumerate(steps)])
-            tc_ws.cell(row=row, column=3, value=steps)
             
             # Handle Expected Result field - convert list to string if needed
             expected_result = tc.get('Expected Result', '')
             if isinstance(expected_result, list):
                 expected_result = '\n'.join(expected_result)
-            tc_ws.cell(row=row, column=4, value=expected_result)
             
             # Get status from status_values
-            tc_id = tc.get('Title', '')
-            status = status_values.get(tc_id, 'Not Tested')
-            tc_ws.cell(row=row, column=5, value=status)
+            status = status_values.get(title, 'Not Tested')
             
-            tc_ws.cell(row=row, column=6, value=item_id)
+            rows.append((title, tc.get('Scenario', ''), steps, expected_result, status, item_id))
         
         # Auto-adjust column widths
-        for column in tc_ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            tc_ws.column_dimensions[column_letter].width = adjusted_width
+        for col, header in enumerate(headers):
+            max_length = max([len(header)] + [len(str(row[col])) for row in rows])
+            tc_ws.column_dimensions[get_column_letter(col + 1)].width = min(max_length + 2, 50)
+        
+        # Add headers
+        header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(tc_ws, value=header)
+            cell.font = Font(bold=True)
+            cell.fill = header_fill
+            header_cells.append(cell)
+        tc_ws.append(header_cells)
+        
+        # Add test cases data
+        for row in rows:
+            tc_ws.append(row)
+        
+        if output is not None:
+            wb.save(output)
+            return None
         
         # Save to bytes
         from io import BytesIO
-        output = BytesIO()
-        wb.save(output)
-        output.seek(0)
-        
-        return output.getvalue()
+        buffer = BytesIO()
+        wb.save(buffer)
+        return buffer.getvalue()
         
     except Exception as e:
         logger.error(f"Error creating Excel report: {e}")
         raise e
 
+# Patterns for the test case parsers, compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+_LEADING_NUMBER_RE = re.compile(r'^\s*\d+\.\s*')
+_LEADING_BULLET_RE = re.compile(r'^\s*[-*]\s*')
+_TEST_TYPE_RE = re.compile(r"TEST TYPE:\s*([^\n]+)")
+_TC_ID_RE = re.compile(r'TC_[A-Z]+_\d+')
+_BLANK_LINE_RE = re.compile(r'\n\s*\n')
+_BLOCK_TITLE_RE = re.compile(r'Title:\s*(.*?)(?:\n|$)')
+_BLOCK_TEST_CASE_ID_RE = re.compile(r'\*\*Test Case ID:\*\*\s*(.*?)(?:\n|$)')
+_BLOCK_SCENARIO_RE = re.compile(r'Scenario:\s*(.*?)(?:\n\s*Preconditions:|\n\s*Steps to reproduce:|\n\s*Expected Result:|$)', re.DOTALL)
+_BLOCK_TEST_SCENARIO_RE = re.compile(r'\*\*Test Scenario:\*\*\s*(.*?)(?:\n\s*\*\*Test Steps:|\n\s*\*\*Expected Result:|$)', re.DOTALL)
+_BLOCK_DESCRIPTION_RE = re.compile(r'Description:\s*(.*?)(?:\n\s*Steps to reproduce:|\n\s*Expected Result:|$)', re.DOTALL)
+_BLOCK_PRECONDITIONS_RE = re.compile(r'Preconditions:\s*(.*?)(?:\n\s*Steps to reproduce:|\n\s*Expected Result:|$)', re.DOTALL)
+_BLOCK_STEPS_RE = re.compile(r'(?:\*\*)?Steps to reproduce:(?:\*\*)?\s*\n([\s\S]*?)(?=\n\s*(?:\*\*)?Expected Result:|$)', re.DOTALL)
+_STEP_ITEM_RE = re.compile(r'(?:^|\n)\s*(?:\d+\.\s*|\*\s*|\-\s*)(.*?)(?=\n\s*(?:\d+\.\s*|\*\s*|\-\s*)|$)', re.MULTILINE)
+_BLOCK_TEST_STEPS_RE = re.compile(r'\*\*Test Steps:\*\*\s*\n([\s\S]*?)(?=\n\s*\*\*Expected Result:|$)', re.DOTALL)
+_BLOCK_ALT_STEPS_RE = re.compile(r'Steps:\s*(.*?)(?:\n\s*Expected Result:|$)', re.DOTALL)
+_BLOCK_EXPECTED_RE = re.compile(r'Expected Result:\s*(.*?)(?:\n\s*Actual Result:|\n\s*Status:|\n\s*Priority:|$)', re.DOTALL)
+_BLOCK_BOLD_EXPECTED_RE = re.compile(r'\*\*Expected Result:\*\*\s*(.*?)(?:\n\s*\*\*Actual Result:|\n\s*\*\*Priority:|$)', re.DOTALL)
+_BLOCK_EXPECTED_OUTCOME_RE = re.compile(r'Expected Outcome:\s*(.*?)(?:\n\s*Actual Result:|\n\s*Status:|\n\s*Priority:|$)', re.DOTALL)
+_BLOCK_STATUS_RE = re.compile(r'\n\s*Status:\s*(.*?)(?:\n|$)')
+_BLOCK_ACTUAL_RE = re.compile(r'Actual Result:\s*(.*?)(?:\n\s*Priority:|$)', re.DOTALL)
+_BLOCK_PRIORITY_RE = re.compile(r'Priority:\s*(.*?)(?:\n|$)')
+_LINE_TITLE_RE = re.compile(r'^(?:\d+\.\s*)?(?:\*\*)?Title:(?:\*\*)?\s*(.*?)$')
+_LINE_SCENARIO_RE = re.compile(r'^(?:\*\*)?Scenario:(?:\*\*)?\s*(.*?)$')
+_LINE_PRECONDITIONS_RE = re.compile(r'^(?:\*\*)?Preconditions:(?:\*\*)?\s*(.*?)$')
+_LINE_STEPS_RE = re.compile(r'^(?:\*\*)?Steps(?: to reproduce)?:(?:\*\*)?')
+_LINE_EXPECTED_RE = re.compile(r'^(?:\*\*)?Expected Result:(?:\*\*)?\s*(.*?)$')
+_LINE_STEP_RE = re.compile(r'^(?:(\d+)\.|\-|\*)\s*(.*?)$')
+_LINE_STATUS_RE = re.compile(r'^Status:\s*(.*?)$')
+_LINE_ACTUAL_RE = re.compile(r'^(?:\*\*)?Actual Result:(?:\*\*)?\s*(.*?)$')
+_LINE_PRIORITY_RE = re.compile(r'^(?:\*\*)?Priority:(?:\*\*)?\s*(.*?)$')
+
 def _validate_and_clean_test_case(test_case: Dict) -> Dict:
     """Validate and clean up test case data to ensure quality and consistency"""
     try:
@@ -279,7 +308,7 @@ def _validate_and_clean_test_case(test_case: Dict) -> Dict:
             scenario = test_case['Scenario'].strip()
             if scenario and scenario != 'No scenario provided':
                 # Remove excessive whitespace and normalize
-                scenario = re.sub(r'\s+', ' ', scenario)
+                scenario = _WHITESPACE_RE.sub(' ', scenario)
                 test_case['Scenario'] = scenario
             else:
                 test_case['Scenario'] = 'No scenario provided'
@@ -296,15 +325,15 @@ def _validate_and_clean_test_case(test_case: Dict) -> Dict:
                     if step and step.strip():
                         cleaned_step = step.strip().replace('**', '').strip()
                         # Remove leading numbers and bullets
-                        cleaned_step = re.sub(r'^\s*\d+\.\s*', '', cleaned_step)
-                        cleaned_step = re.sub(r'^\s*[-*]\s*', '', cleaned_step)
+                        cleaned_step = _LEADING_NUMBER_RE.sub('', cleaned_step)
+                        cleaned_step = _LEADING_BULLET_RE.sub('', cleaned_step)
                         if cleaned_step:
                             cleaned_steps.append(cleaned_step)
                 test_case['Steps'] = cleaned_steps if cleaned_steps else 'No steps provided'
             elif isinstance(steps, str) and steps.strip():
                 # Clean up string steps
                 steps = steps.strip().replace('**', '').strip()
-                steps = re.sub(r'\s+', ' ', steps)
+                steps = _WHITESPACE_RE.sub(' ', steps)
                 test_case['Steps'] = steps
             else:
                 test_case['Steps'] = 'No steps provided'
@@ -315,7 +344,7 @@ def _validate_and_clean_test_case(test_case: Dict) -> Dict:
         if test_case.get('Expected Result'):
             expected = test_case['Expected Result'].strip()
             if expected and expected != 'No expected result provided':
-                expected = re.sub(r'\s+', ' ', expected)
+                expected = _WHITESPACE_RE.sub(' ', expected)
                 test_case['Expected Result'] = expected
             else:
                 test_case['Expected Result'] = 'No expected result provided'
@@ -326,7 +355,7 @@ def _validate_and_clean_test_case(test_case: Dict) -> Dict:
         if test_case.get('Actual Result'):
             actual = test_case['Actual Result'].strip()
             if actual:
-                actual = re.sub(r'\s+', ' ', actual)
+                actual = _WHITESPACE_RE.sub(' ', actual)
                 test_case['Actual Result'] = actual
         
         # Ensure status is set
@@ -355,8 +384,7 @@ def extract_test_type_sections(test_cases: str) -> Dict[str, str]:
     sections = {}
     
     # Look for TEST TYPE: section markers
-    section_pattern = r"TEST TYPE:\s*([^\n]+)"
-    section_matches = list(re.finditer(section_pattern, test_cases))
+    section_matches = list(_TEST_TYPE_RE.finditer(test_cases))
     
     # If no TEST TYPE markers found, return empty dict
     if not section_matches:
@@ -394,64 +422,61 @@ def parse_traditional_format(test_cases: str, default_section: str = "General")
     logger.info(f"Raw test case content (first 500 chars): {test_cases[:500]}")
     
     # Special handling for test cases without clear delimiters - try to extract full test case blocks
-    if ("Title:" in test_cases and "Steps to reproduce:" in test_cases) or ("Steps to reproduce:" in test_cases and re.search(r'TC_[A-Z]+_\d+', test_cases)) or ("**Test Case ID:**" in test_cases and "**Test Steps:**" in test_cases):
+    if ("Title:" in test_cases and "Steps to reproduce:" in test_cases) or ("Steps to reproduce:" in test_cases and _TC_ID_RE.search(test_cases)) or ("**Test Case ID:**" in test_cases and "**Test Steps:**" in test_cases):
         logger.info("Detected test case format")
         # Split by blank lines to find test case boundaries
         # This handles cases where test cases are separated by blank lines
-        test_case_blocks = re.split(r'\n\s*\n', test_cases)
+        test_case_blocks = _BLANK_LINE_RE.split(test_cases)
         for block in test_case_blocks:
             block = block.strip()
             if not block or len(block) < 10:  # Skip empty or very short blocks
                 continue
                 
             # Check if this looks like a test case - either has Title:, **Test Case ID:**, or starts with TC_ pattern
-            if "Title:" in block or "**Test Case ID:**" in block or re.match(r'TC_[A-Z]+_\d+', block.strip()):
+            if "Title:" in block or "**Test Case ID:**" in block or _TC_ID_RE.match(block.strip()):
                 test_case = {}
                 test_case['Section'] = default_section
                 
                 # Extract title - handle multiple formats
-                title_match = re.search(r'Title:\s*(.*?)(?:\n|$)', block)
+                title_match = _BLOCK_TITLE_RE.search(block)
                 if title_match:
                     test_case['Title'] = title_match.group(1).strip().replace('**', '').strip()
                 else:
                     # Try **Test Case ID:** format
-                    test_case_id_match = re.search(r'\*\*Test Case ID:\*\*\s*(.*?)(?:\n|$)', block)
+                    test_case_id_match = _BLOCK_TEST_CASE_ID_RE.search(block)
                     if test_case_id_match:
                         test_case['Title'] = test_case_id_match.group(1).strip().replace('**', '').strip()
                     else:
                         # Try to extract title from the first line if it starts with TC_ pattern
                         first_line = block.split('\n')[0].strip()
-                        if re.match(r'TC_[A-Z]+_\d+', first_line):
+                        if _TC_ID_RE.match(first_line):
                             test_case['Title'] = first_line.replace('**', '').strip()
                 
                 # Extract scenario - handle multiple formats with enhanced multi-line support
-                scenario_match = re.search(r'Scenario:\s*(.*?)(?:\n\s*Preconditions:|\n\s*Steps to reproduce:|\n\s*Expected Result:|$)', block, re.DOTALL)
+                scenario_match = _BLOCK_SCENARIO_RE.search(block)
                 if scenario_match:
                     scenario_text = scenario_match.group(1).strip().replace('**', '').strip()
                     # Clean up multi-line scenarios
-                    scenario_text = re.sub(r'\n\s*\n', ' ', scenario_text)  # Replace multiple newlines with single space
-                    scenario_text = re.sub(r'\s+', ' ', scenario_text)  # Normalize whitespace
+                    scenario_text = _WHITESPACE_RE.sub(' ', scenario_text)  # Normalize whitespace
                     test_case['Scenario'] = scenario_text
                 else:
                     # Try **Test Scenario:** format
-                    test_scenario_match = re.search(r'\*\*Test Scenario:\*\*\s*(.*?)(?:\n\s*\*\*Test Steps:|\n\s*\*\*Expected Result:|$)', block, re.DOTALL)
+                    test_scenario_match = _BLOCK_TEST_SCENARIO_RE.search(block)
                     if test_scenario_match:
                         scenario_text = test_scenario_match.group(1).strip().replace('**', '').strip()
                         # Clean up multi-line scenarios
-                        scenario_text = re.sub(r'\n\s*\n', ' ', scenario_text)
-                        scenario_text = re.sub(r'\s+', ' ', scenario_text)
+                        scenario_text = _WHITESPACE_RE.sub(' ', scenario_text)
                         test_case['Scenario'] = scenario_text
                     else:
                         # Try alternative scenario patterns
-                        alt_scenario_match = re.search(r'Description:\s*(.*?)(?:\n\s*Steps to reproduce:|\n\s*Expected Result:|$)', block, re.DOTALL)
+                        alt_scenario_match = _BLOCK_DESCRIPTION_RE.search(block)
                         if alt_scenario_match:
                             scenario_text = alt_scenario_match.group(1).strip().replace('**', '').strip()
-                            scenario_text = re.sub(r'\n\s*\n', ' ', scenario_text)
-                            scenario_text = re.sub(r'\s+', ' ', scenario_text)
+                            scenario_text = _WHITESPACE_RE.sub(' ', scenario_text)
                             test_case['Scenario'] = scenario_text
                 
                 # Extract preconditions
-                preconditions_match = re.search(r'Preconditions:\s*(.*?)(?:\n\s*Steps to reproduce:|\n\s*Expected Result:|$)', block, re.DOTALL)
+                preconditions_match = _BLOCK_PRECONDITIONS_RE.search(block)
                 if preconditions_match:
                     test_case['Preconditions'] = preconditions_match.group(1).strip().replace('**', '').strip()
                     logger.info(f"Found preconditions: {test_case['Preconditions'][:100]}...")
@@ -459,12 +484,12 @@ def parse_traditional_format(test_cases: str, default_section: str = "General")
                     logger.warning(f"No preconditions found in block: {block[:200]}...")
                 
                 # Extract steps - handle multiple formats
-                steps_match = re.search(r'(?:\*\*)?Steps to reproduce:(?:\*\*)?\s*\n([\s\S]*?)(?=\n\s*(?:\*\*)?Expected Result:|$)', block, re.DOTALL)
+                steps_match = _BLOCK_STEPS_RE.search(block)
                 if steps_match:
                     steps_text = steps_match.group(1).strip()
                     logger.info(f"Found steps text: {steps_text[:200]}...")
                     # Try to split steps by numbered lines or bullet points
-                    step_lines = re.findall(r'(?:^|\n)\s*(?:\d+\.\s*|\*\s*|\-\s*)(.*?)(?=\n\s*(?:\d+\.\s*|\*\s*|\-\s*)|$)', steps_text, re.MULTILINE)
+                    step_lines = _STEP_ITEM_RE.findall(steps_text)
                     if step_lines:
                         test_case['Steps'] = [step.strip().replace('**', '').strip() for step in step_lines if step.strip()]
                         logger.info(f"Extracted {len(test_case['Steps'])} steps using numbered format")
@@ -475,12 +500,12 @@ def parse_traditional_format(test_cases: str, default_section: str = "General")
                         logger.info(f"Extracted {len(test_case['Steps'])} steps using line-by-line format")
                 else:
                     # Try **Test Steps:** format
-                    test_steps_match = re.search(r'\*\*Test Steps:\*\*\s*\n([\s\S]*?)(?=\n\s*\*\*Expected Result:|$)', block, re.DOTALL)
+                    test_steps_match = _BLOCK_TEST_STEPS_RE.search(block)
                     if test_steps_match:
                         steps_text = test_steps_match.group(1).strip()
                         logger.info(f"Found test steps text: {steps_text[:200]}...")
                         # Try to split steps by numbered lines or bullet points
-                        step_lines = re.findall(r'(?:^|\n)\s*(?:\d+\.\s*|\*\s*|\-\s*)(.*?)(?=\n\s*(?:\d+\.\s*|\*\s*|\-\s*)|$)', steps_text, re.MULTILINE)
+                        step_lines = _STEP_ITEM_RE.findall(steps_text)
                         if step_lines:
                             test_case['Steps'] = [step.strip().replace('**', '').strip() for step in step_lines if step.strip()]
                             logger.info(f"Extracted {len(test_case['Steps'])} steps using numbered format")
@@ -492,7 +517,7 @@ def parse_traditional_format(test_cases: str, default_section: str = "General")
                     else:
                         logger.warning(f"No steps found in block: {block[:200]}...")
                         # Try alternative step patterns
-                        alt_steps_match = re.search(r'Steps:\s*(.*?)(?:\n\s*Expected Result:|$)', block, re.DOTALL)
+                        alt_steps_match = _BLOCK_ALT_STEPS_RE.search(block)
                         if alt_steps_match:
                             steps_text = alt_steps_match.group(1).strip()
                             logger.info(f"Found steps with alternative pattern: {steps_text[:200]}...")
@@ -501,38 +526,35 @@ def parse_traditional_format(test_cases: str, default_section: str = "General")
                             logger.warning(f"No steps found with any pattern in block: {block[:200]}...")
                 
                 # Extract expected result - handle multiple formats with enhanced multi-line support
-                expected_match = re.search(r'Expected Result:\s*(.*?)(?:\n\s*Actual Result:|\n\s*Status:|\n\s*Priority:|$)', block, re.DOTALL)
+                expected_match = _BLOCK_EXPECTED_RE.search(block)
                 if expected_match:
                     expected_text = expected_match.group(1).strip().replace('**', '').strip()
                     # Clean up multi-line expected results
-                    expected_text = re.sub(r'\n\s*\n', ' ', expected_text)  # Replace multiple newlines with single space
-                    expected_text = re.sub(r'\s+', ' ', expected_text)  # Normalize whitespace
+                    expected_text = _WHITESPACE_RE.sub(' ', expected_text)  # Normalize whitespace
                     test_case['Expected Result'] = expected_text
                 else:
                     # Try **Expected Result:** format
-                    test_expected_match = re.search(r'\*\*Expected Result:\*\*\s*(.*?)(?:\n\s*\*\*Actual Result:|\n\s*\*\*Priority:|$)', block, re.DOTALL)
+                    test_expected_match = _BLOCK_BOLD_EXPECTED_RE.search(block)
                     if test_expected_match:
                         expected_text = test_expected_match.group(1).strip().replace('**', '').strip()
                         # Clean up multi-line expected results
-                        expected_text = re.sub(r'\n\s*\n', ' ', expected_text)
-                        expected_text = re.sub(r'\s+', ' ', expected_text)
+                        expected_text = _WHITESPACE_RE.sub(' ', expected_text)
                         test_case['Expected Result'] = expected_text
                     else:
                         # Try alternative expected result patterns
-                        alt_expected_match = re.search(r'Expected Outcome:\s*(.*?)(?:\n\s*Actual Result:|\n\s*Status:|\n\s*Priority:|$)', block, re.DOTALL)
+                        alt_expected_match = _BLOCK_EXPECTED_OUTCOME_RE.search(block)
                         if alt_expected_match:
                             expected_text = alt_expected_match.group(1).strip().replace('**', '').strip()
-                            expected_text = re.sub(r'\n\s*\n', ' ', expected_text)
-                            expected_text = re.sub(r'\s+', ' ', expected_text)
+                            expected_text = _WHITESPACE_RE.sub(' ', expected_text)
                             test_case['Expected Result'] = expected_text
                 
                 # Extract status if present as its own line
-                status_match = re.search(r'\n\s*Status:\s*(.*?)(?:\n|$)', block)
+                status_match = _BLOCK_STATUS_RE.search(block)
                 if status_match:
                     test_case['Status'] = status_match.group(1).strip()
                 
                 # Extract actual result if present
-                actual_match = re.search(r'Actual Result:\s*(.*?)(?:\n\s*Priority:|$)', block, re.DOTALL)
+                actual_match = _BLOCK_ACTUAL_RE.search(block)
                 if actual_match:
                     actual_result = actual_match.group(1).strip()
                     # Only set if it's not empty and doesn't contain "Priority:"
@@ -540,7 +562,7 @@ def parse_traditional_format(test_cases: str, default_section: str = "General")
                         test_case['Actual Result'] = actual_result.replace('**', '').strip()
                 
                 # Extract priority if present
-                priority_match = re.search(r'Priority:\s*(.*?)(?:\n|$)', block)
+                priority_match = _BLOCK_PRIORITY_RE.search(block)
                 if priority_match:
                     test_case['Priority'] = priority_match.group(1).strip().replace('**', '').strip()
                 
@@ -578,7 +600,7 @@ def parse_traditional_format(test_cases: str, default_section: str = "General")
             continue
             
         # Handle various title formats
-        title_match = re.match(r'^(?:\d+\.\s*)?(?:\*\*)?Title:(?:\*\*)?\s*(.*?)$', line)
+        title_match = _LINE_TITLE_RE.match(line)
         if title_match:
             # Save previous test case if exists
             if current_test:
@@ -596,20 +618,20 @@ def parse_traditional_format(test_cases: str, default_section: str = "General")
             continue
             
         # Handle scenario
-        scenario_match = re.match(r'^(?:\*\*)?Scenario:(?:\*\*)?\s*(.*?)$', line)
+        scenario_match = _LINE_SCENARIO_RE.match(line)
         if scenario_match and current_test:
             current_test['Scenario'] = scenario_match.group(1).strip().replace('**', '').strip()
             continue
             
         # Handle preconditions
-        preconditions_match = re.match(r'^(?:\*\*)?Preconditions:(?:\*\*)?\s*(.*?)$', line)
+        preconditions_match = _LINE_PRECONDITIONS_RE.match(line)
         if preconditions_match and current_test:
             current_test['Preconditions'] = preconditions_match.group(1).strip().replace('**', '').strip()
             logger.info(f"Found preconditions in line-by-line: {current_test['Preconditions'][:100]}...")
             continue
             
         # Handle steps header - support multiple variations
-        steps_match = re.match(r'^(?:\*\*)?Steps(?: to reproduce)?:(?:\*\*)?', line)
+        steps_match = _LINE_STEPS_RE.match(line)
         if steps_match and current_test:
             collecting_steps = True
             current_steps = []
@@ -619,20 +641,20 @@ def parse_traditional_format(test_cases: str, default_section: str = "General")
         # Collect steps
         if collecting_steps:
             # Check if we're now on the Expected Result section
-            if re.match(r'^(?:\*\*)?Expected Result:(?:\*\*)?', line):
+            if _LINE_EXPECTED_RE.match(line):
                 collecting_steps = False
                 current_test['Steps'] = current_steps
                 logger.info(f"Finished collecting {len(current_steps)} steps for test case: {current_test.get('Title', 'Unknown')}")
                 
                 # Extract expected result value
-                er_match = re.match(r'^(?:\*\*)?Expected Result:(?:\*\*)?\s*(.*?)$', line)
+                er_match = _LINE_EXPECTED_RE.match(line)
                 if er_match:
                     current_test['Expected Result'] = er_match.group(1).strip().replace('**', '').strip()
                 continue
                 
                 
             # Support various step formats (1. Step, - Step, * Step, etc.)
-            step_match = re.match(r'^(?:(\d+)\.|\-|\*)\s*(.*?)$', line)
+            step_match = _LINE_STEP_RE.match(line)
             if step_match:
                 step_text = step_match.group(2) if step_match.groups()[-1] else line
                 # Clean up markdown formatting from steps
@@ -649,25 +671,25 @@ def parse_traditional_format(test_cases: str, default_section: str = "General")
                 continue
                 
         # Handle expected result
-        expected_match = re.match(r'^(?:\*\*)?Expected Result:(?:\*\*)?\s*(.*?)$', line)
+        expected_match = _LINE_EXPECTED_RE.match(line)
         if expected_match and current_test:
             current_test['Expected Result'] = expected_match.group(1).strip().replace('**', '').strip()
             continue
 
         # Handle status as standalone line
-        status_alone = re.match(r'^Status:\s*(.*?)$', line)
+        status_alone = _LINE_STATUS_RE.match(line)
         if status_alone and current_test:
             current_test['Status'] = status_alone.group(1).strip()
             continue
             
         # Handle actual result
-        actual_match = re.match(r'^(?:\*\*)?Actual Result:(?:\*\*)?\s*(.*?)$', line)
+        actual_match = _LINE_ACTUAL_RE.match(line)
         if actual_match and current_test:
             current_test['Actual Result'] = actual_match.group(1).strip().replace('**', '').strip()
             continue
             
         # Handle priority
-        priority_match = re.match(r'^(?:\*\*)?Priority:(?:\*\*)?\s*(.*?)$', line)
+        priority_match = _LINE_PRIORITY_RE.match(line)
         if priority_match and current_test:
             current_test['Priority'] = priority_match.group(1).strip().replace('**', '').strip()
             continue
@@ -0,0 +1,45 @@
+"""
+orjson-backed JSON provider for Flask.
+
+Keeps the output of Flask's DefaultJSONProvider (HTTP dates, sorted keys,
+ObjectId/UUID/Decimal coerced to strings) while doing the actual encoding
+and decoding in orjson.
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# Datetimes go through DefaultJSONProvider.default so responses keep the
+# RFC 822 format the frontend already parses; non-str dict keys are
+# stringified the same way the stdlib encoder does. numpy scalars coming
+# out of pandas records are serialized as numbers rather than strings.
+_BASE_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj):
+    """Fallback for types orjson does not serialize natively"""
+    try:
+        return DefaultJSONProvider.default(obj)
+    except TypeError:
+        # ObjectId and friends
+        return str(obj)
+
+
+def dumps_bytes(obj, sort_keys=False):
+    """Encode obj to JSON bytes with the same type handling as OrjsonProvider"""
+    return orjson.dumps(obj, default=_default, option=_BASE_OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _BASE_OPTIONS)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Drop-in replacement for Flask's JSON provider using orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return dumps_bytes(obj, sort_keys=self.sort_keys).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj, sort_keys=self.sort_keys), mimetype=self.mimetype)
+
@@ -2,27 +2,114 @@
 from utils.error_logger import capture_exception, capture_message, set_tag, set_context
 
 import pymongo
-from pymongo import MongoClient
-from bson import ObjectId
+from pymongo import MongoClient, IndexModel
+from bson import ObjectId, json_util
 import json
 from datetime import datetime, timedelta
 import hashlib
 import string
 import random
 import logging
-from config.settings import MONGODB_URI, MONGODB_DB
+from config.settings import MONGODB_URI, MONGODB_DB, JWT_SECRET_KEY
 import uuid
 import bcrypt
 import jwt
-import os
 from datetime import datetime, timedelta
+import atexit
+import queue
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Tokens are HMAC-signed with a server-side secret: verification is a single
+# SHA-256 HMAC, far cheaper than RSA/ECDSA/EdDSA signature checks, and there
+# is no separate issuer that would need a public key.
+JWT_ALGORITHM = "HS256"
+
+class EventQueueFull(Exception):
+    """Raised by the tracking methods when the analytics writer queue is full"""
+
+class EventWriter:
+    """Background writer that batches analytics documents into insert_many calls"""
+
+    def __init__(self, collection, flush_interval=0.5, batch_size=500, max_queued=100000):
+        self.collection = collection
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        # Bounded so a stalled database applies backpressure instead of growing memory
+        self.queue = queue.Queue(maxsize=max_queued)
+        self.thread = threading.Thread(target=self._run, name=f"{collection.name}-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.flush)
+
+    def put(self, event_doc):
+        """Queue a document for the next batch; raises queue.Full when the writer is backed up"""
+        self.queue.put_nowait(event_doc)
+
+    def _drain(self):
+        """Collect up to batch_size queued documents without blocking"""
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        if not batch:
+            return
+        try:
+            self.collection.insert_many(batch, ordered=False)
+            logger.debug("Flushed %s documents to %s", len(batch), self.collection.name)
+        except Exception as e:
+            logger.error("Error writing batch to %s: %s", self.collection.name, e)
+
+    def _run(self):
+        while True:
+            # Block until there is something to write, then keep collecting
+            # until the batch is full or the flush interval has passed
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._write(batch)
+
+    def flush(self):
+        """Write everything still queued (used at interpreter exit)"""
+        batch = self._drain()
+        while batch:
+            self._write(batch)
+            batch = self._drain()
+
+_event_writers = {}
+_event_writers_lock = threading.Lock()
+
+def get_event_writer(collection):
+    """Return the process-wide EventWriter for a collection, starting it on first use"""
+    writer = _event_writers.get(collection.name)
+    if writer is None:
+        with _event_writers_lock:
+            writer = _event_writers.get(collection.name)
+            if writer is None:
+                writer = _event_writers[collection.name] = EventWriter(collection)
+    return writer
+
 class MongoHandler:
+    # Indexes only need to be declared once per process
+    _indexes_ensured = False
+
     def __init__(self):
         try:
-            self.client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=5000)
+            # Pooled client; the app shares one MongoHandler, so the pool is reused across requests
+            self.client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=5000, maxPoolSize=50, minPoolSize=5)
             # Verify connection
             self.client.server_info()
             self.db = self.client[MONGODB_DB]
@@ -30,10 +117,53 @@ class MongoHandler:
             self.analytics_collection = self.db.analytics
             self.user_sessions_collection = self.db.user_sessions
             self.users_collection = self.db.users
+            self.generation_cache_collection = self.db.test_case_cache
             logger.info("Successfully connected to MongoDB")
         except (pymongo.errors.ConnectionFailure, pymongo.errors.ServerSelectionTimeoutError) as e:
             logger.error(f"Failed to connect to MongoDB: {str(e)}")
             raise Exception("Could not connect to MongoDB. Please check your connection settings.")
+        if not MongoHandler._indexes_ensured:
+            self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """Create the indexes the hot lookups rely on (no-op when they already exist)"""
+        index_specs = [
+            (self.collection, [
+                # url_key lookups (shared views, status sync, document fetch) must be IXSCAN, not COLLSCAN.
+                # Sparse because short-URL documents in the same collection have no url_key.
+                IndexModel([("url_key", pymongo.ASCENDING)], unique=True, sparse=True, name="url_key_unique"),
+                # Short-URL dedup lookups hit a single hashed key instead of scanning the
+                # url_params arrays; only short-URL documents carry dedup_hash.
+                IndexModel(
+                    [("type", pymongo.ASCENDING), ("dedup_hash", pymongo.ASCENDING)],
+                    name="shortened_url_lookup",
+                    partialFilterExpression={"dedup_hash": {"$exists": True}}
+                ),
+                # Dashboard: a user's test cases, newest first
+                IndexModel([("user_id", pymongo.ASCENDING), ("created_at", pymongo.DESCENDING)], name="user_created_at"),
+                IndexModel([("created_at", pymongo.DESCENDING)], name="created_at"),
+            ]),
+            (self.users_collection, [
+                IndexModel([("email", pymongo.ASCENDING)], unique=True, name="email_unique"),
+            ]),
+            (self.db.password_reset_tokens, [
+                IndexModel([("token_hash", pymongo.ASCENDING)], unique=True, name="token_hash_unique"),
+                # Expired reset tokens are dropped by MongoDB's TTL monitor
+                IndexModel([("expires_at", pymongo.ASCENDING)], expireAfterSeconds=0, name="expires_at_ttl"),
+            ]),
+            (self.generation_cache_collection, [
+                # Cached LLM generations are looked up by _id and expire on their own
+                IndexModel([("expires_at", pymongo.ASCENDING)], expireAfterSeconds=0, name="expires_at_ttl"),
+            ]),
+        ]
+        # One createIndexes command per collection; a failure (e.g. duplicate emails
+        # blocking the unique index) is logged without skipping the other collections
+        for collection, indexes in index_specs:
+            try:
+                collection.create_indexes(indexes)
+            except Exception as e:
+                logger.error(f"Error creating MongoDB indexes on {collection.name}: {str(e)}")
+        MongoHandler._indexes_ensured = True
 
     def create_user(self, email, password, name, role='user'):
         """Create a new user account"""
@@ -138,6 +268,15 @@ class MongoHandler:
             logger.error(f"Error authenticating user: {str(e)}")
             return {"success": False, "message": "Authentication failed"}
 
+    @staticmethod
+    def _facet_counts(collection, filters):
+        """Count documents for several filters in one $facet round-trip ({name: filter} -> {name: count})"""
+        result = list(collection.aggregate([
+            {"$facet": {name: [{"$match": query}, {"$count": "n"}] for name, query in filters.items()}}
+        ]))
+        facets = result[0] if result else {}
+        return {name: facets[name][0]["n"] if facets.get(name) else 0 for name in filters}
+
     def is_admin(self, user_id):
         """Check if a user is an admin"""
         try:
@@ -277,6 +416,25 @@ class MongoHandler:
             logger.error(f"Error deleting user: {str(e)}")
             return {"success": False, "message": "Failed to delete user"}
 
+    def _user_statistics(self):
+        """Total/active/role/new-this-month user counts in a single aggregation"""
+        first_day = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        counts = self._facet_counts(self.users_collection, {
+            "total_users": {},
+            "active_users": {"is_active": True},
+            "admin_users": {"role": "admin"},
+            "regular_users": {"role": "user"},
+            "new_users_this_month": {"created_at": {"$gte": first_day}}
+        })
+        return {
+            "total_users": counts["total_users"],
+            "active_users": counts["active_users"],
+            "inactive_users": counts["total_users"] - counts["active_users"],
+            "admin_users": counts["admin_users"],
+            "regular_users": counts["regular_users"],
+            "new_users_this_month": counts["new_users_this_month"]
+        }
+
     def get_user_statistics(self, admin_user_id):
         """Get user statistics (admin only)"""
         try:
@@ -284,31 +442,7 @@ class MongoHandler:
             if not self.is_admin(admin_user_id):
                 return {"success": False, "message": "Access denied. Admin privileges required."}
             
-            # Get total users
-            total_users = self.users_collection.count_documents({})
-            
-            # Get active users
-            active_users = self.users_collection.count_documents({"is_active": True})
-            
-            # Get users by role
-            admin_users = self.users_collection.count_documents({"role": "admin"})
-            regular_users = self.users_collection.count_documents({"role": "user"})
-            
-            # Get users created this month
-            from datetime import datetime, timedelta
-            first_day = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            new_users_this_month = self.users_collection.count_documents({"created_at": {"$gte": first_day}})
-            
-            stats = {
-                "total_users": total_users,
-                "active_users": active_users,
-                "inactive_users": total_users - active_users,
-                "admin_users": admin_users,
-                "regular_users": regular_users,
-                "new_users_this_month": new_users_this_month
-            }
-            
-            return {"success": True, "statistics": stats}
+            return {"success": True, "statistics": self._user_statistics()}
             
         except Exception as e:
             logger.error(f"Error getting user statistics: {str(e)}")
@@ -790,10 +924,12 @@ class MongoHandler:
             if not self.is_admin(admin_user_id):
                 return {"success": False, "message": "Access denied. Admin privileges required."}
             
-            # Get system statistics
-            total_test_cases = self.collection.count_documents({})
-            total_users = self.users_collection.count_documents({})
-            total_analytics = self.analytics_collection.count_documents({})
+            # Get system statistics; whole-collection totals come from collection metadata
+            # and the user counts from one $facet aggregation
+            user_statistics = self._user_statistics()
+            total_test_cases = self.collection.estimated_document_count()
+            total_users = user_statistics["total_users"]
+            total_analytics = self.analytics_collection.estimated_document_count()
             
             # Get recent activity
             recent_test_cases = list(self.collection.find({}, {
@@ -811,9 +947,6 @@ class MongoHandler:
                 if "created_at" in test_case:
                     test_case["created_at"] = test_case["created_at"].isoformat()
             
-            # Get user statistics
-            user_stats = self.get_user_statistics(admin_user_id)
-            
             # Get storage information (approximate)
             storage_info = {
                 "test_cases_size": total_test_cases * 1024,  # Approximate size in bytes
@@ -826,7 +959,7 @@ class MongoHandler:
                 "total_users": total_users,
                 "total_analytics": total_analytics,
                 "recent_activity": recent_test_cases,
-                "user_statistics": user_stats.get("statistics", {}) if user_stats["success"] else {},
+                "user_statistics": user_statistics,
                 "storage_info": storage_info,
                 "system_health": "healthy"  # You can add more sophisticated health checks
             }
@@ -837,6 +970,34 @@ class MongoHandler:
             logger.error(f"Error getting system overview: {str(e)}")
             return {"success": False, "message": "Failed to retrieve system overview"}
 
+    def get_recent_users(self, admin_user_id, limit=10):
+        """Get the most recently created users (admin only)"""
+        try:
+            # Verify admin status
+            if not self.is_admin(admin_user_id):
+                return {"success": False, "message": "Access denied. Admin privileges required."}
+            
+            # Sort and limit in MongoDB and project only what the dashboard table renders
+            users = list(self.users_collection.find({}, {
+                "_id": 1,
+                "email": 1,
+                "name": 1,
+                "role": 1,
+                "created_at": 1,
+                "is_active": 1
+            }).sort("created_at", -1).limit(limit).batch_size(limit))
+            
+            for user in users:
+                user["_id"] = str(user["_id"])
+                if isinstance(user.get("created_at"), datetime):
+                    user["created_at"] = user["created_at"].isoformat()
+            
+            return {"success": True, "users": users}
+            
+        except Exception as e:
+            logger.error(f"Error getting recent users: {str(e)}")
+            return {"success": False, "message": "Failed to get recent users"}
+
     def get_all_users_paginated(self, admin_user_id, page=1, per_page=10):
         """Get all users with pagination (admin only)"""
         try:
@@ -862,7 +1023,7 @@ class MongoHandler:
                 "last_login": 1,
                 "is_active": 1
                 # Note: password is excluded by not including it in the projection
-            }).sort("created_at", -1).skip(skip).limit(per_page))
+            }).sort("created_at", -1).skip(skip).limit(per_page).batch_size(per_page))
             
             # Convert ObjectId to string for JSON serialization
             for user in users:
@@ -915,19 +1076,16 @@ class MongoHandler:
             
             # Check collections
             collections_status = {}
-            collections = ["users", "test_cases", "analytics"]
+            collections = {
+                "users": self.users_collection,
+                "test_cases": self.collection,
+                "analytics": self.analytics_collection
+            }
             
-            for collection_name in collections:
+            for collection_name, collection in collections.items():
                 try:
-                    if collection_name == "users":
-                        collection = self.users_collection
-                    elif collection_name == "test_cases":
-                        collection = self.collection
-                    elif collection_name == "analytics":
-                        collection = self.analytics_collection
-                    
-                    # Try to count documents
-                    count = collection.count_documents({})
+                    # Try to count documents (metadata count, no collection scan)
+                    count = collection.estimated_document_count()
                     collections_status[collection_name] = {
                         "status": "healthy",
                         "document_count": count
@@ -942,10 +1100,15 @@ class MongoHandler:
             from datetime import datetime, timedelta
             yesterday = datetime.now() - timedelta(days=1)
             
+            user_activity = self._facet_counts(self.users_collection, {
+                "new_users_24h": {"created_at": {"$gte": yesterday}},
+                "active_users_24h": {"last_login": {"$gte": yesterday}}
+            })
             recent_activity = {
-                "new_users_24h": self.users_collection.count_documents({"created_at": {"$gte": yesterday}}),
+                "new_users_24h": user_activity["new_users_24h"],
+                # Served by the created_at index
                 "new_test_cases_24h": self.collection.count_documents({"created_at": {"$gte": yesterday}}),
-                "active_users_24h": self.users_collection.count_documents({"last_login": {"$gte": yesterday}})
+                "active_users_24h": user_activity["active_users_24h"]
             }
             
             # Overall system health
@@ -979,18 +1142,23 @@ class MongoHandler:
             
             from datetime import datetime, timedelta
             
-            # Get user statistics
-            total_users = self.users_collection.count_documents({})
-            admin_users = self.users_collection.count_documents({"role": "admin"})
-            regular_users = self.users_collection.count_documents({"role": "user"})
-            active_users = self.users_collection.count_documents({"is_active": True})
-            
-            # Get user activity over time (last 30 days)
+            # Get user statistics, including activity over time (last 30 days), in one round-trip
             thirty_days_ago = datetime.now() - timedelta(days=30)
-            users_created_30d = self.users_collection.count_documents({"created_at": {"$gte": thirty_days_ago}})
+            user_counts = self._facet_counts(self.users_collection, {
+                "total_users": {},
+                "admin_users": {"role": "admin"},
+                "regular_users": {"role": "user"},
+                "active_users": {"is_active": True},
+                "users_created_30d": {"created_at": {"$gte": thirty_days_ago}}
+            })
             
             # Get test case statistics by user
             pipeline = [
+                # Anonymous test cases never join to a user, so drop them before grouping
+                # (lets the user_id index serve the first stage)
+                {
+                    "$match": {"user_id": {"$ne": None}}
+                },
                 {
                     "$group": {
                         "_id": "$user_id",
@@ -999,10 +1167,14 @@ class MongoHandler:
                     }
                 },
                 {
+                    # Join only the fields projected below instead of whole user documents
                     "$lookup": {
                         "from": "users",
-                        "localField": "_id",
-                        "foreignField": "_id",
+                        "let": {"user_id": "$_id"},
+                        "pipeline": [
+                            {"$match": {"$expr": {"$eq": ["$_id", "$$user_id"]}}},
+                            {"$project": {"_id": 0, "name": 1, "email": 1}}
+                        ],
                         "as": "user_info"
                     }
                 },
@@ -1020,10 +1192,14 @@ class MongoHandler:
                 },
                 {
                     "$sort": {"test_case_count": -1}
+                },
+                # Only the top 10 most active users are returned
+                {
+                    "$limit": 10
                 }
             ]
             
-            user_activity = list(self.collection.aggregate(pipeline))
+            user_activity = list(self.collection.aggregate(pipeline, batchSize=500))
             
             # Convert ObjectId to string for JSON serialization
             for activity in user_activity:
@@ -1031,7 +1207,7 @@ class MongoHandler:
                     activity["_id"] = str(activity["_id"])
                 if "user_id" in activity:
                     activity["user_id"] = str(activity["user_id"])
-                if "last_activity" in activity:
+                if isinstance(activity.get("last_activity"), datetime):
                     activity["last_activity"] = activity["last_activity"].isoformat()
             
             # Get source type distribution
@@ -1049,14 +1225,8 @@ class MongoHandler:
             return {
                 "success": True,
                 "analytics": {
-                    "user_statistics": {
-                        "total_users": total_users,
-                        "admin_users": admin_users,
-                        "regular_users": regular_users,
-                        "active_users": active_users,
-                        "users_created_30d": users_created_30d
-                    },
-                    "user_activity": user_activity[:10],  # Top 10 most active users
+                    "user_statistics": user_counts,
+                    "user_activity": user_activity,  # Top 10 most active users
                     "source_distribution": source_distribution,
                     "generated_at": datetime.now().isoformat()
                 }
@@ -1116,62 +1286,56 @@ class MongoHandler:
             return {"success": False, "message": "Failed to create user"}
 
     def export_system_data(self, admin_user_id):
-        """Export system data (admin only)"""
+        """Export system data (admin only) as an iterator of JSON text chunks"""
         try:
             # Verify admin status
             if not self.is_admin(admin_user_id):
                 return {"success": False, "message": "Access denied. Admin privileges required."}
             
-            from datetime import datetime
-            
-            # Export users (without passwords)
-            users = list(self.users_collection.find({}, {"password": 0}))
-            for user in users:
-                if "_id" in user:
-                    user["_id"] = str(user["_id"])
-                if "created_at" in user:
-                    user["created_at"] = user["created_at"].isoformat()
-                if "last_login" in user:
-                    user["last_login"] = user["last_login"].isoformat() if user["last_login"] else None
-            
-            # Export test cases
-            test_cases = list(self.collection.find({}))
-            for test_case in test_cases:
-                if "_id" in test_case:
-                    test_case["_id"] = str(test_case["_id"])
-                if "created_at" in test_case:
-                    test_case["created_at"] = test_case["created_at"].isoformat()
-            
-            # Export analytics
-            analytics = list(self.analytics_collection.find({}))
-            for analytic in analytics:
-                if "_id" in analytic:
-                    analytic["_id"] = str(analytic["_id"])
-                if "timestamp" in analytic:
-                    analytic["timestamp"] = analytic["timestamp"].isoformat()
-            
-            export_data = {
-                "export_info": {
-                    "exported_at": datetime.now().isoformat(),
-                    "exported_by": admin_user_id,
-                    "version": "1.0"
-                },
-                "users": users,
-                "test_cases": test_cases,
-                "analytics": analytics,
-                "statistics": {
-                    "total_users": len(users),
-                    "total_test_cases": len(test_cases),
-                    "total_analytics": len(analytics)
-                }
-            }
-            
-            return {"success": True, "data": export_data}
+            return {"success": True, "chunks": self._iter_system_export(admin_user_id)}
             
         except Exception as e:
             logger.error(f"Error exporting system data: {str(e)}")
             return {"success": False, "message": "Failed to export system data"}
 
+    def _iter_system_export(self, admin_user_id):
+        """Yield the export document piece by piece, one serialized record at a time"""
+        export_info = {
+            "exported_at": datetime.now().isoformat(),
+            "exported_by": admin_user_id,
+            "version": "1.0"
+        }
+        yield '{"export_info": ' + json_util.dumps(export_info)
+        
+        # (section, cursor factory, datetime fields rendered as ISO strings)
+        sections = (
+            # Users without passwords
+            ("users", lambda: self.users_collection.find({}, {"password": 0}, batch_size=500), ("created_at", "last_login")),
+            ("test_cases", lambda: self.collection.find({}, batch_size=500), ("created_at",)),
+            ("analytics", lambda: self.analytics_collection.find({}, batch_size=500), ("timestamp",)),
+        )
+        statistics = {}
+        try:
+            for name, find, date_fields in sections:
+                yield f', "{name}": ['
+                count = 0
+                for document in find():
+                    if "_id" in document:
+                        document["_id"] = str(document["_id"])
+                    for field in date_fields:
+                        if isinstance(document.get(field), datetime):
+                            document[field] = document[field].isoformat()
+                    yield (', ' if count else '') + json_util.dumps(document)
+                    count += 1
+                yield ']'
+                statistics[f"total_{name}"] = count
+        except Exception as e:
+            # Headers are already sent; all we can do is log and end the stream
+            logger.error(f"Error streaming system export: {str(e)}")
+            raise
+        
+        yield ', "statistics": ' + json_util.dumps(statistics) + '}'
+
     def get_system_logs(self, admin_user_id):
         """Get system logs (admin only)"""
         try:
@@ -5102,9 +5266,7 @@ class MongoHandler:
                 "exp": datetime.utcnow() + timedelta(days=30),  # 30 days expiry
                 "iat": datetime.utcnow()
             }
-            # Use a secret key from environment or generate one
-            secret_key = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
-            token = jwt.encode(payload, secret_key, algorithm="HS256")
+            token = jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
             return token
         except Exception as e:
             logger.error(f"Error generating JWT token: {str(e)}")
@@ -5113,8 +5275,7 @@ class MongoHandler:
     def verify_jwt_token(self, token):
         """Verify JWT token and return user info"""
         try:
-            secret_key = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
-            payload = jwt.decode(token, secret_key, algorithms=["HS256"])
+            payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
             user_id = payload.get("user_id")
             
             if user_id:
@@ -5153,6 +5314,51 @@ class MongoHandler:
             logger.error(f"Error getting user test cases: {str(e)}")
             return []
 
+    def get_user_dashboard(self, user_id, month_start, limit=50):
+        """Recent test cases plus total/this-month/latest stats for a user.
+
+        Every query is served by the user_id+created_at index: the recent list
+        reads only limit documents and the counts are answered from the index.
+        """
+        try:
+            recent = list(self.collection.find(
+                {"user_id": user_id},
+                {"_id": 1, "test_data": 1, "created_at": 1, "source_type": 1, "item_id": 1}
+            ).sort("created_at", -1).limit(limit))
+            return {
+                "test_cases": recent,
+                "total": self.collection.count_documents({"user_id": user_id}),
+                "this_month": self.collection.count_documents({"user_id": user_id, "created_at": {"$gte": month_start}}),
+                # recent is sorted newest first, so its head is the latest test case
+                "latest_created_at": recent[0].get("created_at") if recent else None
+            }
+        except Exception as e:
+            logger.error("Error getting user dashboard: %s", e)
+            return {"test_cases": [], "total": 0, "this_month": 0, "latest_created_at": None}
+
+    def get_cached_generation(self, cache_key):
+        """Return the cached generated test case text for cache_key, or None on a miss"""
+        try:
+            document = self.generation_cache_collection.find_one({"_id": cache_key}, {"content": 1, "expires_at": 1})
+            # The TTL monitor only runs once a minute, so check the deadline here as well
+            if document and document["expires_at"] > datetime.utcnow():
+                return document["content"]
+        except Exception as e:
+            logger.error("Error reading cached generation: %s", e)
+        return None
+
+    def set_cached_generation(self, cache_key, content, ttl_seconds=86400):
+        """Store generated test case text under cache_key for ttl_seconds"""
+        try:
+            now = datetime.utcnow()
+            self.generation_cache_collection.replace_one(
+                {"_id": cache_key},
+                {"content": content, "created_at": now, "expires_at": now + timedelta(seconds=ttl_seconds)},
+                upsert=True
+            )
+        except Exception as e:
+            logger.error("Error caching generation: %s", e)
+
     def save_test_case(self, test_data, item_id=None, source_type=None, user_id=None):
         """Save test case data and generate unique URL with optional user association"""
         try:
@@ -5192,7 +5398,7 @@ class MongoHandler:
             return False
 
     def track_user_session(self, session_data):
-        """Track user session and page visits"""
+        """Track user session and page visits; raises EventQueueFull when the writer is backed up"""
         try:
             session_doc = {
                 "session_id": session_data.get("session_id"),
@@ -5204,15 +5410,19 @@ class MongoHandler:
                 "country": session_data.get("country"),
                 "city": session_data.get("city")
             }
-            self.user_sessions_collection.insert_one(session_doc)
-            logger.info(f"Tracked user session: {session_data.get('session_id')}")
+            # Written in batches off the request thread
+            get_event_writer(self.user_sessions_collection).put(session_doc)
+            logger.info("Tracked user session: %s", session_data.get('session_id'))
             return True
+        except queue.Full:
+            logger.warning("User session queue is full, dropping session")
+            raise EventQueueFull("User session queue is full")
         except Exception as e:
-            logger.error(f"Error tracking user session: {str(e)}")
+            logger.error("Error tracking user session: %s", e)
             return False
 
     def track_event(self, event_data):
-        """Track user events and interactions"""
+        """Track user events and interactions; raises EventQueueFull when the writer is backed up"""
         try:
             event_doc = {
                 "event_type": event_data.get("event_type"),
@@ -5232,11 +5442,15 @@ class MongoHandler:
             if event_data.get("user_role"):
                 event_doc["user_role"] = event_data.get("user_role")
             
-            self.analytics_collection.insert_one(event_doc)
-            logger.info(f"Tracked event: {event_data.get('event_type')}")
+            # Written in batches off the request thread
+            get_event_writer(self.analytics_collection).put(event_doc)
+            logger.info("Tracked event: %s", event_data.get('event_type'))
             return True
+        except queue.Full:
+            logger.warning("Analytics event queue is full, dropping event")
+            raise EventQueueFull("Analytics event queue is full")
         except Exception as e:
-            logger.error(f"Error tracking event: {str(e)}")
+            logger.error("Error tracking event: %s", e)
             return False
 
     def get_analytics_summary(self, start_date=None, end_date=None, days=30, source_type=None, user_id=None):
@@ -5761,14 +5975,10 @@ class MongoHandler:
     def get_test_case(self, url_key):
         """Retrieve test case data by URL key"""
         try:
-            result = self.collection.find_one({"url_key": url_key})
+            # Match by url_key or by _id (fallback for short tokens) in one round trip
+            result = self.collection.find_one({"$or": [{"url_key": url_key}, {"_id": url_key}]})
             if not result:
-                # Try to find by _id as fallback
-                result = self.collection.find_one({"_id": url_key})
-                if result:
-                    logger.info(f"Found document by _id: {url_key}")
-                else:
-                    logger.warning(f"No test case found for URL key or _id: {url_key}")
+                logger.warning(f"No test case found for URL key or _id: {url_key}")
             return result
         except Exception as e:
             logger.error(f"Error retrieving test case: {str(e)}")
@@ -5786,15 +5996,11 @@ class MongoHandler:
             # logger.info(f"DIRECT DB QUERY FOR STATUS VALUES: url_key={url_key}, force_refresh={force_refresh}")
             
             # Always get a fresh copy from the database when force_refresh is True
-            result = self.collection.find_one({"url_key": url_key})
+            # Match by url_key or by _id (fallback for short tokens) in one round trip
+            result = self.collection.find_one({"$or": [{"url_key": url_key}, {"_id": url_key}]})
             if not result:
-                # Try to find by _id as fallback
-                result = self.collection.find_one({"_id": url_key})
-                if result:
-                    logger.info(f"Found document by _id: {url_key}")
-                else:
-                    logger.warning(f"No test case found for URL key or _id: {url_key}")
-                    return None
+                logger.warning(f"No test case found for URL key or _id: {url_key}")
+                return None
                 
             # Debug: Log all data in the document for diagnosis
             if 'status' in result:
@@ -5963,6 +6169,20 @@ class MongoHandler:
             logger.error(f"Error retrieving test case status values: {str(e)}")
             return None
 
+    @staticmethod
+    def url_params_hash(files, item_ids):
+        """Stable digest of the (files, item_ids) pair a short URL points at"""
+        payload = json.dumps([files, item_ids], separators=(',', ':'), default=str)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def find_shortened_url(self, files, item_ids):
+        """Return the short key already issued for these files/item_ids, if any"""
+        document = self.collection.find_one(
+            {"type": "shortened_url", "dedup_hash": self.url_params_hash(files, item_ids)},
+            projection={"_id": 1}
+        )
+        return document["_id"] if document else None
+
     def save_url_data(self, url_params):
         """Save URL parameters and generate a short key"""
         try:
@@ -5970,6 +6190,7 @@ class MongoHandler:
             document = {
                 "_id": short_key,
                 "url_params": url_params,
+                "dedup_hash": self.url_params_hash(url_params.get('files'), url_params.get('item_ids')),
                 "created_at": datetime.utcnow(),
                 "type": "shortened_url"
             }